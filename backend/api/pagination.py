@@ -0,0 +1,156 @@
+import base64
+import datetime
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder truncates datetimes to milliseconds, which would make a cursor match rows again.
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def estimate_count(queryset) -> int:
+    """Returns the number of rows the query planner expects, falling back to an exact count.
+
+    Only PostgreSQL exposes its estimate, which is read from `EXPLAIN` without running the query.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPagination(LimitOffsetPagination):
+    """Limit/offset pagination which switches to keyset pagination when the `cursor` parameter is given.
+
+    A keyset page filters on the ordering key of the previous page's last row instead of skipping
+    rows with OFFSET, so deep pages cost the same as the first one. The ordering is completed with
+    the primary key to make the key unique. Pass an empty `cursor` to get the first page.
+
+    Counting all rows is what keeps deep pages slow, so keyset pages only include `count` on request:
+    `count=exact` counts the rows and `count=estimate` asks the query planner.
+    """
+
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_keyset = self.cursor_query_param in request.query_params
+        if not self.use_keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.queryset = queryset
+        self.limit = self.get_limit(request)
+        self.display_page_controls = False
+        ordering = self.get_ordering(queryset)
+        position, reverse = self.decode_cursor(request, len(ordering))
+        if reverse:
+            ordering = [name[1:] if name.startswith("-") else f"-{name}" for name in ordering]
+
+        keys = [f"keyset_{i}" for i in range(len(ordering))]
+        queryset = queryset.annotate(**{key: F(name.lstrip("-")) for key, name in zip(keys, ordering)})
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.build_filter(keys, ordering, position))
+            except (TypeError, ValueError, ValidationError):
+                # The values of the cursor don't fit the type of their keys.
+                raise NotFound("Invalid cursor.")
+        queryset = queryset.order_by(*(f"-{key}" if name.startswith("-") else key for key, name in zip(keys, ordering)))
+        rows = list(queryset[: self.limit + 1])
+        has_more = len(rows) > self.limit
+        rows = rows[: self.limit]
+        if reverse:
+            rows.reverse()
+
+        self.next_position = self.previous_position = None
+        if rows and (has_more if not reverse else position is not None):
+            self.next_position = [getattr(rows[-1], key) for key in keys]
+        if rows and (has_more if reverse else position is not None):
+            self.previous_position = [getattr(rows[0], key) for key in keys]
+        return rows
+
+    def get_ordering(self, queryset):
+        ordering = [name for name in queryset.query.order_by or queryset.model._meta.ordering]
+        if any(not isinstance(name, str) or name == "?" for name in ordering):
+            raise NotFound("Keyset pagination needs a deterministic ordering.")
+        if not {"pk", "-pk", "id", "-id"} & set(ordering):
+            ordering.append("pk")
+        return ordering
+
+    def decode_cursor(self, request, size):
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position, reverse = cursor["p"], bool(cursor["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound("Invalid cursor.")
+        if not isinstance(position, list) or len(position) != size:
+            raise NotFound("Invalid cursor.")
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        cursor = json.dumps({"p": position, "r": reverse}, cls=CursorEncoder)
+        encoded = base64.urlsafe_b64encode(cursor.encode("ascii")).decode("ascii")
+        url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    @staticmethod
+    def build_filter(keys, ordering, position) -> Q:
+        """Builds `(k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...`, flipping the comparison for descending keys."""
+        condition = Q()
+        for i, (key, name) in enumerate(zip(keys, ordering)):
+            lookup = "lt" if name.startswith("-") else "gt"
+            term = Q(**{f"{key}__{lookup}": position[i]})
+            for previous_key, value in zip(keys[:i], position[:i]):
+                term &= Q(**{previous_key: value})
+            condition |= term
+        return condition
+
+    def get_next_link(self):
+        if not self.use_keyset:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position, False)
+
+    def get_previous_link(self):
+        if not self.use_keyset:
+            return super().get_previous_link()
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, True)
+
+    def get_paginated_response(self, data):
+        if not self.use_keyset:
+            return super().get_paginated_response(data)
+        response = OrderedDict()
+        count = self.request.query_params.get(self.count_query_param)
+        if count == "exact":
+            response["count"] = self.queryset.count()
+        elif count == "estimate":
+            response["count"] = estimate_count(self.queryset)
+        response["next"] = self.get_next_link()
+        response["previous"] = self.get_previous_link()
+        response["results"] = data
+        return Response(response)
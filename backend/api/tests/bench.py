@@ -0,0 +1,40 @@
+"""Helpers for the benchmarks of the apps.
+
+Benchmarks live next to the tests, in `bench_*.py` modules, so the default `test*.py` pattern doesn't
+collect them. Run one explicitly by its label, for example:
+
+    python manage.py test data_import.tests.bench_import
+
+The sizes are read from environment variables, such as `BENCH_ROWS`, so they can be changed per run.
+"""
+import os
+import resource
+import time
+import tracemalloc
+
+
+def bench_size(name, default):
+    return int(os.environ.get(name, default))
+
+
+BENCH_ROWS = bench_size("BENCH_ROWS", 50000)
+
+
+def measure(func):
+    # Tracing allocations slows Python down considerably, so time and memory are measured in separate runs.
+    start = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def report(name, rows, elapsed, peak):
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"\n{name:>10}: {rows} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/sec), "
+        f"peak traced memory {peak / 2**20:.1f} MiB, process max RSS {max_rss / 2**10:.1f} MiB"
+    )
@@ -1,5 +1,6 @@
 from typing import Any, Dict
 
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -8,6 +9,11 @@ class CRUDMixin(APITestCase):
     url = ""
     data: Dict[str, Any] = {}
 
+    def _pre_setup(self):
+        super()._pre_setup()
+        # Each test rolls back its rows, so the next one reuses their ids and would read their cached roles.
+        cache.clear()
+
     def assert_fetch(self, user=None, expected=status.HTTP_403_FORBIDDEN):
         if user:
             self.client.force_login(user)
@@ -1,4 +1,4 @@
-from celery.result import AsyncResult
+from celery.result import AsyncResult, GroupResult
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -11,11 +11,16 @@ class TaskStatus(APIView):
         task = AsyncResult(kwargs["task_id"])
         ready = task.ready()
         error = ready and not task.successful()
-
-        return Response(
-            {
-                "ready": ready,
-                "result": task.result if ready and not error else None,
-                "error": {"text": str(task.result)} if error else None,
-            }
-        )
+        response = {
+            "ready": ready,
+            "result": task.result if ready and not error else None,
+            "error": {"text": str(task.result)} if error else None,
+        }
+        # A task split into subtasks saves them as a group under its own id.
+        subtasks = None if ready else GroupResult.restore(kwargs["task_id"])
+        if subtasks is not None:
+            response["progress"] = {"completed": subtasks.completed_count(), "total": len(subtasks)}
+        # A long task can report its own progress through its state.
+        elif task.state == "PROGRESS":
+            response["progress"] = {"completed": task.info["completed"], "total": task.info["total"]}
+        return Response(response)
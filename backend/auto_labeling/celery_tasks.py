@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.http import HttpRequest
+from django.shortcuts import get_object_or_404
+
+from .models import AutoLabelingConfig
+from .pipeline.execution import execute_pipeline
+from examples.filters import ExampleFilter
+from projects.models import Project
+
+logger = get_task_logger(__name__)
+
+PROGRESS = "PROGRESS"
+MAX_REPORTED_ERRORS = 10
+
+
+def predict(data: str, config: AutoLabelingConfig):
+    """Runs the pipeline in a thread of the job's pool.
+
+    The labeling cache may open database or cache connections in the thread. Django only closes
+    connections at the end of a request, so they are closed here instead of leaking with the thread.
+    """
+    try:
+        return execute_pipeline(data, config=config)
+    except Exception as e:  # a failing example shouldn't stop the rest of the job
+        return e
+    finally:
+        connections.close_all()
+        caches.close_all()
+
+
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True, max_retries=3)
+def auto_label_examples(self, project_id, user_id, filters: Dict[str, str], last_id=0, completed=0, errors=None):
+    """Labels the examples selected by the filters with every auto-labeling config of the project.
+
+    The filters are the query parameters of the example list. The examples are read in chunks by
+    their primary key, after the last one labeled: the requests of a chunk are sent by a thread pool of
+    `AUTO_LABELING_WORKERS` workers, and the labels of the chunk are saved in one transaction before
+    the next chunk starts. After each chunk, the last labeled example and the number of completed
+    examples are saved as the task's progress, which `TaskStatus` reports. It is also the checkpoint:
+    if the worker is lost, the redelivered task starts from it, and a retry after an error is given it
+    explicitly.
+    """
+    project = get_object_or_404(Project, pk=project_id)
+    user = get_object_or_404(get_user_model(), pk=user_id)
+    configs = list(AutoLabelingConfig.objects.filter(project=project))
+    errors = errors or []
+    checkpoint = None if self.request.called_directly else self.AsyncResult(self.request.id)
+    if checkpoint is not None and checkpoint.state == PROGRESS and checkpoint.info["last_id"] > last_id:
+        last_id, completed = checkpoint.info["last_id"], checkpoint.info["completed"]
+        errors = checkpoint.info["error"] or errors
+
+    # The filters of a user, such as `confirmed`, read the user from the request.
+    request = HttpRequest()
+    request.user = user
+    examples = ExampleFilter(filters, queryset=project.examples.all(), request=request, project=project).qs
+    examples = examples.order_by("pk").distinct()
+    total = completed + examples.filter(pk__gt=last_id).count()
+    chunk_size = settings.AUTO_LABELING_WORKERS * 4
+    try:
+        with ThreadPoolExecutor(max_workers=settings.AUTO_LABELING_WORKERS) as executor:
+            while chunk := list(examples.filter(pk__gt=last_id)[:chunk_size]):
+                for example in chunk:
+                    example.project = project  # keeps the project's subclass, which tells how to read the data
+                tasks = [(example, config) for example in chunk for config in configs]
+                results = executor.map(lambda task: predict(task[0].data, task[1]), tasks)
+                # A retry starts from the last saved chunk, so a chunk is saved entirely or not at all.
+                with transaction.atomic():
+                    for (example, config), labels in zip(tasks, results):
+                        if isinstance(labels, Exception):
+                            logger.warning(
+                                "Failed to label example %s with config %s: %s", example.id, config.id, labels
+                            )
+                            if len(errors) < MAX_REPORTED_ERRORS:
+                                errors.append({"example": example.id, "config": config.id, "detail": str(labels)})
+                            continue
+                        labels.save(project, example, user)
+                last_id = chunk[-1].pk
+                completed += len(chunk)
+                if not self.request.called_directly:
+                    meta = {"last_id": last_id, "completed": completed, "total": total, "error": errors}
+                    self.update_state(state=PROGRESS, meta=meta)
+    except Exception as e:
+        kwargs = {**self.request.kwargs, "last_id": last_id, "completed": completed, "errors": errors}
+        raise self.retry(exc=e, kwargs=kwargs)
+    return {"total": total, "error": errors}
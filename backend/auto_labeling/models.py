@@ -20,6 +20,11 @@ class AutoLabelingConfig(models.Model):
     def __str__(self):
         return self.model_name
 
+    @property
+    def version(self) -> str:
+        """Changes whenever the config is saved."""
+        return self.updated_at.isoformat()
+
     def clean_fields(self, exclude=None):
         super().clean_fields(exclude=exclude)
         try:
@@ -0,0 +1,158 @@
+import abc
+import hashlib
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from auto_labeling.models import AutoLabelingConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats:
+    """Counts the hits and misses of the response caches in this process."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(abc.ABC):
+    """Keeps the labels a config predicted for a text, so that the model isn't asked twice.
+
+    The entries are addressed by the config's id and version and the hash of the text.
+    Saving the config starts a new version, so a changed model, template or mapping is never
+    answered from the cache. A model which changes behind the same URL isn't noticed, though:
+    disable the cache or clear it for such models.
+    """
+
+    stats = CacheStats()
+
+    @staticmethod
+    def key(config: AutoLabelingConfig, data: str) -> str:
+        digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        return f"auto-labeling:{config.id}:{config.version}:{digest}"
+
+    def get(self, config: AutoLabelingConfig, data: str) -> Optional[List]:
+        labels = self.load(self.key(config, data))
+        self.stats.count(hit=labels is not None)
+        return labels
+
+    def set(self, config: AutoLabelingConfig, data: str, labels: List):
+        self.store(self.key(config, data), labels)
+
+    @abc.abstractmethod
+    def load(self, key: str) -> Optional[List]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def store(self, key: str, labels: List):
+        raise NotImplementedError()
+
+
+class DjangoResponseCache(ResponseCache):
+    """Stores the responses in Django's cache, which evicts them after the timeout."""
+
+    def __init__(self, timeout: int):
+        self.timeout = timeout
+
+    def load(self, key: str) -> Optional[List]:
+        return cache.get(key)
+
+    def store(self, key: str, labels: List):
+        cache.set(key, labels, timeout=self.timeout)
+
+
+class DiskResponseCache(ResponseCache):
+    """Stores the responses as files in a directory, evicting the least recently used ones.
+
+    Reading an entry updates its modification time. When there are more than `max_entries`
+    files, the oldest are removed until a tenth of the room is free again.
+    """
+
+    def __init__(self, directory: str, max_entries: int):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+        self.size = len(os.listdir(directory))
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def load(self, key: str) -> Optional[List]:
+        path = self.path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                labels = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):  # missing, evicted in between or half-written
+            return None
+        return labels
+
+    def store(self, key: str, labels: List):
+        path = self.path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(labels, f)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.size += 1
+            if self.size > self.max_entries:
+                self.evict()
+
+    def evict(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+        entries.sort()
+        excess = len(entries) - self.max_entries * 9 // 10
+        for _, path in entries[: max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.size = len(entries) - max(excess, 0)
+        logger.debug("Evicted %d auto-labeling responses from %s", max(excess, 0), self.directory)
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Returns the cache selected by the `LABELING_CACHE` setting, or None if it's disabled."""
+    return create_response_cache(
+        settings.LABELING_CACHE,
+        settings.LABELING_CACHE_DIR,
+        settings.LABELING_CACHE_SIZE,
+        settings.LABELING_CACHE_TIMEOUT,
+    )
+
+
+@lru_cache(maxsize=None)
+def create_response_cache(backend: str, directory: str, max_entries: int, timeout: int) -> Optional[ResponseCache]:
+    if backend == "django":
+        return DjangoResponseCache(timeout)
+    if backend == "disk":
+        return DiskResponseCache(directory, max_entries)
+    return None
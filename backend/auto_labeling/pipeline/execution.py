@@ -1,4 +1,6 @@
-from typing import Type
+import json
+from functools import lru_cache
+from typing import Dict, Tuple, Type
 
 from auto_labeling_pipeline.labels import (
     ClassificationLabels,
@@ -7,10 +9,12 @@ from auto_labeling_pipeline.labels import (
     SequenceLabels,
 )
 from auto_labeling_pipeline.mappings import MappingTemplate
-from auto_labeling_pipeline.models import RequestModelFactory
+from auto_labeling_pipeline.models import RequestModel, RequestModelFactory
 from auto_labeling_pipeline.pipeline import pipeline
 from auto_labeling_pipeline.postprocessing import PostProcessor
+from jinja2 import Template
 
+from .cache import get_response_cache
 from .labels import create_labels
 from auto_labeling.models import AutoLabelingConfig
 
@@ -19,11 +23,40 @@ def get_label_collection(task_type: str) -> Type[Labels]:
     return {"Category": ClassificationLabels, "Span": SequenceLabels, "Text": Seq2seqLabels}[task_type]
 
 
-def execute_pipeline(data: str, config: AutoLabelingConfig):
+class CompiledMappingTemplate(MappingTemplate):
+    """A mapping template which compiles its Jinja template once instead of on every render."""
+
+    def __init__(self, label_collection: Type[Labels] = Labels, template: str = ""):
+        super().__init__(label_collection=label_collection, template=template)
+        self.compiled = Template(self.template)
+
+    def render(self, response: Dict) -> Labels:
+        labels = json.loads(self.compiled.render(input=response))
+        return self.label_collection(labels)
+
+
+@lru_cache(maxsize=64)
+def compile_pipeline(config: AutoLabelingConfig, version: str) -> Tuple[RequestModel, MappingTemplate, PostProcessor]:
+    """Builds the model, template and post-processor of a config version.
+
+    The results are kept per config and version, as configs compare by primary key.
+    """
     label_collection = get_label_collection(config.task_type)
     model = RequestModelFactory.create(model_name=config.model_name, attributes=config.model_attrs)
-    template = MappingTemplate(label_collection=label_collection, template=config.template)
+    template = CompiledMappingTemplate(label_collection=label_collection, template=config.template)
     post_processor = PostProcessor(config.label_mapping)
-    labels = pipeline(text=data, request_model=model, mapping_template=template, post_processing=post_processor)
+    return model, template, post_processor
+
+
+def execute_pipeline(data: str, config: AutoLabelingConfig):
+    response_cache = get_response_cache()
+    cached = response_cache.get(config, data) if response_cache else None
+    if cached is None:
+        model, template, post_processor = compile_pipeline(config, config.version)
+        labels = pipeline(text=data, request_model=model, mapping_template=template, post_processing=post_processor)
+        if response_cache:
+            response_cache.set(config, data, labels.dict())
+    else:
+        labels = get_label_collection(config.task_type)(cached)
     labels = create_labels(config.task_type, labels)
     return labels
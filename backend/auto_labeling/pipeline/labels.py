@@ -7,6 +7,7 @@ from django.contrib.auth.models import User
 from examples.models import Example
 from label_types.models import CategoryType, LabelType, SpanType
 from labels.models import Category, Label, Span, TextLabel
+from metrics.statistics import invalidate_label_distribution
 from projects.models import Project
 
 
@@ -33,6 +34,7 @@ class LabelCollection(abc.ABC):
         labels = self.transform(project, example, user)
         labels = self.model.objects.filter_annotatable_labels(labels, project)
         self.model.objects.bulk_create(labels)
+        invalidate_label_distribution(project.id)
 
 
 class Categories(LabelCollection):
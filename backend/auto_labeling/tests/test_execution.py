@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from auto_labeling_pipeline.labels import ClassificationLabels
+from auto_labeling_pipeline.mappings import MappingTemplate
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from model_mommy import mommy
+
+from auto_labeling.pipeline.cache import DiskResponseCache, ResponseCache
+from auto_labeling.pipeline.execution import (
+    CompiledMappingTemplate,
+    compile_pipeline,
+    execute_pipeline,
+)
+
+
+@patch("auto_labeling.pipeline.execution.RequestModelFactory.create")
+@patch("auto_labeling.pipeline.execution.pipeline", return_value=ClassificationLabels([{"label": "POS"}]))
+class TestExecutePipeline(TestCase):
+    def setUp(self):
+        cache.clear()
+        compile_pipeline.cache_clear()
+        self.config = mommy.make("AutoLabelingConfig", task_type="Category")
+
+    @override_settings(LABELING_CACHE="django")
+    def test_reuses_response_for_same_text(self, pipeline, create):
+        hits = ResponseCache.stats.hits
+        for _ in range(2):
+            labels = execute_pipeline("example", self.config)
+            self.assertEqual(labels.labels, [{"label": "POS"}])
+        self.assertEqual(pipeline.call_count, 1)
+        self.assertEqual(ResponseCache.stats.hits, hits + 1)
+
+    @override_settings(LABELING_CACHE="django")
+    def test_requests_again_for_other_text(self, pipeline, create):
+        execute_pipeline("example", self.config)
+        execute_pipeline("another example", self.config)
+        self.assertEqual(pipeline.call_count, 2)
+
+    @override_settings(LABELING_CACHE="django")
+    def test_requests_again_after_config_is_changed(self, pipeline, create):
+        execute_pipeline("example", self.config)
+        self.config.template = "changed"
+        self.config.save()
+        execute_pipeline("example", self.config)
+        self.assertEqual(pipeline.call_count, 2)
+        self.assertEqual(create.call_count, 2)
+
+    @override_settings(LABELING_CACHE="")
+    def test_requests_every_time_if_cache_is_disabled(self, pipeline, create):
+        execute_pipeline("example", self.config)
+        execute_pipeline("example", self.config)
+        self.assertEqual(pipeline.call_count, 2)
+        self.assertEqual(create.call_count, 1)  # the compiled pipeline is still kept
+
+
+class TestDiskResponseCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = DiskResponseCache(self.directory, max_entries=10)
+        self.config = mommy.make("AutoLabelingConfig", task_type="Category")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_stores_labels(self):
+        self.assertIsNone(self.cache.get(self.config, "example"))
+        self.cache.set(self.config, "example", [{"label": "POS"}])
+        self.assertEqual(self.cache.get(self.config, "example"), [{"label": "POS"}])
+
+    def test_evicts_least_recently_used_entries(self):
+        for i in range(10):
+            self.cache.set(self.config, f"example {i}", [{"label": "POS"}])
+            os.utime(self.cache.path(self.cache.key(self.config, f"example {i}")), (i, i))
+        self.cache.get(self.config, "example 0")
+        self.cache.set(self.config, "example 10", [{"label": "POS"}])
+        self.assertLessEqual(len(os.listdir(self.directory)), 9)
+        self.assertIsNotNone(self.cache.get(self.config, "example 0"))
+        self.assertIsNone(self.cache.get(self.config, "example 1"))
+
+
+class TestCompiledMappingTemplate(TestCase):
+    def test_renders_same_labels_as_mapping_template(self):
+        template = '[{% for item in input %}{"label": "{{ item.name }}"}{% if not loop.last %},{% endif %}{% endfor %}]'
+        response = [{"name": "POS"}, {"name": "NEG"}]
+        compiled = CompiledMappingTemplate(label_collection=ClassificationLabels, template=template)
+        expected = MappingTemplate(label_collection=ClassificationLabels, template=template).render(response)
+        self.assertEqual(compiled.render(response).dict(), expected.dict())
@@ -0,0 +1,138 @@
+import threading
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from model_mommy import mommy
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from api.tests.utils import CRUDMixin
+from auto_labeling.celery_tasks import auto_label_examples
+from auto_labeling.pipeline.labels import Categories
+from labels.models import Category
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+
+
+def predict_positive(data, config):
+    return Categories([{"label": "POS"}])
+
+
+@override_settings(AUTO_LABELING_WORKERS=2)
+class TestAutoLabelExamples(TestCase):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = [mommy.make("Example", project=self.project.item, text=f"example {i}") for i in range(20)]
+        self.example_ids = [example.id for example in self.examples]
+        self.filters = {}
+        mommy.make("CategoryType", project=self.project.item, text="POS")
+        mommy.make("AutoLabelingConfig", task_type="Category", project=self.project.item)
+
+    def auto_label(self, **kwargs):
+        return auto_label_examples(self.project.item.id, self.project.admin.id, self.filters, **kwargs)
+
+    @patch("auto_labeling.celery_tasks.execute_pipeline", side_effect=predict_positive)
+    def test_labels_all_examples(self, mock):
+        result = self.auto_label()
+        self.assertEqual(result, {"total": len(self.examples), "error": []})
+        self.assertEqual(Category.objects.filter(example__in=self.examples).count(), len(self.examples))
+
+    @patch("auto_labeling.celery_tasks.execute_pipeline")
+    def test_reports_failing_examples(self, mock):
+        def predict(data, config):
+            if data == self.examples[3].data:
+                raise ValueError("Bad response")
+            return predict_positive(data, config)
+
+        mock.side_effect = predict
+        result = self.auto_label()
+        self.assertEqual(len(result["error"]), 1)
+        self.assertEqual(result["error"][0]["example"], self.examples[3].id)
+        self.assertEqual(Category.objects.count(), len(self.examples) - 1)
+
+    @patch("auto_labeling.celery_tasks.execute_pipeline", side_effect=predict_positive)
+    def test_resumes_from_checkpoint(self, mock):
+        self.auto_label(last_id=self.example_ids[14], completed=15)
+        labeled = Category.objects.values_list("example", flat=True)
+        self.assertCountEqual(labeled, self.example_ids[15:])
+
+    @patch("auto_labeling.celery_tasks.execute_pipeline", side_effect=predict_positive)
+    def test_resumes_from_saved_progress(self, mock):
+        task_id = "auto-labeling-job"
+        progress = {"last_id": self.example_ids[9], "completed": 10, "total": 20, "error": []}
+        auto_label_examples.backend.store_result(task_id, progress, "PROGRESS")
+        args = [self.project.item.id, self.project.admin.id, self.filters]
+        result = auto_label_examples.apply(args=args, task_id=task_id)
+        self.assertEqual(result.get(), {"total": len(self.examples), "error": []})
+        labeled = Category.objects.values_list("example", flat=True)
+        self.assertCountEqual(labeled, self.example_ids[10:])
+
+    @patch("auto_labeling.celery_tasks.execute_pipeline", side_effect=predict_positive)
+    def test_labels_filtered_examples(self, mock):
+        self.filters = {"text": self.examples[3].text}
+        result = self.auto_label()
+        self.assertEqual(result, {"total": 1, "error": []})
+        self.assertCountEqual(Category.objects.values_list("example", flat=True), [self.examples[3].id])
+
+    @patch("auto_labeling.celery_tasks.execute_pipeline", side_effect=predict_positive)
+    def test_closes_connections_of_worker_threads(self, mock):
+        main_thread = threading.get_ident()
+        closed_in = []
+        with patch("auto_labeling.celery_tasks.connections") as connections:
+            connections.close_all.side_effect = lambda: closed_in.append(threading.get_ident())
+            self.auto_label()
+        self.assertEqual(len(closed_in), len(self.examples))
+        self.assertNotIn(main_thread, closed_in)
+
+    @patch("auto_labeling.celery_tasks.execute_pipeline", side_effect=predict_positive)
+    def test_rolls_back_failed_chunk(self, mock):
+        save = Categories.save
+
+        def save_until_failure(labels, project, example, user):
+            if example == self.examples[11]:
+                raise RuntimeError("Lost connection")
+            save(labels, project, example, user)
+
+        with patch.object(Categories, "save", save_until_failure), self.assertRaises(RuntimeError):
+            self.auto_label()
+        # The first chunk of 8 examples is saved, and the second one, which failed, is rolled back.
+        labeled = Category.objects.values_list("example", flat=True)
+        self.assertCountEqual(labeled, self.example_ids[:8])
+        self.auto_label(last_id=self.example_ids[7], completed=8)
+        self.assertEqual(Category.objects.count(), len(self.examples))
+
+
+class TestAutomatedLabelingJob(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = [mommy.make("Example", project=self.project.item, text=f"example {i}") for i in range(3)]
+        self.url = reverse(viewname="auto_labeling_job", args=[self.project.item.id])
+        self.data = {}
+
+    @patch("auto_labeling.views.auto_label_examples")
+    def test_allows_admin_to_start_job(self, mock):
+        mock.delay.return_value.task_id = "task"
+        response = self.assert_create(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"task_id": "task"})
+        self.assertEqual(mock.delay.call_args.kwargs["filters"], {})
+
+    @patch("auto_labeling.views.auto_label_examples")
+    def test_passes_filters_to_job(self, mock):
+        mock.delay.return_value.task_id = "task"
+        self.url += f"?text={self.examples[0].text}"
+        self.assert_create(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(mock.delay.call_args.kwargs["filters"], {"text": self.examples[0].text})
+
+    def test_denies_project_staff_to_start_job(self):
+        for member in self.project.staffs:
+            self.assert_create(member, status.HTTP_403_FORBIDDEN)
+
+
+class TestAutoLabelingProgress(CRUDMixin):
+    def test_reports_progress_of_job(self):
+        task_id = "auto-labeling-progress"
+        auto_label_examples.backend.store_result(task_id, {"completed": 8, "total": 20, "error": []}, "PROGRESS")
+        self.client.force_login(prepare_project().admin)
+        response = self.client.get(reverse(viewname="task_status", args=[task_id]))
+        self.assertFalse(response.data["ready"])
+        self.assertEqual(response.data["progress"], {"completed": 8, "total": 20})
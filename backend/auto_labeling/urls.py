@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     AutomatedLabeling,
+    AutomatedLabelingJob,
     ConfigDetail,
     ConfigList,
     LabelExtractorTesting,
@@ -34,4 +35,5 @@ urlpatterns = [
         route="auto-labeling/label-mapper-testing", view=LabelMapperTesting.as_view(), name="auto_labeling_mapping_test"
     ),
     path(route="auto-labeling", view=AutomatedLabeling.as_view(), name="auto_labeling"),
+    path(route="auto-labeling/jobs", view=AutomatedLabelingJob.as_view(), name="auto_labeling_job"),
 ]
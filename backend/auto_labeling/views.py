@@ -6,7 +6,6 @@ from auto_labeling_pipeline.mappings import MappingTemplate
 from auto_labeling_pipeline.menu import Options
 from auto_labeling_pipeline.models import RequestModelFactory
 from auto_labeling_pipeline.postprocessing import PostProcessor
-from django.shortcuts import get_object_or_404
 from django_drf_filepond.models import TemporaryUpload
 from rest_framework import generics, status
 from rest_framework.exceptions import ValidationError
@@ -15,6 +14,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .celery_tasks import auto_label_examples
 from .exceptions import (
     AWSTokenError,
     ResponseJSONDecodeError,
@@ -25,7 +25,7 @@ from .exceptions import (
 from .models import AutoLabelingConfig
 from .pipeline.execution import execute_pipeline, get_label_collection
 from .serializers import AutoLabelingConfigSerializer
-from projects.models import Project
+from projects.mixins import ProjectMixin
 from projects.permissions import IsProjectAdmin, IsProjectMember
 
 
@@ -66,13 +66,9 @@ class ConfigDetail(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated & IsProjectAdmin]
 
 
-class RestAPIRequestTesting(APIView):
+class RestAPIRequestTesting(ProjectMixin, APIView):
     permission_classes = [IsAuthenticated & IsProjectAdmin]
 
-    @property
-    def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_id"])
-
     def create_model(self):
         model_name = self.request.data["model_name"]
         model_attrs = self.request.data["model_attrs"]
@@ -147,16 +143,28 @@ class LabelMapperTesting(APIView):
         return Response(labels.dict(), status=status.HTTP_200_OK)
 
 
-class AutomatedLabeling(generics.CreateAPIView):
+class AutomatedLabeling(ProjectMixin, generics.CreateAPIView):
     permission_classes = [IsAuthenticated & IsProjectMember]
     swagger_schema = None
 
     def create(self, request, *args, **kwargs):
-        project = get_object_or_404(Project, pk=self.kwargs["project_id"])
-        example = project.examples.get(pk=self.request.query_params["example"])
-        configs = AutoLabelingConfig.objects.filter(project=project)
-        # Todo: make async calls or celery tasks to reduce waiting time.
+        example = self.project.examples.get(pk=self.request.query_params["example"])
+        configs = AutoLabelingConfig.objects.filter(project=self.project)
+        # Many examples are labeled by `AutomatedLabelingJob`, which doesn't keep the request waiting.
         for config in configs:
             labels = execute_pipeline(example.data, config=config)
-            labels.save(project, example, self.request.user)
+            labels.save(self.project, example, self.request.user)
         return Response({"ok": True}, status=status.HTTP_201_CREATED)
+
+
+class AutomatedLabelingJob(ProjectMixin, APIView):
+    """Starts a job labeling the examples selected by the query parameters, the same as the example list's."""
+
+    permission_classes = [IsAuthenticated & IsProjectAdmin]
+    swagger_schema = None
+
+    def post(self, request, *args, **kwargs):
+        # The task selects the examples itself, so that its messages don't grow with their number.
+        filters = request.query_params.dict()
+        task = auto_label_examples.delay(project_id=self.project.id, user_id=request.user.id, filters=filters)
+        return Response({"task_id": task.task_id})
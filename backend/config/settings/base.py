@@ -240,6 +240,42 @@ if DEBUG:
 # Batch size for importing data
 IMPORT_BATCH_SIZE = env.int("IMPORT_BATCH_SIZE", 1000)
 
+# Batch size for exporting data
+EXPORT_BATCH_SIZE = env.int("EXPORT_BATCH_SIZE", 1000)
+
+# Cache for dashboard statistics and project roles.
+# The default LocMemCache is per process: each web worker has its own copy, and the invalidations made by
+# one process, or by the Celery workers, don't reach the others. The label distributions are invalidated
+# through a version kept in the database, and the roles are only cached across requests in a shared cache.
+# Set CACHE_BACKEND and CACHE_LOCATION to a shared cache, e.g. Redis, when running several processes.
+CACHES = {
+    "default": {
+        "BACKEND": env("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": env("CACHE_LOCATION", ""),
+    }
+}
+SHARED_CACHE = CACHES["default"]["BACKEND"] not in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# Seconds to keep the label distribution cached. Changes of labels invalidate it before then.
+STATS_CACHE_TIMEOUT = env.int("STATS_CACHE_TIMEOUT", 600)
+
+# Seconds to keep the roles of project members cached. Changes of members or roles invalidate them before then.
+# The roles are only cached across requests in a shared cache: a process with its own cache would keep the role
+# of a removed or demoted member after another process changed it. Otherwise, each request reads them once.
+ROLE_CACHE_TIMEOUT = env.int("ROLE_CACHE_TIMEOUT", 60) if SHARED_CACHE else 0
+
+# Number of requests an auto-labeling job sends to the model at the same time
+AUTO_LABELING_WORKERS = env.int("AUTO_LABELING_WORKERS", 4)
+
+# Cache of the labels predicted by auto-labeling: "django" (the cache above), "disk" or "" to disable it
+LABELING_CACHE = env("LABELING_CACHE", "django")
+LABELING_CACHE_TIMEOUT = env.int("LABELING_CACHE_TIMEOUT", 60 * 60 * 24)
+LABELING_CACHE_DIR = env("LABELING_CACHE_DIR", path.join(BASE_DIR, "labeling-cache"))
+LABELING_CACHE_SIZE = env.int("LABELING_CACHE_SIZE", 100000)
+
 # Necessary for email verification of new accounts
 EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", False)
 EMAIL_HOST = env("EMAIL_HOST", None)
@@ -262,6 +298,8 @@ DJANGO_DRF_FILEPOND_FILE_STORE_PATH = MEDIA_ROOT
 # File upload setting
 MAX_UPLOAD_SIZE = env.int("MAX_UPLOAD_SIZE", pow(1024, 3))  # default: 1GB per a file
 ENABLE_FILE_TYPE_CHECK = env.bool("ENABLE_FILE_TYPE_CHECK", False)
+ENABLE_PARALLEL_IMPORT = env.bool("ENABLE_PARALLEL_IMPORT", False)
+ENABLE_COPY_IMPORT = env.bool("ENABLE_COPY_IMPORT", False)
 
 # Celery settings
 DJANGO_CELERY_RESULTS_TASK_ID_MAX_LENGTH = 191
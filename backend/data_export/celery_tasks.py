@@ -1,71 +1,107 @@
+import json
 import os
 import shutil
 import uuid
+from datetime import datetime
+from typing import Optional
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db import transaction
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
-from .pipeline.dataset import Dataset
-from .pipeline.factories import (
-    create_comment,
-    create_formatter,
-    create_labels,
-    create_writer,
+from .pipeline.dataset import ChunkedDataset, MemberChunkedDataset
+from .pipeline.factories import create_formatter, create_writer, select_label_collection
+from .pipeline.incremental import filter_updated, find_deleted
+from .pipeline.services import (
+    MemberExportApplicationService,
+    StreamingExportApplicationService,
 )
-from .pipeline.services import ExportApplicationService
-from data_export.models import ExportedExample
+from data_export.models import ExportedExample, ExportWatermark
+from examples.models import DeletedExample
 from projects.models import Member, Project
 
 logger = get_task_logger(__name__)
 
 
-def create_collaborative_dataset(project: Project, dirpath: str, confirmed_only: bool, formatters, writer):
+def create_collaborative_dataset(
+    project: Project, dirpath: str, confirmed_only: bool, formatters, writer, since: Optional[datetime] = None
+):
     is_text_project = project.is_text_project
     if confirmed_only:
         examples = ExportedExample.objects.confirmed(project)
     else:
         examples = ExportedExample.objects.filter(project=project)
-    labels = create_labels(project, examples)
-    comments = create_comment(examples)
-    dataset = Dataset(examples, labels, comments, is_text_project)
+    label_collections = select_label_collection(project)
+    examples = filter_updated(examples, since, label_collections)
+    dataset = ChunkedDataset(examples, label_collections, is_text_project, chunk_size=settings.EXPORT_BATCH_SIZE)
 
-    service = ExportApplicationService(dataset, formatters, writer)
+    service = StreamingExportApplicationService(dataset, formatters, writer)
 
     filepath = os.path.join(dirpath, f"all.{writer.extension}")
     service.export(filepath)
 
 
-def create_individual_dataset(project: Project, dirpath: str, confirmed_only: bool, formatters, writer):
+def create_individual_dataset(
+    project: Project, dirpath: str, confirmed_only: bool, formatters, writer, since: Optional[datetime] = None
+):
     is_text_project = project.is_text_project
-    members = Member.objects.filter(project=project)
-    for member in members:
-        if confirmed_only:
-            examples = ExportedExample.objects.confirmed(project, user=member.user)
-        else:
-            examples = ExportedExample.objects.filter(project=project)
-        labels = create_labels(project, examples, member.user)
-        comments = create_comment(examples, member.user)
-        dataset = Dataset(examples, labels, comments, is_text_project)
+    label_collections = select_label_collection(project)
+    members = Member.objects.filter(project=project).select_related("user")
+    examples = ExportedExample.objects.filter(project=project)
+    if confirmed_only:
+        examples = examples.exclude(states=None)
+    examples = filter_updated(examples, since, label_collections)
+    users = [member.user for member in members]
+    dataset = MemberChunkedDataset(
+        examples, label_collections, users, is_text_project, confirmed_only, chunk_size=settings.EXPORT_BATCH_SIZE
+    )
+
+    service = MemberExportApplicationService(dataset, formatters, writer)
 
-        service = ExportApplicationService(dataset, formatters, writer)
+    files = {member.user.id: os.path.join(dirpath, f"{member.username}.{writer.extension}") for member in members}
+    service.export(files)
 
-        filepath = os.path.join(dirpath, f"{member.username}.{writer.extension}")
-        service.export(filepath)
+
+def create_tombstones(project: Project, dirpath: str, since: Optional[datetime], until: datetime):
+    tombstones = {
+        "since": since.isoformat() if since else None,
+        "until": until.isoformat(),
+        "deleted": find_deleted(project, since, until),
+    }
+    with open(os.path.join(dirpath, "deleted.json"), "w", encoding="utf-8") as f:
+        json.dump(tombstones, f)
 
 
 @shared_task(autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True)
-def export_dataset(project_id, file_format: str, confirmed_only=False):
+def export_dataset(project_id, file_format: str, confirmed_only=False, incremental=False):
+    """Exports the dataset of the project as a zip file.
+
+    If `incremental` is True, only the examples changed since the previous incremental export are written,
+    along with `deleted.json` that lists the ids of the examples deleted in the meantime.
+    """
     project = get_object_or_404(Project, pk=project_id)
     dirpath = os.path.join(settings.MEDIA_ROOT, str(uuid.uuid4()))
     os.makedirs(dirpath, exist_ok=True)
     formatters = create_formatter(project, file_format)
     writer = create_writer(file_format)
+    since = None
+    until = timezone.now()
+    if incremental:
+        since = ExportWatermark.objects.filter(project=project).values_list("exported_at", flat=True).first()
     if project.collaborative_annotation:
-        create_collaborative_dataset(project, dirpath, confirmed_only, formatters, writer)
+        create_collaborative_dataset(project, dirpath, confirmed_only, formatters, writer, since)
     else:
-        create_individual_dataset(project, dirpath, confirmed_only, formatters, writer)
+        create_individual_dataset(project, dirpath, confirmed_only, formatters, writer, since)
+    if incremental:
+        create_tombstones(project, dirpath, since, until)
     zip_file = shutil.make_archive(dirpath, "zip", dirpath)
     shutil.rmtree(dirpath)
+    if incremental:
+        with transaction.atomic():
+            ExportWatermark.objects.update_or_create(project=project, defaults={"exported_at": until})
+            # The deletions up to the watermark have been reported, and the next export starts after it.
+            DeletedExample.objects.filter(project=project, deleted_at__lte=until).delete()
     return zip_file
@@ -18,6 +18,13 @@ class ExportedExampleManager(models.Manager):
             return self.filter(project=project, states__confirmed_by=user)
 
 
+class ExportWatermark(models.Model):
+    """The time of the last incremental export of a project."""
+
+    project = models.OneToOneField(to=Project, on_delete=models.CASCADE, related_name="export_watermark")
+    exported_at = models.DateTimeField()
+
+
 class ExportedExample(Example):
     objects = ExportedExampleManager()
 
@@ -1,3 +1,4 @@
+import importlib.util
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Type
@@ -33,6 +34,14 @@ class JSONL(Format):
     name = "JSONL"
 
 
+class Parquet(Format):
+    name = "Parquet"
+
+
+class Arrow(Format):
+    name = "Arrow"
+
+
 class Options:
     options: Dict[str, List] = defaultdict(list)
 
@@ -99,3 +108,14 @@ Options.register(ProjectType.IMAGE_CAPTIONING, JSONL, IMAGE_CAPTIONING_DIR / "ex
 # Speech to Text
 SPEECH2TEXT_DIR = EXAMPLE_DIR / "speech_to_text"
 Options.register(ProjectType.SPEECH2TEXT, JSONL, SPEECH2TEXT_DIR / "example.jsonl")
+
+# Columnar formats, available if pyarrow is installed (the `arrow` extra)
+if importlib.util.find_spec("pyarrow") is not None:
+    for file_format in [Parquet, Arrow]:
+        Options.register(ProjectType.DOCUMENT_CLASSIFICATION, file_format, TEXT_CLASSIFICATION_DIR / "columnar.txt")
+        Options.register(ProjectType.SEQUENCE_LABELING, file_format, SEQUENCE_LABELING_DIR / "columnar.txt")
+        Options.register(ProjectType.SEQUENCE_LABELING, file_format, RELATION_EXTRACTION_DIR / "columnar.txt", True)
+        Options.register(ProjectType.SEQ2SEQ, file_format, SEQ2SEQ_DIR / "columnar.txt")
+        Options.register(
+            ProjectType.INTENT_DETECTION_AND_SLOT_FILLING, file_format, INTENT_DETECTION_DIR / "columnar.txt"
+        )
@@ -1,24 +1,51 @@
 import abc
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Tuple
 
 from django.db.models import QuerySet
 
 from data_export.models import ExportedComment, ExportedExample
 
 
+class CommentRecord(NamedTuple):
+    id: int
+    text: str
+
+    def to_string(self) -> str:
+        return self.text
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "comment": self.text}
+
+
 class Comments(abc.ABC):
     comment_class = ExportedComment
+    record_class = CommentRecord
     column = "Comments"
-    fields: Tuple[str, ...] = ("example", "user")  # To boost performance
+    fields: Tuple[str, ...] = ("id", "text")
 
     def __init__(self, examples: QuerySet[ExportedExample], user=None):
-        self.comment_groups = defaultdict(list)
+        self.comment_groups: Dict[int, List[CommentRecord]] = defaultdict(list)
         comments = self.comment_class.objects.filter(example__in=examples)
         if user:
             comments = comments.filter(user=user)
-        for comment in comments.select_related(*self.fields):
-            self.comment_groups[comment.example.id].append(comment)
+        for example_id, *values in comments.values_list("example_id", *self.fields).iterator():
+            self.comment_groups[example_id].append(self.record_class(*values))
+
+    @classmethod
+    def empty(cls) -> "Comments":
+        comments = cls.__new__(cls)
+        comments.comment_groups = defaultdict(list)
+        return comments
+
+    @classmethod
+    def partition_by_user(cls, examples: QuerySet[ExportedExample]) -> Dict[int, "Comments"]:
+        """Loads the comments of all the users with a single query, and splits them by user id."""
+        partitions: Dict[int, Comments] = defaultdict(cls.empty)
+        comments = cls.comment_class.objects.filter(example__in=examples)
+        for user_id, example_id, *values in comments.values_list("user_id", "example_id", *cls.fields).iterator():
+            partitions[user_id].comment_groups[example_id].append(cls.record_class(*values))
+        return partitions
 
-    def find_by(self, example_id: int) -> Dict[str, List[ExportedComment]]:
+    def find_by(self, example_id: int) -> Dict[str, List[CommentRecord]]:
         return {self.column: self.comment_groups[example_id]}
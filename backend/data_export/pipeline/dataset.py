@@ -1,11 +1,14 @@
-from typing import Any, Dict, Iterator, List
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Set, Type
 
 import pandas as pd
+from django.db.models import Q
 from django.db.models.query import QuerySet
 
 from .comments import Comments
 from .labels import Labels
 from data_export.models import ExportedExample
+from examples.models import ExampleState
 
 
 class Dataset:
@@ -28,3 +31,88 @@ class Dataset:
 
     def to_dataframe(self) -> pd.DataFrame:
         return pd.DataFrame(self)
+
+
+def paginate(examples: QuerySet[ExportedExample], chunk_size: int) -> Iterator[List[ExportedExample]]:
+    """Splits the examples into chunks by `(created_at, id)` instead of OFFSET."""
+    examples = examples.order_by("created_at", "pk")
+    page = examples
+    while True:
+        chunk = list(page[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]
+        page = examples.filter(Q(created_at__gt=last.created_at) | Q(created_at=last.created_at, pk__gt=last.pk))
+
+
+class ChunkedDataset:
+    """Splits the examples into chunks, each of which is a `Dataset`.
+
+    The labels and comments are loaded per chunk.
+    """
+
+    def __init__(
+        self,
+        examples: QuerySet[ExportedExample],
+        label_collections: List[Type[Labels]],
+        is_text_project=True,
+        user=None,
+        chunk_size=1000,
+    ):
+        self.examples = examples
+        self.label_collections = label_collections
+        self.is_text_project = is_text_project
+        self.user = user
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[Dataset]:
+        for chunk in paginate(self.examples, self.chunk_size):
+            labels = [collection(examples=chunk, user=self.user) for collection in self.label_collections]
+            comments = [Comments(examples=chunk, user=self.user)]
+            yield Dataset(chunk, labels, comments, self.is_text_project)
+
+
+class MemberChunkedDataset:
+    """Splits the examples into chunks, and each chunk into a `Dataset` per member.
+
+    The labels and comments of a chunk are loaded once for all the members and partitioned by user,
+    so the examples and labels are scanned once however many members the project has.
+    If `confirmed_only` is True, each member's dataset only contains the examples the member confirmed.
+    """
+
+    def __init__(
+        self,
+        examples: QuerySet[ExportedExample],
+        label_collections: List[Type[Labels]],
+        users: List[Any],
+        is_text_project=True,
+        confirmed_only=False,
+        chunk_size=1000,
+    ):
+        self.examples = examples
+        self.label_collections = label_collections
+        self.users = users
+        self.is_text_project = is_text_project
+        self.confirmed_only = confirmed_only
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[Dict[int, Dataset]]:
+        for chunk in paginate(self.examples, self.chunk_size):
+            labels = [collection.partition_by_user(chunk) for collection in self.label_collections]
+            comments = Comments.partition_by_user(chunk)
+            confirmed = self.find_confirmed(chunk) if self.confirmed_only else None
+            datasets = {}
+            for user in self.users:
+                examples = chunk if confirmed is None else [e for e in chunk if e.id in confirmed[user.id]]
+                user_labels = [partitions[user.id] for partitions in labels]
+                datasets[user.id] = Dataset(examples, user_labels, [comments[user.id]], self.is_text_project)
+            yield datasets
+
+    @staticmethod
+    def find_confirmed(examples: List[ExportedExample]) -> Dict[int, Set[int]]:
+        confirmed: Dict[int, Set[int]] = defaultdict(set)
+        states = ExampleState.objects.filter(example__in=examples).values_list("confirmed_by_id", "example_id")
+        for user_id, example_id in states:
+            confirmed[user_id].add(example_id)
+        return confirmed
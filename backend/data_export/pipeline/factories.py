@@ -3,7 +3,7 @@ from typing import Dict, List, Type
 from django.db.models import QuerySet
 
 from . import writers
-from .catalog import CSV, JSON, JSONL, FastText
+from .catalog import CSV, JSON, JSONL, Arrow, FastText, Parquet
 from .comments import Comments
 from .formatters import (
     DictFormatter,
@@ -16,6 +16,16 @@ from .formatters import (
 )
 from .labels import BoundingBoxes, Categories, Labels, Relations, Segments, Spans, Texts
 from data_export.models import DATA, ExportedExample
+from labels.models import (
+    BoundingBox,
+    Category,
+    Label,
+    Relation,
+    Segmentation,
+    Span,
+    TextLabel,
+    select_label_models,
+)
 from projects.models import Project, ProjectType
 
 
@@ -25,6 +35,8 @@ def create_writer(file_format: str) -> writers.Writer:
         JSON.name: writers.JsonWriter(),
         JSONL.name: writers.JsonlWriter(),
         FastText.name: writers.FastTextWriter(),
+        Parquet.name: writers.ParquetWriter(),
+        Arrow.name: writers.ArrowWriter(),
     }
     if file_format not in mapping:
         ValueError(f"Invalid format: {file_format}")
@@ -49,6 +61,38 @@ def create_formatter(project: Project, file_format: str) -> List[Formatter]:
     # audio tasks
     mapper_speech2text = {DATA: "filename", Texts.column: "label"}
 
+    # columnar formats keep the labels as nested lists and structs
+    columnar_text_classification = [
+        ListedCategoryFormatter(Categories.column),
+        ListedCategoryFormatter(Comments.column),
+        RenameFormatter(**mapper_text_classification),
+    ]
+    columnar_sequence_labeling = (
+        [
+            DictFormatter(Spans.column),
+            DictFormatter(Relations.column),
+            DictFormatter(Comments.column),
+            RenameFormatter(**mapper_relation_extraction),
+        ]
+        if use_relation
+        else [
+            DictFormatter(Spans.column),
+            ListedCategoryFormatter(Comments.column),
+            RenameFormatter(**mapper_sequence_labeling),
+        ]
+    )
+    columnar_seq2seq = [
+        ListedCategoryFormatter(Texts.column),
+        ListedCategoryFormatter(Comments.column),
+        RenameFormatter(**mapper_seq2seq),
+    ]
+    columnar_intent_detection = [
+        ListedCategoryFormatter(Categories.column),
+        DictFormatter(Spans.column),
+        ListedCategoryFormatter(Comments.column),
+        RenameFormatter(**mapper_intent_detection),
+    ]
+
     mapping: Dict[str, Dict[str, List[Formatter]]] = {
         ProjectType.DOCUMENT_CLASSIFICATION: {
             CSV.name: [
@@ -67,6 +111,8 @@ def create_formatter(project: Project, file_format: str) -> List[Formatter]:
                 RenameFormatter(**mapper_text_classification),
             ],
             FastText.name: [FastTextCategoryFormatter(Categories.column)],
+            Parquet.name: columnar_text_classification,
+            Arrow.name: columnar_text_classification,
         },
         ProjectType.SEQUENCE_LABELING: {
             JSONL.name: (
@@ -82,7 +128,9 @@ def create_formatter(project: Project, file_format: str) -> List[Formatter]:
                     ListedCategoryFormatter(Comments.column),
                     RenameFormatter(**mapper_sequence_labeling),
                 ]
-            )
+            ),
+            Parquet.name: columnar_sequence_labeling,
+            Arrow.name: columnar_sequence_labeling,
         },
         ProjectType.SEQ2SEQ: {
             CSV.name: [
@@ -100,6 +148,8 @@ def create_formatter(project: Project, file_format: str) -> List[Formatter]:
                 ListedCategoryFormatter(Comments.column),
                 RenameFormatter(**mapper_seq2seq),
             ],
+            Parquet.name: columnar_seq2seq,
+            Arrow.name: columnar_seq2seq,
         },
         ProjectType.IMAGE_CLASSIFICATION: {
             JSONL.name: [
@@ -121,7 +171,9 @@ def create_formatter(project: Project, file_format: str) -> List[Formatter]:
                 TupledSpanFormatter(Spans.column),
                 ListedCategoryFormatter(Comments.column),
                 RenameFormatter(**mapper_intent_detection),
-            ]
+            ],
+            Parquet.name: columnar_intent_detection,
+            Arrow.name: columnar_intent_detection,
         },
         ProjectType.BOUNDING_BOX: {
             JSONL.name: [
@@ -159,22 +211,15 @@ def create_formatter(project: Project, file_format: str) -> List[Formatter]:
 
 
 def select_label_collection(project: Project) -> List[Type[Labels]]:
-    use_relation = getattr(project, "use_relation", False)
-    mapping: Dict[str, List[Type[Labels]]] = {
-        ProjectType.DOCUMENT_CLASSIFICATION: [Categories],
-        ProjectType.SEQUENCE_LABELING: [Spans, Relations] if use_relation else [Spans],
-        ProjectType.SEQ2SEQ: [Texts],
-        ProjectType.IMAGE_CLASSIFICATION: [Categories],
-        ProjectType.SPEECH2TEXT: [Texts],
-        ProjectType.INTENT_DETECTION_AND_SLOT_FILLING: [Categories, Spans],
-        ProjectType.BOUNDING_BOX: [BoundingBoxes],
-        ProjectType.SEGMENTATION: [Segments],
-        ProjectType.IMAGE_CAPTIONING: [Texts],
-        # [EXPERIMENTAL-FEATURE-START]
-        ProjectType.KNOWLEDGE_CORRECTION: [Spans, Relations] if use_relation else [Spans],
-        # [EXPERIMENTAL-FEATURE-END]
+    mapping: Dict[Type[Label], Type[Labels]] = {
+        Category: Categories,
+        Span: Spans,
+        Relation: Relations,
+        TextLabel: Texts,
+        BoundingBox: BoundingBoxes,
+        Segmentation: Segments,
     }
-    return mapping[project.project_type]
+    return [mapping[model] for model in select_label_models(project)]
 
 
 def create_labels(project: Project, examples: QuerySet[ExportedExample], user=None) -> List[Labels]:
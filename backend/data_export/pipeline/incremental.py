@@ -0,0 +1,43 @@
+"""
+Narrows an export down to the changes since the previous one.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Type
+
+from django.db.models import Exists, OuterRef, Q, QuerySet
+
+from .labels import Labels
+from data_export.models import ExportedComment, ExportedExample
+from examples.models import DeletedExample, ExampleState
+from projects.models import Project
+
+
+def filter_updated(
+    examples: QuerySet[ExportedExample], since: Optional[datetime], label_collections: List[Type[Labels]]
+) -> QuerySet[ExportedExample]:
+    """Keeps the examples created or updated after `since`, including the ones whose labels,
+    comments or confirmation states changed. All the examples are kept if `since` is None.
+    """
+    if since is None:
+        return examples
+    related = [
+        ExampleState.objects.filter(example=OuterRef("pk"), confirmed_at__gt=since),
+        ExportedComment.objects.filter(example=OuterRef("pk"), updated_at__gt=since),
+    ]
+    related += [
+        collection.label_class.objects.filter(example=OuterRef("pk"), updated_at__gt=since)
+        for collection in label_collections
+    ]
+    condition = Q(updated_at__gt=since)
+    for queryset in related:
+        condition |= Q(Exists(queryset))
+    return examples.filter(condition)
+
+
+def find_deleted(project: Project, since: Optional[datetime], until: datetime) -> List[int]:
+    """Returns the ids of the examples deleted between `since` and `until`."""
+    if since is None:
+        return []
+    deleted = DeletedExample.objects.filter(project=project, deleted_at__gt=since, deleted_at__lte=until)
+    return list(deleted.values_list("example_id", flat=True))
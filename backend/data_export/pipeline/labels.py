@@ -4,7 +4,8 @@ Represents label collection.
 
 import abc
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Tuple, Type
+from uuid import UUID
 
 from django.db.models import QuerySet
 
@@ -20,54 +21,150 @@ from data_export.models import (
 )
 
 
+class CategoryRecord(NamedTuple):
+    label: str
+
+    def to_string(self) -> str:
+        return self.label
+
+
+class SpanRecord(NamedTuple):
+    id: int
+    label: str
+    start_offset: int
+    end_offset: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "label": self.label, "start_offset": self.start_offset, "end_offset": self.end_offset}
+
+    def to_tuple(self) -> Tuple:
+        return self.start_offset, self.end_offset, self.label
+
+
+class RelationRecord(NamedTuple):
+    id: int
+    from_id: int
+    to_id: int
+    type: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "from_id": self.from_id, "to_id": self.to_id, "type": self.type}
+
+
+class TextRecord(NamedTuple):
+    text: str
+
+    def to_string(self) -> str:
+        return self.text
+
+
+class BoundingBoxRecord(NamedTuple):
+    uuid: UUID
+    x: float
+    y: float
+    width: float
+    height: float
+    label: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "uuid": str(self.uuid),
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height,
+            "label": self.label,
+        }
+
+    def to_tuple(self) -> Tuple:
+        return self.x, self.y, self.width, self.height
+
+
+class SegmentRecord(NamedTuple):
+    uuid: UUID
+    points: List
+    label: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"uuid": str(self.uuid), "points": self.points, "label": self.label}
+
+
 class Labels(abc.ABC):
+    """Loads the labels of the examples grouped by example id.
+
+    Only the columns in `fields` are fetched, and each row is stored as a `record_class`
+    that formats it the same way as the corresponding `Exported*` model.
+    """
+
     label_class = ExportedLabel
+    record_class: Type[Any] = tuple
     column = "labels"
-    fields: Tuple[str, ...] = ("example", "label")  # To boost performance
+    fields: Tuple[str, ...] = ()
 
     def __init__(self, examples: QuerySet[ExportedExample], user=None):
-        self.label_groups = defaultdict(list)
+        self.label_groups: Dict[int, List[Any]] = defaultdict(list)
         labels = self.label_class.objects.filter(example__in=examples)
         if user:
             labels = labels.filter(user=user)
-        for label in labels.select_related(*self.fields):
-            self.label_groups[label.example.id].append(label)
-
-    def find_by(self, example_id: int) -> Dict[str, List[ExportedLabel]]:
+        for example_id, *values in labels.values_list("example_id", *self.fields).iterator():
+            self.label_groups[example_id].append(self.record_class(*values))
+
+    @classmethod
+    def empty(cls) -> "Labels":
+        labels = cls.__new__(cls)
+        labels.label_groups = defaultdict(list)
+        return labels
+
+    @classmethod
+    def partition_by_user(cls, examples: QuerySet[ExportedExample]) -> Dict[int, "Labels"]:
+        """Loads the labels of all the users with a single query, and splits them by user id."""
+        partitions: Dict[int, Labels] = defaultdict(cls.empty)
+        labels = cls.label_class.objects.filter(example__in=examples)
+        for user_id, example_id, *values in labels.values_list("user_id", "example_id", *cls.fields).iterator():
+            partitions[user_id].label_groups[example_id].append(cls.record_class(*values))
+        return partitions
+
+    def find_by(self, example_id: int) -> Dict[str, List[Any]]:
         return {self.column: self.label_groups[example_id]}
 
 
 class Categories(Labels):
     label_class = ExportedCategory
+    record_class = CategoryRecord
     column = "categories"
-    fields = ("example", "label")
+    fields = ("label__text",)
 
 
 class Spans(Labels):
     label_class = ExportedSpan
+    record_class = SpanRecord
     column = "entities"
-    fields = ("example", "label")
+    fields = ("id", "label__text", "start_offset", "end_offset")
 
 
 class Relations(Labels):
     label_class = ExportedRelation
+    record_class = RelationRecord
     column = "relations"
-    fields = ("example", "type")
+    fields = ("id", "from_id", "to_id", "type__text")
 
 
 class Texts(Labels):
     label_class = ExportedText
+    record_class = TextRecord
     column = "labels"
-    fields = ("example",)
+    fields = ("text",)
 
 
 class BoundingBoxes(Labels):
     label_class = ExportedBoundingBox
+    record_class = BoundingBoxRecord
     column = "labels"
-    fields = ("example", "label")
+    fields = ("uuid", "x", "y", "width", "height", "label__text")
 
 
 class Segments(Labels):
     label_class = ExportedSegmentation
+    record_class = SegmentRecord
     column = "labels"
-    fields = ("example", "label")
+    fields = ("uuid", "points", "label__text")
@@ -1,6 +1,9 @@
-from typing import List
+from contextlib import ExitStack
+from typing import Dict, List
 
-from .dataset import Dataset
+import pandas as pd
+
+from .dataset import ChunkedDataset, Dataset, MemberChunkedDataset
 from .formatters import Formatter
 from .writers import Writer
 
@@ -11,9 +14,40 @@ class ExportApplicationService:
         self.formatters = formatters
         self.writer = writer
 
-    def export(self, file):
-        dataset = self.dataset.to_dataframe()
+    def format(self, dataset: pd.DataFrame) -> pd.DataFrame:
         for formatter in self.formatters:
             dataset = formatter.format(dataset)
+        return dataset
+
+    def export(self, file):
+        dataset = self.format(self.dataset.to_dataframe())
         self.writer.write(file, dataset)
         return file
+
+
+class StreamingExportApplicationService(ExportApplicationService):
+    """Formats and writes the dataset chunk by chunk, so the memory usage doesn't grow with the project size."""
+
+    def __init__(self, dataset: ChunkedDataset, formatters: List[Formatter], writer: Writer):
+        super().__init__(dataset, formatters, writer)  # type: ignore
+
+    def export(self, file):
+        chunks = (self.format(chunk.to_dataframe()) for chunk in self.dataset)
+        self.writer.write_chunks(file, chunks)
+        return file
+
+
+class MemberExportApplicationService(ExportApplicationService):
+    """Writes the dataset of every member from a single pass over the examples."""
+
+    def __init__(self, dataset: MemberChunkedDataset, formatters: List[Formatter], writer: Writer):
+        super().__init__(dataset, formatters, writer)  # type: ignore
+
+    def export(self, files: Dict[int, str]):  # type: ignore
+        """Exports the datasets to the files keyed by user id."""
+        with ExitStack() as stack:
+            streams = {user_id: stack.enter_context(self.writer.open(file)) for user_id, file in files.items()}
+            for datasets in self.dataset:
+                for user_id, dataset in datasets.items():
+                    streams[user_id].write(self.format(dataset.to_dataframe()))
+        return files
@@ -1,7 +1,232 @@
 import abc
+import csv
+import json
+import math
+import os
+import tempfile
+from typing import Any, Iterable, List, Optional
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional dependency for the Parquet and Arrow formats.
+    pa = pq = None  # type: ignore
+
+
+class Stream(abc.ABC):
+    """Writes the chunks of a dataset to a file one by one."""
+
+    def __init__(self, file):
+        self.file = file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @abc.abstractmethod
+    def write(self, chunk: pd.DataFrame):
+        raise NotImplementedError("Please implement this method in the subclass.")
+
+    @abc.abstractmethod
+    def close(self):
+        raise NotImplementedError("Please implement this method in the subclass.")
+
+
+class ConcatStream(Stream):
+    """Keeps the chunks and writes them at once with `Writer.write`."""
+
+    def __init__(self, file, writer: "Writer"):
+        super().__init__(file)
+        self.writer = writer
+        self.chunks: List[pd.DataFrame] = []
+
+    def write(self, chunk: pd.DataFrame):
+        self.chunks.append(chunk)
+
+    def close(self):
+        dataset = pd.concat(self.chunks, ignore_index=True) if self.chunks else pd.DataFrame()
+        self.writer.write(self.file, dataset)
+
+
+class CsvStream(Stream):
+    """The header isn't known until the last chunk because each chunk can have different meta columns.
+    So the rows are written to a temporary file first, and then copied after the header.
+    """
+
+    def __init__(self, file):
+        super().__init__(file)
+        self.columns: List[str] = []
+        self.body = tempfile.TemporaryFile("w+", encoding="utf-8", newline="")
+
+    def write(self, chunk: pd.DataFrame):
+        self.columns += [column for column in chunk.columns if column not in self.columns]
+        if not chunk.empty:
+            chunk.reindex(columns=self.columns).to_csv(self.body, index=False, header=False)
+
+    def close(self):
+        self.body.seek(0)
+        with open(self.file, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(self.columns)
+            for row in csv.reader(self.body):
+                writer.writerow(row + [""] * (len(self.columns) - len(row)))
+        self.body.close()
+
+
+class JsonStream(Stream):
+    def __init__(self, file):
+        super().__init__(file)
+        self.f = open(file, "w", encoding="utf-8")
+        self.f.write("[")
+        self.separator = ""
+
+    def write(self, chunk: pd.DataFrame):
+        if chunk.empty:
+            return
+        records = chunk.to_json(orient="records", force_ascii=False)
+        self.f.write(self.separator + records[1:-1])
+        self.separator = ","
+
+    def close(self):
+        self.f.write("]")
+        self.f.close()
+
+
+class JsonlStream(Stream):
+    def __init__(self, file):
+        super().__init__(file)
+        self.f = open(file, "w", encoding="utf-8")
+
+    def write(self, chunk: pd.DataFrame):
+        if chunk.empty:
+            return
+        records = chunk.to_json(orient="records", force_ascii=False, lines=True)
+        self.f.write(records.rstrip("\n") + "\n")
+
+    def close(self):
+        self.f.close()
+
+
+class FastTextStream(Stream):
+    def __init__(self, file):
+        super().__init__(file)
+        self.f = open(file, "w", encoding="utf-8")
+
+    def write(self, chunk: pd.DataFrame):
+        if not chunk.empty:
+            chunk.to_csv(self.f, index=False, header=False)
+
+    def close(self):
+        self.f.close()
+
+
+def to_string(value: Any) -> Optional[str]:
+    """Converts a value of a column whose types are mixed: strings are kept, others are encoded as JSON."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class ArrowTableStream(Stream):
+    """Writes the chunks as record batches of an Arrow table.
+
+    The schema has to be fixed before the first batch, but a chunk can bring meta columns
+    the previous ones didn't have, and an empty list column has no item type to infer.
+    So each chunk is spooled to a temporary Arrow file, and the batches are written
+    with the schema unified from all the chunks on close.
+
+    Meta values are whatever users imported, so a column can mix types within a chunk or
+    between chunks. Such a column is written as strings, JSON-encoding the values which aren't.
+    """
+
+    def __init__(self, file):
+        super().__init__(file)
+        self.spool = tempfile.TemporaryDirectory()
+        self.schemas: List["pa.Schema"] = []
+
+    def write(self, chunk: pd.DataFrame):
+        if chunk.empty:
+            return
+        table = pa.Table.from_pandas(self.normalize(chunk), preserve_index=False).replace_schema_metadata(None)
+        with pa.ipc.new_file(self.spool_path(len(self.schemas)), table.schema) as writer:
+            writer.write_table(table)
+        self.schemas.append(table.schema)
+
+    @staticmethod
+    def normalize(chunk: pd.DataFrame) -> pd.DataFrame:
+        mixed = {}
+        for column in chunk.columns[chunk.dtypes == object]:
+            try:
+                pa.array(chunk[column], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                mixed[column] = chunk[column].map(to_string)
+        return chunk.assign(**mixed) if mixed else chunk
+
+    def unify_schemas(self) -> "pa.Schema":
+        try:
+            return pa.unify_schemas(self.schemas, promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        fields = {}
+        for schema in self.schemas:
+            for field in schema:
+                fields.setdefault(field.name, []).append(field)
+        unified = []
+        for name, same_name in fields.items():
+            try:
+                unified.append(
+                    pa.unify_schemas([pa.schema([field]) for field in same_name], promote_options="permissive")[0]
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                unified.append(pa.field(name, pa.string()))
+        return pa.schema(unified)
+
+    @staticmethod
+    def conform(column: "pa.ChunkedArray", field: "pa.Field") -> "pa.ChunkedArray":
+        if column.type == field.type:
+            return column
+        if pa.types.is_string(field.type):
+            return pa.chunked_array([pa.array([to_string(value) for value in column.to_pylist()], pa.string())])
+        return column.cast(field.type)
+
+    def close(self):
+        schema = self.unify_schemas() if self.schemas else pa.schema([])
+        with self.open_writer(schema) as writer:
+            for i in range(len(self.schemas)):
+                with pa.memory_map(self.spool_path(i)) as source:
+                    table = pa.ipc.open_file(source).read_all()
+                columns = [
+                    self.conform(table[field.name], field)
+                    if field.name in table.column_names
+                    else pa.nulls(len(table), field.type)
+                    for field in schema
+                ]
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+        self.spool.cleanup()
+
+    def spool_path(self, i: int) -> str:
+        return os.path.join(self.spool.name, f"{i}.arrow")
+
+    @abc.abstractmethod
+    def open_writer(self, schema: "pa.Schema"):
+        raise NotImplementedError("Please implement this method in the subclass.")
+
+
+class ParquetStream(ArrowTableStream):
+    def open_writer(self, schema: "pa.Schema"):
+        return pq.ParquetWriter(self.file, schema)
+
+
+class ArrowStream(ArrowTableStream):
+    def open_writer(self, schema: "pa.Schema"):
+        return pa.ipc.new_file(self.file, schema)
+
 
 class Writer(abc.ABC):
     extension = ""
@@ -11,6 +236,17 @@ class Writer(abc.ABC):
     def write(file, dataset: pd.DataFrame):
         raise NotImplementedError("Please implement this method in the subclass.")
 
+    def open(self, file) -> Stream:
+        """Open a stream to write a dataset chunk by chunk.
+        This keeps the chunks and concatenates them by default. Override it to write them incrementally.
+        """
+        return ConcatStream(file, self)
+
+    def write_chunks(self, file, chunks: Iterable[pd.DataFrame]):
+        with self.open(file) as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+
 
 class CsvWriter(Writer):
     extension = "csv"
@@ -19,6 +255,9 @@ class CsvWriter(Writer):
     def write(file, dataset: pd.DataFrame):
         dataset.to_csv(file, index=False, encoding="utf-8")
 
+    def open(self, file) -> Stream:
+        return CsvStream(file)
+
 
 class JsonWriter(Writer):
     extension = "json"
@@ -27,6 +266,9 @@ class JsonWriter(Writer):
     def write(file, dataset: pd.DataFrame):
         dataset.to_json(file, orient="records", force_ascii=False)
 
+    def open(self, file) -> Stream:
+        return JsonStream(file)
+
 
 class JsonlWriter(Writer):
     extension = "jsonl"
@@ -35,6 +277,9 @@ class JsonlWriter(Writer):
     def write(file, dataset: pd.DataFrame):
         dataset.to_json(file, orient="records", force_ascii=False, lines=True)
 
+    def open(self, file) -> Stream:
+        return JsonlStream(file)
+
 
 class FastTextWriter(Writer):
     extension = "txt"
@@ -42,3 +287,30 @@ class FastTextWriter(Writer):
     @staticmethod
     def write(file, dataset: pd.DataFrame):
         dataset.to_csv(file, index=False, encoding="utf-8", header=False)
+
+    def open(self, file) -> Stream:
+        return FastTextStream(file)
+
+
+class ParquetWriter(Writer):
+    extension = "parquet"
+
+    @staticmethod
+    def write(file, dataset: pd.DataFrame):
+        with ParquetStream(file) as stream:
+            stream.write(dataset)
+
+    def open(self, file) -> Stream:
+        return ParquetStream(file)
+
+
+class ArrowWriter(Writer):
+    extension = "arrow"
+
+    @staticmethod
+    def write(file, dataset: pd.DataFrame):
+        with ArrowStream(file) as stream:
+            stream.write(dataset)
+
+    def open(self, file) -> Stream:
+        return ArrowStream(file)
@@ -0,0 +1,7 @@
+from rest_framework import serializers
+
+
+class DatasetExportSerializer(serializers.Serializer):
+    format = serializers.CharField()
+    exportApproved = serializers.BooleanField(default=False)
+    incremental = serializers.BooleanField(default=False)
@@ -0,0 +1,93 @@
+"""Benchmarks for the export pipeline."""
+import os
+import tempfile
+import time
+import unittest
+from collections import defaultdict
+
+import pandas as pd
+from django.test import TestCase
+from model_mommy import mommy
+
+from api.tests.bench import BENCH_ROWS, measure, report
+from data_export.models import ExportedExample, ExportedSpan
+from data_export.pipeline.labels import Spans
+from data_export.pipeline.writers import JsonlWriter, ParquetWriter, pa
+from examples.models import Example
+from labels.models import Span
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+
+
+class BenchLabelLoading(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.SEQUENCE_LABELING)
+        label = mommy.make("SpanType", project=self.project.item)
+        text = "example " * 64
+        examples = Example.objects.bulk_create(
+            [Example(project=self.project.item, text=text, meta={"i": i}) for i in range(BENCH_ROWS)]
+        )
+        Span.objects.bulk_create(
+            [
+                Span(example=example, label=label, user=self.project.admin, start_offset=0, end_offset=7)
+                for example in examples
+            ]
+        )
+        self.examples = ExportedExample.objects.filter(project=self.project.item)
+
+    def load_instances(self):
+        # The former implementation: full model instances with the example and label joined.
+        label_groups = defaultdict(list)
+        for span in ExportedSpan.objects.filter(example__in=self.examples).select_related("example", "label"):
+            label_groups[span.example.id].append(span)
+        return sum(len(spans) for spans in label_groups.values())
+
+    def load_records(self):
+        spans = Spans(self.examples)
+        return sum(len(records) for records in spans.label_groups.values())
+
+    def test_instances_vs_records(self):
+        records = measure(self.load_records)
+        instances = measure(self.load_instances)
+        report("records", *records)
+        report("instances", *instances)
+        self.assertEqual(records[0], instances[0])
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class BenchColumnarExport(TestCase):
+    def setUp(self):
+        self.chunks = [
+            pd.DataFrame(
+                [
+                    {
+                        "id": i,
+                        "text": f"example {i} " * 8,
+                        "label": [{"id": i, "label": "ORG", "start_offset": 0, "end_offset": 7}],
+                        "Comments": [],
+                    }
+                    for i in range(start, min(start + 1000, BENCH_ROWS))
+                ]
+            )
+            for start in range(0, BENCH_ROWS, 1000)
+        ]
+        self.dirpath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for filename in os.listdir(self.dirpath):
+            os.remove(os.path.join(self.dirpath, filename))
+        os.rmdir(self.dirpath)
+
+    def run_writer(self, name, writer, read):
+        file = os.path.join(self.dirpath, f"bench.{writer.extension}")
+        rows, elapsed, peak = measure(lambda: writer.write_chunks(file, self.chunks) or len(read(file)))
+        report(name, rows, elapsed, peak)
+        start = time.perf_counter()
+        read(file)
+        print(
+            f"{name:>10}: {os.path.getsize(file) / 2**20:.1f} MiB on disk, loaded in {time.perf_counter() - start:.2f}s"
+        )
+
+    def test_jsonl_vs_parquet(self):
+        self.run_writer("jsonl", JsonlWriter(), lambda file: pd.read_json(file, lines=True))
+        self.run_writer("parquet", ParquetWriter(), pd.read_parquet)
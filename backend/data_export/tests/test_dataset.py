@@ -2,9 +2,15 @@ import unittest
 from unittest.mock import MagicMock
 
 import pandas as pd
+from django.test import TestCase
+from model_mommy import mommy
 from pandas.testing import assert_frame_equal
 
-from data_export.pipeline.dataset import Dataset
+from data_export.models import ExportedExample
+from data_export.pipeline.dataset import ChunkedDataset, Dataset, MemberChunkedDataset
+from data_export.pipeline.labels import Categories
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
 
 
 class TestDataset(unittest.TestCase):
@@ -27,3 +33,78 @@ class TestDataset(unittest.TestCase):
         df = dataset.to_dataframe()
         expected = pd.DataFrame([{"data": "example", "labels": ["label"], "comments": ["comment"]}])
         assert_frame_equal(df, expected)
+
+
+class TestChunkedDataset(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = mommy.make("ExportedExample", project=self.project.item, _quantity=3)
+        self.category = mommy.make("ExportedCategory", example=self.examples[1], user=self.project.admin)
+        self.comment = mommy.make("ExportedComment", example=self.examples[2], user=self.project.annotator)
+
+    def iterate(self, chunk_size, user=None):
+        examples = ExportedExample.objects.filter(project=self.project.item)
+        return list(ChunkedDataset(examples, [Categories], user=user, chunk_size=chunk_size))
+
+    def test_split_examples_into_chunks(self):
+        chunks = self.iterate(chunk_size=2)
+        self.assertEqual([len(list(chunk)) for chunk in chunks], [2, 1])
+        ids = [data["id"] for chunk in chunks for data in chunk]
+        self.assertEqual(ids, [example.id for example in self.examples])
+
+    def test_load_labels_and_comments_per_chunk(self):
+        records = [data for chunk in self.iterate(chunk_size=1) for data in chunk]
+        categories = [[label.to_string() for label in record["categories"]] for record in records]
+        comments = [[comment.to_string() for comment in record["Comments"]] for record in records]
+        self.assertEqual(categories, [[], [self.category.to_string()], []])
+        self.assertEqual(comments, [[], [], [self.comment.to_string()]])
+
+    def test_filter_labels_by_user(self):
+        records = [data for chunk in self.iterate(chunk_size=2, user=self.project.annotator) for data in chunk]
+        self.assertEqual([record["categories"] for record in records], [[], [], []])
+        self.assertEqual([comment.to_string() for comment in records[2]["Comments"]], [self.comment.to_string()])
+
+    def test_examples_with_same_created_at(self):
+        ExportedExample.objects.update(created_at=self.examples[0].created_at)
+        ids = [data["id"] for chunk in self.iterate(chunk_size=1) for data in chunk]
+        self.assertEqual(ids, sorted(example.id for example in self.examples))
+
+
+class TestMemberChunkedDataset(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = mommy.make("ExportedExample", project=self.project.item, _quantity=3)
+        self.category = mommy.make("ExportedCategory", example=self.examples[1], user=self.project.admin)
+        self.comment = mommy.make("ExportedComment", example=self.examples[2], user=self.project.annotator)
+        mommy.make("ExampleState", example=self.examples[1], confirmed_by=self.project.admin)
+        self.users = self.project.members
+
+    def iterate(self, confirmed_only=False):
+        examples = ExportedExample.objects.filter(project=self.project.item)
+        dataset = MemberChunkedDataset(examples, [Categories], self.users, confirmed_only=confirmed_only, chunk_size=2)
+        records = {user.id: [] for user in self.users}
+        for datasets in dataset:
+            for user_id, chunk in datasets.items():
+                records[user_id] += [
+                    (data["id"], [label.to_string() for label in data["categories"]], len(data["Comments"]))
+                    for data in chunk
+                ]
+        return records
+
+    def test_partition_by_member(self):
+        records = self.iterate()
+        ids = [example.id for example in self.examples]
+        self.assertEqual(
+            records[self.project.admin.id], list(zip(ids, [[], [self.category.to_string()], []], [0, 0, 0]))
+        )
+        self.assertEqual(records[self.project.annotator.id], list(zip(ids, [[], [], []], [0, 0, 1])))
+
+    def test_confirmed_only(self):
+        records = self.iterate(confirmed_only=True)
+        self.assertEqual(records[self.project.admin.id], [(self.examples[1].id, [self.category.to_string()], 0)])
+        self.assertEqual(records[self.project.annotator.id], [])
+
+    def test_queries_do_not_depend_on_members(self):
+        # 2 pages and an empty one, and a query for categories and comments per page.
+        with self.assertNumQueries(7):
+            self.iterate()
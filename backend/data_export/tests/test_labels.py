@@ -1,7 +1,15 @@
 from django.test import TestCase
 from model_mommy import mommy
 
-from ..pipeline.labels import Categories
+from ..pipeline.comments import Comments
+from ..pipeline.labels import (
+    BoundingBoxes,
+    Categories,
+    Relations,
+    Segments,
+    Spans,
+    Texts,
+)
 from data_export.models import ExportedExample
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
@@ -26,3 +34,45 @@ class TestLabels(TestCase):
         categories = Categories(self.examples, user=self.project.annotator)
         result = categories.find_by(self.example1.id)
         self.assertEqual(len(result[Categories.column]), 0)
+
+
+class TestLabelRecords(TestCase):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.SEQUENCE_LABELING)
+        self.example = mommy.make("ExportedExample", project=self.project.item)
+        self.examples = ExportedExample.objects.all()
+
+    def assert_same_output(self, collection, label, *methods):
+        record = collection(self.examples).find_by(self.example.id)[collection.column][0]
+        for method in methods:
+            self.assertEqual(getattr(record, method)(), getattr(label, method)())
+
+    def test_category(self):
+        category = mommy.make("ExportedCategory", example=self.example, user=self.project.admin)
+        self.assert_same_output(Categories, category, "to_string")
+
+    def test_span(self):
+        span = mommy.make("ExportedSpan", example=self.example, start_offset=0, end_offset=1)
+        self.assert_same_output(Spans, span, "to_dict", "to_tuple")
+
+    def test_relation(self):
+        span1 = mommy.make("ExportedSpan", example=self.example, start_offset=0, end_offset=1)
+        span2 = mommy.make("ExportedSpan", example=self.example, start_offset=1, end_offset=2)
+        relation = mommy.make("ExportedRelation", from_id=span1, to_id=span2, example=self.example)
+        self.assert_same_output(Relations, relation, "to_dict")
+
+    def test_text(self):
+        text = mommy.make("ExportedText", example=self.example)
+        self.assert_same_output(Texts, text, "to_string")
+
+    def test_bounding_box(self):
+        bbox = mommy.make("ExportedBoundingBox", example=self.example, x=0, y=0, width=1, height=1)
+        self.assert_same_output(BoundingBoxes, bbox, "to_dict", "to_tuple")
+
+    def test_segmentation(self):
+        segmentation = mommy.make("ExportedSegmentation", example=self.example, points=[0, 1, 2, 3])
+        self.assert_same_output(Segments, segmentation, "to_dict")
+
+    def test_comment(self):
+        comment = mommy.make("ExportedComment", example=self.example, user=self.project.admin)
+        self.assert_same_output(Comments, comment, "to_string", "to_dict")
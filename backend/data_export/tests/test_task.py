@@ -1,4 +1,6 @@
+import json
 import os
+import unittest
 import zipfile
 
 import pandas as pd
@@ -6,7 +8,9 @@ from django.test import TestCase, override_settings
 from model_mommy import mommy
 
 from ..celery_tasks import export_dataset
-from data_export.models import DATA
+from ..pipeline.writers import pa
+from data_export.models import DATA, ExportedExample, ExportWatermark
+from examples.models import DeletedExample
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
@@ -116,6 +120,20 @@ class TestExportCategory(TestExport):
         ]
         self.assertEqual(dataset, expected_dataset)
 
+    @override_settings(EXPORT_BATCH_SIZE=1)
+    def test_export_in_batches(self):
+        self.prepare_data(collaborative=True)
+        dataset = self.export_dataset()
+        expected_dataset = [
+            {
+                **self.data1,
+                "label": sorted([self.category1.to_string(), self.category2.to_string()]),
+                "Comments": sorted([self.comment1.to_string(), self.comment2.to_string()]),
+            },
+            {**self.data2, "label": [], "Comments": []},
+        ]
+        self.assertEqual(dataset, expected_dataset)
+
 
 class TestExportSeq2seq(TestExport):
     def prepare_data(self, collaborative=False):
@@ -824,3 +842,72 @@ class TestExportRelation(TestExport):
             }
         ]
         self.assertEqual(dataset, expected_dataset)
+
+
+class TestIncrementalExport(TestExport):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION, collaborative_annotation=True)
+        self.example1 = mommy.make("ExportedExample", project=self.project.item, text="example1")
+        self.example2 = mommy.make("ExportedExample", project=self.project.item, text="example2")
+
+    def export_incrementally(self):
+        file = export_dataset(self.project.id, "JSONL", incremental=True)
+        with zipfile.ZipFile(file) as z:
+            with z.open("all.jsonl") as f:
+                try:
+                    dataset = pd.read_json(f, lines=True).to_dict(orient="records")
+                except ValueError:
+                    dataset = []
+            tombstones = json.loads(z.read("deleted.json"))
+        os.remove(file)
+        return [data["id"] for data in dataset], tombstones["deleted"]
+
+    def test_first_export_contains_all_examples(self):
+        ids, deleted = self.export_incrementally()
+        self.assertEqual(ids, [self.example1.id, self.example2.id])
+        self.assertEqual(deleted, [])
+        self.assertTrue(ExportWatermark.objects.filter(project=self.project.item).exists())
+
+    def test_export_nothing_without_changes(self):
+        self.export_incrementally()
+        self.assertEqual(self.export_incrementally(), ([], []))
+
+    def test_export_changed_examples(self):
+        self.export_incrementally()
+        mommy.make("ExportedCategory", example=self.example2, user=self.project.admin)
+        self.assertEqual(self.export_incrementally(), ([self.example2.id], []))
+
+    def test_export_deleted_examples(self):
+        self.export_incrementally()
+        examples = ExportedExample.objects.filter(pk=self.example1.id)
+        DeletedExample.objects.record(examples)
+        examples.delete()
+        self.assertEqual(self.export_incrementally(), ([], [self.example1.id]))
+
+    def test_prune_reported_deletions(self):
+        self.export_incrementally()
+        examples = ExportedExample.objects.filter(pk=self.example1.id)
+        DeletedExample.objects.record(examples)
+        examples.delete()
+        self.export_incrementally()
+        self.assertFalse(DeletedExample.objects.filter(project=self.project.item).exists())
+
+    def test_record_deletions_only_after_first_export(self):
+        DeletedExample.objects.record(ExportedExample.objects.filter(pk=self.example1.id))
+        self.assertFalse(DeletedExample.objects.exists())
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestExportParquet(TestExport):
+    def test_export_nested_spans(self):
+        self.project = prepare_project(ProjectType.SEQUENCE_LABELING, collaborative_annotation=True)
+        example = mommy.make("ExportedExample", project=self.project.item, text="example")
+        span = mommy.make("ExportedSpan", example=example, start_offset=0, end_offset=1)
+        file = export_dataset(self.project.id, "Parquet")
+        with zipfile.ZipFile(file) as z:
+            with z.open("all.parquet") as f:
+                records = pd.read_parquet(f).to_dict(orient="records")
+        os.remove(file)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["text"], "example")
+        self.assertEqual([dict(entity) for entity in records[0]["label"]], [span.to_dict()])
@@ -1,7 +1,15 @@
+import os
+import zipfile
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 
 from api.tests.utils import CRUDMixin
+from data_export.celery_tasks import export_dataset
+from data_export.models import ExportWatermark
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
@@ -19,3 +27,49 @@ class TestDownloadCatalog(CRUDMixin):
     def test_denies_project_staff_to_list_catalog(self):
         for member in self.project.staffs:
             self.assert_fetch(member, status.HTTP_403_FORBIDDEN)
+
+    def test_fetches_project_once(self):
+        self.client.force_login(self.project.admin)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+        queries = [q["sql"] for q in context.captured_queries if 'FROM "projects_project"' in q["sql"]]
+        self.assertEqual(len(queries), 1)
+
+
+class TestDatasetExport(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION, collaborative_annotation=True)
+        self.url = reverse(viewname="download-dataset", args=[self.project.item.id])
+        self.data = {"format": "JSONL"}
+
+    @patch("data_export.views.export_dataset")
+    def test_allows_project_admin_to_start_export(self, mock):
+        mock.delay.return_value.task_id = "task"
+        response = self.assert_create(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"task_id": "task"})
+        mock.delay.assert_called_once_with(
+            project_id=self.project.item.id, file_format="JSONL", confirmed_only=False, incremental=False
+        )
+
+    def test_denies_project_staff_to_start_export(self):
+        for member in self.project.staffs:
+            self.assert_create(member, status.HTTP_403_FORBIDDEN)
+
+    def test_requires_format(self):
+        self.data = {}
+        self.assert_create(self.project.admin, status.HTTP_400_BAD_REQUEST)
+
+    def test_exports_incrementally(self):
+        self.data["incremental"] = True
+        results = []
+
+        def run(**kwargs):
+            results.append(export_dataset.apply(kwargs=kwargs))
+            return results[-1]
+
+        with patch.object(export_dataset, "delay", side_effect=run):
+            self.assert_create(self.project.admin, status.HTTP_200_OK)
+        with zipfile.ZipFile(results[0].get()) as z:
+            self.assertIn("deleted.json", z.namelist())
+        os.remove(results[0].get())
+        self.assertTrue(ExportWatermark.objects.filter(project=self.project.item).exists())
@@ -4,7 +4,16 @@ import unittest
 import pandas as pd
 from pandas.testing import assert_frame_equal
 
-from ..pipeline.writers import CsvWriter, FastTextWriter, JsonlWriter, JsonWriter
+from ..pipeline.writers import (
+    ArrowWriter,
+    CsvWriter,
+    FastTextWriter,
+    JsonlWriter,
+    JsonWriter,
+    ParquetWriter,
+    pa,
+    pq,
+)
 
 
 class TestWriter(unittest.TestCase):
@@ -21,6 +30,9 @@ class TestWriter(unittest.TestCase):
     def tearDown(self):
         os.remove(self.file)
 
+    def split(self):
+        return [self.dataset[:2], self.dataset[2:]]
+
 
 class TestCSVWriter(TestWriter):
     def test_write(self):
@@ -29,6 +41,20 @@ class TestCSVWriter(TestWriter):
         loaded_dataset = pd.read_csv(self.file)
         assert_frame_equal(self.dataset, loaded_dataset)
 
+    def test_write_chunks(self):
+        writer = CsvWriter()
+        writer.write_chunks(self.file, self.split())
+        loaded_dataset = pd.read_csv(self.file)
+        assert_frame_equal(self.dataset, loaded_dataset)
+
+    def test_write_chunks_with_different_columns(self):
+        writer = CsvWriter()
+        chunks = [pd.DataFrame([{"id": 0, "text": "A"}]), pd.DataFrame([{"id": 1, "text": "B\nC", "meta": "x"}])]
+        writer.write_chunks(self.file, chunks)
+        loaded_dataset = pd.read_csv(self.file, keep_default_na=False)
+        expected = pd.DataFrame([{"id": 0, "text": "A", "meta": ""}, {"id": 1, "text": "B\nC", "meta": "x"}])
+        assert_frame_equal(expected, loaded_dataset)
+
 
 class TestJsonWriter(TestWriter):
     def test_write(self):
@@ -37,6 +63,17 @@ class TestJsonWriter(TestWriter):
         loaded_dataset = pd.read_json(self.file)
         assert_frame_equal(self.dataset, loaded_dataset)
 
+    def test_write_chunks(self):
+        writer = JsonWriter()
+        writer.write_chunks(self.file, self.split())
+        loaded_dataset = pd.read_json(self.file)
+        assert_frame_equal(self.dataset, loaded_dataset)
+
+    def test_write_no_chunks(self):
+        writer = JsonWriter()
+        writer.write_chunks(self.file, [])
+        self.assertEqual(open(self.file, encoding="utf-8").read(), "[]")
+
 
 class TestJsonlWriter(TestWriter):
     def test_write(self):
@@ -45,6 +82,74 @@ class TestJsonlWriter(TestWriter):
         loaded_dataset = pd.read_json(self.file, lines=True)
         assert_frame_equal(self.dataset, loaded_dataset)
 
+    def test_write_chunks(self):
+        writer = JsonlWriter()
+        writer.write_chunks(self.file, self.split())
+        loaded_dataset = pd.read_json(self.file, lines=True)
+        assert_frame_equal(self.dataset, loaded_dataset)
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestParquetWriter(TestWriter):
+    def test_write(self):
+        writer = ParquetWriter()
+        writer.write(self.file, self.dataset)
+        loaded_dataset = pd.read_parquet(self.file)
+        assert_frame_equal(self.dataset, loaded_dataset)
+
+    def test_write_chunks_as_row_groups(self):
+        writer = ParquetWriter()
+        writer.write_chunks(self.file, self.split())
+        self.assertEqual(pq.ParquetFile(self.file).metadata.num_row_groups, 2)
+        loaded_dataset = pd.read_parquet(self.file)
+        assert_frame_equal(self.dataset, loaded_dataset)
+
+    def test_write_chunks_with_different_schemas(self):
+        writer = ParquetWriter()
+        chunks = [
+            pd.DataFrame([{"id": 0, "entities": []}]),
+            pd.DataFrame([{"id": 1, "entities": [{"label": "A", "start_offset": 0}], "meta": "x"}]),
+        ]
+        writer.write_chunks(self.file, chunks)
+        records = pq.read_table(self.file).to_pylist()
+        expected = [
+            {"id": 0, "entities": [], "meta": None},
+            {"id": 1, "entities": [{"label": "A", "start_offset": 0}], "meta": "x"},
+        ]
+        self.assertEqual(records, expected)
+
+    def test_write_meta_with_mixed_types_in_chunk(self):
+        writer = ParquetWriter()
+        chunks = [pd.DataFrame([{"id": 0, "source": 1}, {"id": 1, "source": "web"}, {"id": 2, "source": None}])]
+        writer.write_chunks(self.file, chunks)
+        records = pq.read_table(self.file).to_pylist()
+        expected = [{"id": 0, "source": "1"}, {"id": 1, "source": "web"}, {"id": 2, "source": None}]
+        self.assertEqual(records, expected)
+
+    def test_write_meta_with_mixed_types_between_chunks(self):
+        writer = ParquetWriter()
+        chunks = [
+            pd.DataFrame([{"id": 0, "source": 1, "tags": {"a": 1}, "score": 1}]),
+            pd.DataFrame([{"id": 1, "source": "web", "tags": ["b", 2], "score": 0.5}]),
+        ]
+        writer.write_chunks(self.file, chunks)
+        records = pq.read_table(self.file).to_pylist()
+        expected = [
+            {"id": 0, "source": "1", "tags": '{"a": 1}', "score": 1.0},
+            {"id": 1, "source": "web", "tags": '["b", 2]', "score": 0.5},
+        ]
+        self.assertEqual(records, expected)
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestArrowWriter(TestWriter):
+    def test_write_chunks(self):
+        writer = ArrowWriter()
+        writer.write_chunks(self.file, self.split())
+        with pa.memory_map(self.file) as source:
+            loaded_dataset = pa.ipc.open_file(source).read_pandas()
+        assert_frame_equal(self.dataset, loaded_dataset)
+
 
 class TestFastText(unittest.TestCase):
     def setUp(self):
@@ -57,3 +162,10 @@ class TestFastText(unittest.TestCase):
         writer.write(file, self.dataset)
         loaded_dataset = open(file, encoding="utf-8").read().strip()
         self.assertEqual(loaded_dataset, self.expected)
+
+    def test_write_chunks(self):
+        file = "tmp.txt"
+        writer = FastTextWriter()
+        writer.write_chunks(file, [self.dataset[:1], self.dataset[1:]])
+        loaded_dataset = open(file, encoding="utf-8").read().strip()
+        self.assertEqual(loaded_dataset, self.expected)
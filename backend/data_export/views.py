@@ -1,6 +1,5 @@
 from celery.result import AsyncResult
 from django.http import FileResponse
-from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -8,18 +7,17 @@ from rest_framework.views import APIView
 
 from .celery_tasks import export_dataset
 from .pipeline.catalog import Options
-from projects.models import Project
+from .serializers import DatasetExportSerializer
+from projects.mixins import ProjectMixin
 from projects.permissions import IsProjectAdmin
 
 
-class DatasetCatalog(APIView):
+class DatasetCatalog(ProjectMixin, APIView):
     permission_classes = [IsAuthenticated & IsProjectAdmin]
 
     def get(self, request, *args, **kwargs):
-        project_id = kwargs["project_id"]
-        project = get_object_or_404(Project, pk=project_id)
-        use_relation = getattr(project, "use_relation", False)
-        options = Options.filter_by_task(project.project_type, use_relation)
+        use_relation = getattr(self.project, "use_relation", False)
+        options = Options.filter_by_task(self.project.project_type, use_relation)
         return Response(data=options, status=status.HTTP_200_OK)
 
 
@@ -36,10 +34,13 @@ class DatasetExportAPI(APIView):
         return Response({"status": "Not ready"})
 
     def post(self, request, *args, **kwargs):
-        project_id = self.kwargs["project_id"]
-        file_format = request.data.pop("format")
-        export_approved = request.data.pop("exportApproved", False)
+        serializer = DatasetExportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        options = serializer.validated_data
         task = export_dataset.delay(
-            project_id=project_id, file_format=file_format, confirmed_only=export_approved, **request.data
+            project_id=self.kwargs["project_id"],
+            file_format=options["format"],
+            confirmed_only=options["exportApproved"],
+            incremental=options["incremental"],
         )
         return Response({"task_id": task.task_id})
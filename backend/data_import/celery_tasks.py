@@ -1,9 +1,12 @@
-from typing import List
+import datetime
+from typing import Any, Dict, List
 
 import filetype
-from celery import shared_task
+from celery import chord, shared_task
+from celery.result import AsyncResult, GroupResult
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db.models import F, Max, Min
 from django.shortcuts import get_object_or_404
 from django_drf_filepond.api import store_upload
 from django_drf_filepond.models import TemporaryUpload
@@ -16,6 +19,9 @@ from .pipeline.exceptions import (
     MaximumFileSizeException,
 )
 from .pipeline.readers import FileName
+from examples.models import Example
+from metrics.models import ProjectProgress
+from metrics.statistics import invalidate_label_distribution
 from projects.models import Project
 
 
@@ -47,7 +53,14 @@ def check_uploaded_files(upload_ids: List[str], file_format: Format):
 
 
 @shared_task(autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True)
-def import_dataset(user_id, project_id, file_format: str, upload_ids: List[str], task: str, **kwargs):
+def import_dataset(
+    user_id, project_id, file_format: str, upload_ids: List[str], task: str, add_progress: bool = True, **kwargs
+):
+    """Imports the uploaded files.
+
+    Bulk inserts don't update the progress counters, so the task adds the examples it inserted,
+    unless it's part of a chord, whose callback adds the examples of all the files at once.
+    """
     project = get_object_or_404(Project, pk=project_id)
     user = get_object_or_404(get_user_model(), pk=user_id)
     try:
@@ -61,9 +74,12 @@ def import_dataset(user_id, project_id, file_format: str, upload_ids: List[str],
 
         dataset = load_dataset(task, fmt, filenames, project, **kwargs)
         dataset.save(user, batch_size=settings.IMPORT_BATCH_SIZE)
+        if add_progress:
+            ProjectProgress.objects.add_examples(project.id, dataset.example_count)
+        invalidate_label_distribution(project.id)
         upload_to_store(temporary_uploads)
         errors.extend(dataset.errors)
-        return {"error": [e.dict() for e in errors]}
+        return {"error": [e.dict() for e in errors], "example_count": dataset.example_count}
     except FileImportException as e:
         return {"error": [e.dict()]}
 
@@ -71,3 +87,68 @@ def import_dataset(user_id, project_id, file_format: str, upload_ids: List[str],
 def upload_to_store(temporary_uploads):
     for tu in temporary_uploads:
         store_upload(tu.upload_id, destination_file_path=tu.file.name)
+
+
+def order_examples_by_file(project_id, filenames: List[str]):
+    """Shifts `created_at` so that the examples keep the order of the uploaded files.
+
+    Files imported in parallel interleave their timestamps. Moving each file's examples
+    right after the previous file's ones gives the same order as a sequential import,
+    while keeping the order inside each file.
+    """
+    examples = Example.objects.filter(project_id=project_id)
+    last = None
+    for filename in filenames:
+        queryset = examples.filter(filename=filename)
+        span = queryset.aggregate(first=Min("created_at"), last=Max("created_at"))
+        if span["first"] is None:
+            continue
+        if last is not None and span["first"] <= last:
+            shift = last - span["first"] + datetime.timedelta(microseconds=1)
+            queryset.update(created_at=F("created_at") + shift)
+            span["last"] += shift
+        last = span["last"]
+
+
+@shared_task
+def merge_import_results(results: List[Dict[str, Any]], project_id, filenames: List[str]):
+    order_examples_by_file(project_id, filenames)
+    ProjectProgress.objects.add_examples(project_id, sum(result.get("example_count", 0) for result in results))
+    return {"error": [error for result in results for error in result["error"]]}
+
+
+def dispatch_import(user_id, project_id, file_format: str, upload_ids: List[str], task: str, **kwargs) -> AsyncResult:
+    """Starts an import and returns the result to poll.
+
+    If parallel import is enabled, each file is imported by its own task and the results
+    are merged by a chord callback. The header tasks are saved as a group under the
+    callback's id, so that `TaskStatus` can report the progress.
+    """
+    if not settings.ENABLE_PARALLEL_IMPORT or len(upload_ids) < 2:
+        return import_dataset.delay(
+            user_id=user_id,
+            project_id=project_id,
+            file_format=file_format,
+            upload_ids=upload_ids,
+            task=task,
+            **kwargs,
+        )
+
+    uploads = TemporaryUpload.objects.in_bulk(upload_ids)
+    upload_ids = [upload_id for upload_id in upload_ids if upload_id in uploads]
+    header = [
+        import_dataset.s(
+            user_id=user_id,
+            project_id=project_id,
+            file_format=file_format,
+            upload_ids=[upload_id],
+            task=task,
+            add_progress=False,
+            **kwargs,
+        )
+        for upload_id in upload_ids
+    ]
+    callback = merge_import_results.s(project_id=project_id, filenames=[uploads[i].file.name for i in upload_ids])
+    progress = GroupResult(callback.freeze().id, [signature.freeze() for signature in header])
+    progress.save()
+    return chord(header)(callback)
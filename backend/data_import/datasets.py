@@ -1,7 +1,10 @@
 import abc
-from typing import List, Type
+import logging
+from typing import Any, Dict, Iterator, List, Type
 
+import pandas as pd
 from django.contrib.auth.models import User
+from django.db import connection
 
 from .models import DummyLabelType
 from .pipeline.catalog import RELATION_EXTRACTION, Format
@@ -18,17 +21,51 @@ from .pipeline.readers import (
     DEFAULT_TEXT_COLUMN,
     FileName,
     Reader,
+    collect_columns,
 )
 from examples.models import Comment as CommentModel
+from examples.models import Example
 from label_types.models import CategoryType, LabelType, RelationType, SpanType
 from projects.models import Project, ProjectType
 
+logger = logging.getLogger(__name__)
+
+
+class QueryCounter:
+    """Counts the queries executed on a connection. Install it with `connection.execute_wrapper`."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
 
 class Dataset(abc.ABC):
     def __init__(self, reader: Reader, project: Project, **kwargs):
         self.reader = reader
         self.project = project
         self.kwargs = kwargs
+        self.query_counts: List[int] = []
+        self.example_count = 0
+
+    def batches(self, batch_size: int) -> Iterator[List[Dict[Any, Any]]]:
+        """Yields record batches and records how many queries it took to save each of them."""
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            for records in self.reader.batch_records(batch_size):
+                start = counter.count
+                yield records
+                self.query_counts.append(counter.count - start)
+                logger.debug("Saved %d records with %d queries", len(records), self.query_counts[-1])
+
+    def save_examples(self, examples: List[Example]) -> Examples:
+        """Inserts the examples and counts them, since bulk inserts don't update the progress counters."""
+        saved = Examples(examples)
+        saved.save()
+        self.example_count += len(saved)
+        return saved
 
     def save(self, user: User, batch_size: int = 1000):
         raise NotImplementedError()
@@ -44,9 +81,8 @@ class PlainDataset(Dataset):
         self.example_maker = ExampleMaker(project=project, data_class=TextData)
 
     def save(self, user: User, batch_size: int = 1000):
-        for records in self.reader.batch(batch_size):
-            examples = Examples(self.example_maker.make(records))
-            examples.save()
+        for records in self.batches(batch_size):
+            self.save_examples(self.example_maker.make_records(records))
 
     @property
     def errors(self) -> List[FileParseException]:
@@ -72,11 +108,19 @@ class DatasetWithSingleLabelType(Dataset):
             column=kwargs.get("column_label") or DEFAULT_LABEL_COLUMN, label_class=self.label_class
         )
 
+    def has_annotations(self, records: List[Dict[Any, Any]]) -> bool:
+        return self.label_maker.resolve_columns(collect_columns(records))
+
     def save(self, user: User, batch_size: int = 1000):
-        for records in self.reader.batch(batch_size):
+        for batch in self.batches(batch_size):
+            if not self.has_annotations(batch):
+                # Plain text without any label column: skip the DataFrame round-trip.
+                self.save_examples(self.example_maker.make_records(batch))
+                continue
+
             # create examples
-            examples = Examples(self.example_maker.make(records))
-            examples.save()
+            records = pd.DataFrame(batch)
+            examples = self.save_examples(self.example_maker.make(records))
 
             # Update LabelMaker with the resolved text column name from ExampleMaker
             # This allows LabelMaker to find the text content for auto-span detection
@@ -107,9 +151,9 @@ class BinaryDataset(Dataset):
         self.example_maker = BinaryExampleMaker(project=project, data_class=BinaryData)
 
     def save(self, user: User, batch_size: int = 1000):
-        for records in self.reader.batch(batch_size):
-            examples = Examples(self.example_maker.make(records))
-            examples.save()
+        for batch in self.batches(batch_size):
+            records = pd.DataFrame(batch)
+            self.save_examples(self.example_maker.make(records))
 
     @property
     def errors(self) -> List[FileParseException]:
@@ -134,11 +178,22 @@ class SequenceLabelingDataset(DatasetWithSingleLabelType):
         # [EXPERIMENTAL-FEATURE]
         self.comment_maker = CommentMaker()
 
+    def has_annotations(self, records: List[Dict[Any, Any]]) -> bool:
+        columns = collect_columns(records)
+        # Resolve both makers so that their column aliases are always set.
+        has_labels = self.label_maker.resolve_columns(columns)
+        has_comments = self.comment_maker.resolve_columns(columns)
+        return has_labels or has_comments
+
     def save(self, user: User, batch_size: int = 1000):
-        for records in self.reader.batch(batch_size):
+        for batch in self.batches(batch_size):
+            if not self.has_annotations(batch):
+                self.save_examples(self.example_maker.make_records(batch))
+                continue
+
             # create examples
-            examples = Examples(self.example_maker.make(records))
-            examples.save()
+            records = pd.DataFrame(batch)
+            examples = self.save_examples(self.example_maker.make(records))
 
             # Update LabelMaker with the resolved text column name from ExampleMaker
             # This allows LabelMaker to find the text content for auto-span detection
@@ -187,10 +242,10 @@ class RelationExtractionDataset(Dataset):
         self.relation_maker = LabelMaker(column="relations", label_class=RelationLabel)
 
     def save(self, user: User, batch_size: int = 1000):
-        for records in self.reader.batch(batch_size):
+        for batch in self.batches(batch_size):
+            records = pd.DataFrame(batch)
             # create examples
-            examples = Examples(self.example_maker.make(records))
-            examples.save()
+            examples = self.save_examples(self.example_maker.make(records))
 
             # create label types
             spans = Spans(self.span_maker.make(records), self.span_types)
@@ -225,10 +280,10 @@ class CategoryAndSpanDataset(Dataset):
         self.span_maker = LabelMaker(column="entities", label_class=SpanLabel)
 
     def save(self, user: User, batch_size: int = 1000):
-        for records in self.reader.batch(batch_size):
+        for batch in self.batches(batch_size):
+            records = pd.DataFrame(batch)
             # create examples
-            examples = Examples(self.example_maker.make(records))
-            examples.save()
+            examples = self.save_examples(self.example_maker.make(records))
 
             # create label types
             categories = Categories(self.category_maker.make(records), self.category_types)
@@ -0,0 +1,95 @@
+import io
+import json
+from typing import Any, List, Sequence
+
+from django.conf import settings
+from django.db import connections, models, router, transaction
+
+
+def can_copy(model, using: str) -> bool:
+    """Returns True if the objects of the model can be inserted with `COPY ... FROM STDIN`."""
+    connection = connections[using]
+    return (
+        settings.ENABLE_COPY_IMPORT
+        and connection.vendor == "postgresql"
+        and isinstance(model._meta.pk, models.AutoField)
+        and not model._meta.parents
+    )
+
+
+def bulk_insert(model, objs: Sequence[models.Model]) -> List[models.Model]:
+    """Inserts the objects and returns them with their primary keys.
+
+    On PostgreSQL with `ENABLE_COPY_IMPORT`, this uses `COPY ... FROM STDIN`.
+    Otherwise, it falls back to the model manager's `bulk_create`.
+    """
+    objs = list(objs)
+    if not objs:
+        return objs
+    using = router.db_for_write(model)
+    if can_copy(model, using):
+        return copy_insert(model, objs, using)
+    return model.objects.bulk_create(objs)
+
+
+def copy_insert(model, objs: List[models.Model], using: str) -> List[models.Model]:
+    """Inserts the objects with `COPY ... FROM STDIN`.
+
+    COPY can't return the generated ids, so they are reserved from the primary key's
+    sequence beforehand and written along with the other columns.
+    """
+    connection = connections[using]
+    opts = model._meta
+    fields = opts.concrete_fields
+    with transaction.atomic(using=using, savepoint=False), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+            [opts.db_table, opts.pk.column, len(objs)],
+        )
+        for obj, (pk,) in zip(objs, cursor.fetchall()):
+            obj.pk = pk
+        buffer = io.StringIO()
+        for obj in objs:
+            values = [to_copy_value(field, field.pre_save(obj, add=True), connection) for field in fields]
+            buffer.write("\t".join(values))
+            buffer.write("\n")
+        buffer.seek(0)
+        table = connection.ops.quote_name(opts.db_table)
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        copy_from(cursor.cursor, f"COPY {table} ({columns}) FROM STDIN", buffer)
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = using
+    return objs
+
+
+def copy_from(cursor, sql: str, buffer: io.StringIO):
+    if hasattr(cursor, "copy_expert"):  # psycopg2
+        cursor.copy_expert(sql, buffer)
+    else:  # psycopg 3
+        with cursor.copy(sql) as copy:
+            copy.write(buffer.getvalue())
+
+
+def to_copy_value(field: models.Field, value: Any, connection) -> str:
+    """Serializes a value into the text format of COPY."""
+    if value is None:
+        return "\\N"
+    if isinstance(field, models.JSONField):
+        text = json.dumps(value, cls=field.encoder)
+    elif isinstance(field, models.BooleanField):
+        text = "t" if value else "f"
+    else:
+        value = field.get_db_prep_save(value, connection)
+        if value is None:
+            return "\\N"
+        text = value.isoformat() if hasattr(value, "isoformat") else str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\b", "\\b")
+        .replace("\f", "\\f")
+        .replace("\v", "\\v")
+    )
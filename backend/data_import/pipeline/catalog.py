@@ -1,9 +1,11 @@
+import importlib.util
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Type
 
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 from typing_extensions import Literal
 
 from .exceptions import FileFormatException
@@ -190,6 +192,16 @@ class CoNLL(Format):
     accept_types = "text/*"
 
 
+class Parquet(Format):
+    name = "Parquet"
+    accept_types = ".parquet, application/vnd.apache.parquet"
+
+
+class Arrow(Format):
+    name = "Arrow"
+    accept_types = ".arrow, .feather, application/vnd.apache.arrow.file, application/vnd.apache.arrow.stream"
+
+
 class ImageFile(Format):
     name = "ImageFile"
     accept_types = "image/png, image/jpeg, image/bmp, image/gif"
@@ -212,6 +224,11 @@ class ArgColumn(BaseModel):
     column_label: str = Field("label", title="Label Column", description="The column name that contains the label.")
 
 
+class ArgColumnarFile(ArgColumn):
+    # Columnar files store text as UTF-8, so there is no encoding to choose.
+    encoding: SkipJsonSchema[encodings] = "utf_8"
+
+
 class ArgDelimiter(ArgColumn):
     encoding: encodings = "utf_8"
     delimiter: Literal[",", "\t", ";", "|", " "] = Field(",", title="Delimiter")
@@ -495,3 +512,32 @@ Options.register(
         file=SPEECH_TO_TEXT_DIR / "audio_files.txt",
     )
 )
+
+# Columnar formats, available if pyarrow is installed (the `arrow` extra)
+columnar_options = [
+    (ProjectType.DOCUMENT_CLASSIFICATION, ArgColumnarFile, TEXT_CLASSIFICATION_DIR),
+    *[(task_id, ArgColumnarFile, SEQUENCE_LABELING_DIR) for task_id in sequence_labeling_tasks],
+    (ProjectType.SEQ2SEQ, ArgColumnarFile, SEQ2SEQ_DIR),
+    (ProjectType.INTENT_DETECTION_AND_SLOT_FILLING, ArgNone, INTENT_DETECTION_DIR),
+]
+if importlib.util.find_spec("pyarrow") is not None:
+    for file_format in [Parquet, Arrow]:
+        for task_id, arg, example_dir in columnar_options:
+            Options.register(
+                Option(
+                    display_name=file_format.name,
+                    task_id=task_id,
+                    file_format=file_format,
+                    arg=arg,
+                    file=example_dir / "columnar.txt",
+                )
+            )
+        Options.register(
+            Option(
+                display_name=f"{file_format.name}(Relation)",
+                task_id=RELATION_EXTRACTION,
+                file_format=file_format,
+                arg=ArgNone,
+                file=RELATION_EXTRACTION_DIR / "columnar.txt",
+            )
+        )
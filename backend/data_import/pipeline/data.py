@@ -20,6 +20,11 @@ class BaseData(BaseModel, abc.ABC):
     def parse(cls, example_uuid: UUID4, filename: str, upload_name: str, text: str = "", **kwargs):
         return cls(uuid=example_uuid, filename=filename, upload_name=upload_name, text=text, meta=kwargs)
 
+    @classmethod
+    def create_from_record(cls, project: Project, example_uuid: UUID4, filename: str, upload_name: str, **kwargs):
+        """Creates an example from a reader record. Subclasses may skip model validation here."""
+        return cls.parse(example_uuid, filename, upload_name, **kwargs).create(project)
+
     def __hash__(self):
         return hash(tuple(self.dict()))
 
@@ -48,6 +53,22 @@ class TextData(BaseData):
             meta=self.meta,
         )
 
+    @classmethod
+    def create_from_record(
+        cls, project: Project, example_uuid: UUID4, filename: str, upload_name: str, text: str = "", **kwargs
+    ) -> Example:
+        # The reader generates the uuid and the maker has already cleaned the text,
+        # so building the model directly is equivalent to `parse(...).create(...)`.
+        cls.text_is_not_empty(text)
+        return Example(
+            uuid=example_uuid,
+            project=project,
+            filename=filename,
+            upload_name=upload_name,
+            text=text,
+            meta=kwargs,
+        )
+
 
 class BinaryData(BaseData):
     def create(self, project: Project) -> Example:
@@ -2,6 +2,7 @@ from typing import Dict, List
 
 from pydantic import UUID4
 
+from .bulk import bulk_insert
 from examples.models import Example
 
 
@@ -16,6 +17,9 @@ class Examples:
     def __contains__(self, uuid: UUID4) -> bool:
         return uuid in self.uuid_to_example
 
+    def __len__(self) -> int:
+        return len(self.uuid_to_example)
+
     def save(self):
-        examples = Example.objects.bulk_create(self.examples)
+        examples = bulk_insert(Example, self.examples)
         self.uuid_to_example = {example.uuid: example for example in examples}
@@ -2,16 +2,19 @@ from .catalog import (
     CSV,
     JSON,
     JSONL,
+    Arrow,
     AudioFile,
     CoNLL,
     Excel,
     FastText,
     Format,
     ImageFile,
+    Parquet,
     TextFile,
     TextLine,
 )
 from .parsers import (
+    ArrowParser,
     CoNLLParser,
     CSVParser,
     ExcelParser,
@@ -19,6 +22,7 @@ from .parsers import (
     JSONLParser,
     JSONParser,
     LineParser,
+    ParquetParser,
     PlainParser,
     TextFileParser,
 )
@@ -34,6 +38,8 @@ def create_parser(file_format: Format, **kwargs):
         FastText.name: FastTextParser,
         Excel.name: ExcelParser,
         CoNLL.name: CoNLLParser,
+        Parquet.name: ParquetParser,
+        Arrow.name: ArrowParser,
         ImageFile.name: PlainParser,
         AudioFile.name: PlainParser,
     }
@@ -2,9 +2,11 @@ import abc
 from itertools import groupby
 from typing import Dict, List, Tuple
 
+from .bulk import bulk_insert
 from .examples import Examples
 from .label import Label
 from .label_types import LabelTypes
+from labels.intervals import IntervalIndex
 from labels.models import Category as CategoryModel
 from labels.models import Label as LabelModel
 from labels.models import Relation as RelationModel
@@ -38,7 +40,7 @@ class Labels(abc.ABC):
             for label in self.labels
             if label.example_uuid in examples
         ]
-        self.label_model.objects.bulk_create(labels)
+        bulk_insert(self.label_model, labels)
 
 
 class Categories(Labels):
@@ -61,11 +63,10 @@ class Spans(Labels):
         spans = []
         groups = groupby(self.labels, lambda label: label.example_uuid)
         for _, group in groups:
-            labels = sorted(group)
-            last_offset = -1
-            for label in labels:
-                if getattr(label, "start_offset") >= last_offset:
-                    last_offset = getattr(label, "end_offset")
+            index = IntervalIndex()
+            for label in sorted(group):
+                if not index.overlaps(label.start_offset, label.end_offset):
+                    index.add(label.start_offset, label.end_offset)
                     spans.append(label)
         self.labels = spans
 
@@ -1,5 +1,5 @@
 import uuid
-from typing import List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Type
 
 import pandas as pd
 from pydantic import UUID4, BaseModel
@@ -10,14 +10,23 @@ from .label import Label
 from .readers import (
     DEFAULT_LABEL_COLUMN,
     DEFAULT_TEXT_COLUMN,
+    FILE_NAME_COLUMN,
     LINE_NUMBER_COLUMN,
     UPLOAD_NAME_COLUMN,
     UUID_COLUMN,
+    collect_columns,
 )
 from examples.models import Comment as CommentModel
 from examples.models import Example
 from projects.models import Project
 
+INTERNAL_COLUMNS = {UPLOAD_NAME_COLUMN, UUID_COLUMN, LINE_NUMBER_COLUMN, FILE_NAME_COLUMN}
+
+
+def is_missing(value: Any) -> bool:
+    """Returns True for values pandas would treat as missing (None and NaN)."""
+    return value is None or (isinstance(value, float) and value != value)
+
 
 class ExampleMaker:
     def __init__(
@@ -92,11 +101,69 @@ class ExampleMaker:
                 continue
         return examples
 
+    def make_records(self, records: List[Dict[Any, Any]]) -> List[Example]:
+        """Makes examples from a batch of raw records without building a DataFrame.
+
+        This is the streaming counterpart of `make`. It applies the same column resolution,
+        merging and empty-text filtering, but works row by row, so plain text imports
+        don't pay for the DataFrame round-trip.
+        """
+        columns = collect_columns(records)
+        upload_names = list(dict.fromkeys(record[UPLOAD_NAME_COLUMN] for record in records))
+        if not self.resolve_columns(columns, upload_names):
+            return []
+
+        raw_columns = self.column_data.replace("，", ",")
+        column_list = [c.strip() for c in raw_columns.split(",")]
+        merged_cols: List[Any] = []
+        if len(column_list) > 1:
+            col_map = {str(c).strip(): c for c in columns}
+            merged_cols = [col_map[c] for c in column_list if c in col_map]
+            if not merged_cols and self.column_data not in columns:
+                available = ", ".join(f"'{c}'" for c in columns if str(c) not in INTERNAL_COLUMNS)
+                message = f"Column(s) '{self.column_data}' not found. Available: {available}"
+                self._errors.append(FileParseException(upload_names[0] if upload_names else "Unknown", 0, message))
+                return []
+
+        examples = []
+        for record in records:
+            row = {key: value for key, value in record.items() if key not in self.exclude_columns}
+            line_num = row.pop(LINE_NUMBER_COLUMN, 0)
+            if merged_cols:
+                value = "\n".join("" if is_missing(row.get(col)) else str(row[col]) for col in merged_cols)
+            else:
+                value = row.pop(self.column_data, None)
+                if is_missing(value):
+                    message = f"Column {self.column_data} not found in record"
+                    self._errors.append(FileParseException(row[UPLOAD_NAME_COLUMN], line_num, message))
+                    continue
+            row.pop(DEFAULT_TEXT_COLUMN, None)  # Replaced by the data column, as in `make`
+            text = str(value).strip()
+            if text == "" or text.lower() in ("nan", "none"):
+                continue
+            try:
+                examples.append(
+                    self.data_class.create_from_record(
+                        self.project,
+                        example_uuid=row.pop(UUID_COLUMN),
+                        filename=row.pop(FILE_NAME_COLUMN),
+                        upload_name=row.pop(UPLOAD_NAME_COLUMN),
+                        text=text,
+                        **row,
+                    )
+                )
+            except ValueError:
+                continue
+        return examples
+
     def check_column_existence(self, df: pd.DataFrame) -> bool:
+        return self.resolve_columns(list(df.columns), df[UPLOAD_NAME_COLUMN].unique())
+
+    def resolve_columns(self, columns: List[Any], upload_names: Iterable[str]) -> bool:
         # 1. Handle wildcard merge (Merge all external columns)
         if self.column_data == "*":
             internal_cols = {UPLOAD_NAME_COLUMN, UUID_COLUMN, LINE_NUMBER_COLUMN, "filename"}
-            external_cols = [c for c in df.columns if c not in internal_cols]
+            external_cols = [c for c in columns if c not in internal_cols]
             if external_cols:
                 self.column_data = ",".join(external_cols)
                 return True
@@ -106,18 +173,18 @@ class ExampleMaker:
         raw_columns = self.column_data.replace("，", ",")
         if "," in raw_columns:
             column_list = [c.strip() for c in raw_columns.split(",")]
-            col_map = {str(c).strip(): c for c in df.columns}
+            col_map = {str(c).strip(): c for c in columns}
 
             # If at least one column matches, we consider it exists and will filter missing ones later in make()
             existing_cols = [col_map[c] for c in column_list if c in col_map]
             if existing_cols:
                 return True
 
-            if self.column_data in df.columns:
+            if self.column_data in columns:
                 return True
 
         # 3. Standard check for single column
-        if self.column_data in df.columns:
+        if self.column_data in columns:
             return True
 
         # 4. Fallback logic for default "text" column
@@ -168,7 +235,7 @@ class ExampleMaker:
 
             # Find all columns that match any alias (case-insensitive)
             matched_cols = []
-            for col in df.columns:
+            for col in columns:
                 if any(alias.lower() == str(col).lower() for alias in aliases):
                     matched_cols.append(col)
 
@@ -179,7 +246,7 @@ class ExampleMaker:
 
             # If no aliases found, try partial matches
             partial_matches = []
-            for col in df.columns:
+            for col in columns:
                 if any(alias.lower() in str(col).lower() for alias in aliases):
                     partial_matches.append(col)
 
@@ -189,7 +256,7 @@ class ExampleMaker:
 
             # Last resort: If multiple external columns exist, merge them all
             internal_cols = {UPLOAD_NAME_COLUMN, UUID_COLUMN, LINE_NUMBER_COLUMN, "filename"}
-            external_cols = [c for c in df.columns if c not in internal_cols]
+            external_cols = [c for c in columns if c not in internal_cols]
             if len(external_cols) > 0:
                 # Merge all external columns as a convenient default
                 self.column_data = ",".join(external_cols)
@@ -197,10 +264,10 @@ class ExampleMaker:
 
         # 4. Error reporting if no column found
         internal_cols = {UPLOAD_NAME_COLUMN, UUID_COLUMN, LINE_NUMBER_COLUMN, "filename"}
-        available_list = [str(c) for c in df.columns if str(c) not in internal_cols]
+        available_list = [str(c) for c in columns if str(c) not in internal_cols]
         available = ", ".join([f"'{c}'" for c in available_list])
         message = f"Column(s) '{self.column_data}' not found. Available: {available}"
-        for filename in df[UPLOAD_NAME_COLUMN].unique():
+        for filename in upload_names:
             self._errors.append(FileParseException(filename, 0, message))
         return False
 
@@ -245,12 +312,7 @@ class CommentMaker:
         self._errors: List[FileParseException] = []
 
     def make(self, df: pd.DataFrame) -> List[CommentData]:
-        # Alias resolution for comment and correction columns
-        self.resolve_column(df, "comment_column", ["comment", "Comment", "批注", "备注", "comments", "Comments"])
-        self.resolve_column(
-            df, "correction_column", ["correction", "Correction", "纠错", "更正", "corrections", "Corrections"]
-        )
-
+        self.resolve_columns(list(df.columns))
         has_comment = self.comment_column in df.columns
         has_correction = self.correction_column in df.columns
 
@@ -275,17 +337,25 @@ class CommentMaker:
                 comments.append(CommentData.parse(row[UUID_COLUMN], full_text))
         return comments
 
-    def resolve_column(self, df: pd.DataFrame, attr_name: str, aliases: List[str]):
+    def resolve_columns(self, columns: List[Any]) -> bool:
+        """Resolves the comment/correction column aliases and tells whether any of them exists."""
+        self.resolve_column(columns, "comment_column", ["comment", "Comment", "批注", "备注", "comments", "Comments"])
+        self.resolve_column(
+            columns, "correction_column", ["correction", "Correction", "纠错", "更正", "corrections", "Corrections"]
+        )
+        return self.comment_column in columns or self.correction_column in columns
+
+    def resolve_column(self, columns: List[Any], attr_name: str, aliases: List[str]):
         current = getattr(self, attr_name)
-        if current in df.columns:
+        if current in columns:
             return
 
         for alias in aliases:
-            if alias in df.columns:
+            if alias in columns:
                 setattr(self, attr_name, alias)
                 return
             # Case insensitive
-            for col in df.columns:
+            for col in columns:
                 if alias.lower() == col.lower():
                     setattr(self, attr_name, col)
                     return
@@ -427,17 +497,20 @@ class LabelMaker:
         return labels
 
     def check_column_existence(self, df: pd.DataFrame) -> bool:
+        return self.resolve_columns(list(df.columns))
+
+    def resolve_columns(self, columns: List[Any]) -> bool:
         # Support comma-separated columns
         raw_columns = self.column.replace("，", ",")
         column_list = [c.strip() for c in raw_columns.split(",")]
-        col_map = {str(c).strip(): c for c in df.columns}
+        col_map = {str(c).strip(): c for c in columns}
 
         if len(column_list) > 1:
             # If any of the columns exist, we consider it valid
             if any(col in col_map for col in column_list):
                 return True
 
-        if self.column not in df.columns:
+        if self.column not in columns:
             # Try to find a fallback column from known aliases
             if self.column == DEFAULT_LABEL_COLUMN:
                 aliases = [
@@ -468,12 +541,12 @@ class LabelMaker:
 
                 # Check for exact matches first
                 for alias in aliases:
-                    if alias in df.columns:
+                    if alias in columns:
                         self.column = alias
                         return True
 
                 # Check for partial matches or case-insensitive matches
-                for col in df.columns:
+                for col in columns:
                     for alias in aliases:
                         if alias.lower() in col.lower():
                             self.column = col
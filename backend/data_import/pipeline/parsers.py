@@ -1,15 +1,23 @@
 import csv
 import io
 import json
+import math
 import os
-from typing import Any, Dict, Iterator, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 import chardet
+import numpy as np
 import pyexcel
 import pyexcel.exceptions
 from chardet import UniversalDetector
 from seqeval.scheme import BILOU, IOB2, IOBES, IOE2, Tokens
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional dependency for the Parquet and Arrow formats.
+    pa = pq = None  # type: ignore
+
 from .exceptions import FileParseException
 from .readers import (
     DEFAULT_LABEL_COLUMN,
@@ -376,3 +384,92 @@ class CoNLLParser(Parser):
             end = start + len(text)
             labels.append((start, end, entity.tag))
         return labels
+
+
+def to_python(value: Any) -> Any:
+    """Converts the arrays and NaNs which pandas makes of nested values back to lists and None."""
+    if isinstance(value, np.ndarray):
+        return [to_python(item) for item in value.tolist()]
+    if isinstance(value, dict):
+        return {key: to_python(item) for key, item in value.items()}
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def column_to_list(column: "pa.Array") -> List[Any]:
+    """Converts a column to Python values, as `to_pylist` does, but a whole column at a time.
+
+    `to_pylist` builds each value of each row one by one, which made a Parquet file slower to import
+    than the same rows in JSONL. Converting through pandas does most of the work in C++.
+    Only the nested and floating point columns need a second pass, for their arrays and NaNs.
+    """
+    values = column.to_pandas(integer_object_nulls=True, timestamp_as_object=True).tolist()
+    if pa.types.is_nested(column.type) or pa.types.is_floating(column.type):
+        return [to_python(value) for value in values]
+    return values
+
+
+def iter_record_batches(batches: Iterable["pa.RecordBatch"]) -> Iterator[Dict[Any, Any]]:
+    """Converts Arrow record batches to rows, column by column, without parsing any text."""
+    line_num = 0
+    for batch in batches:
+        columns = [column_to_list(column) for column in batch.columns]
+        for values in zip(*columns):
+            line_num += 1
+            yield {LINE_NUMBER_COLUMN: line_num, **dict(zip(batch.schema.names, values))}
+
+
+class ParquetParser(Parser):
+    """ParquetParser is a parser to read a Parquet file batch by batch.
+
+    Nested columns, e.g. a list of spans, are read as lists and dictionaries,
+    so they can be imported as labels like the ones in a JSONL file.
+
+    Attributes:
+        batch_size: The number of rows to read at once.
+    """
+
+    def __init__(self, batch_size: int = 1000, **kwargs):
+        self.batch_size = batch_size
+        self._errors: List[FileParseException] = []
+
+    def parse(self, filename: str) -> Iterator[Dict[Any, Any]]:
+        try:
+            batches = pq.ParquetFile(filename).iter_batches(batch_size=self.batch_size)
+            yield from iter_record_batches(batches)
+        except (pa.ArrowException, OSError) as e:
+            self._errors.append(FileParseException(filename, line_num=1, message=str(e)))
+
+    @property
+    def errors(self) -> List[FileParseException]:
+        return self._errors
+
+
+class ArrowParser(Parser):
+    """ArrowParser is a parser to read an Arrow IPC file or stream batch by batch."""
+
+    def __init__(self, **kwargs):
+        self._errors: List[FileParseException] = []
+
+    def parse(self, filename: str) -> Iterator[Dict[Any, Any]]:
+        try:
+            with pa.memory_map(filename) as source:
+                yield from iter_record_batches(self.read_batches(source))
+        except (pa.ArrowException, OSError) as e:
+            self._errors.append(FileParseException(filename, line_num=1, message=str(e)))
+
+    @staticmethod
+    def read_batches(source) -> Iterator["pa.RecordBatch"]:
+        try:
+            reader = pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            source.seek(0)
+            yield from pa.ipc.open_stream(source)
+            return
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+
+    @property
+    def errors(self) -> List[FileParseException]:
+        return self._errors
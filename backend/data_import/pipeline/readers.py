@@ -16,6 +16,11 @@ UUID_COLUMN = "example_uuid"
 LINE_NUMBER_COLUMN = "#line_number"
 
 
+def collect_columns(records: List[Dict[Any, Any]]) -> List[Any]:
+    """Returns the union of the record keys in order of appearance, like `pd.DataFrame(records).columns`."""
+    return list(dict.fromkeys(key for record in records for key in record))
+
+
 class BaseReader(collections.abc.Iterable):
     """Reader has a role to parse files and return a Record iterator."""
 
@@ -37,6 +42,10 @@ class BaseReader(collections.abc.Iterable):
     def batch(self, batch_size: int) -> Iterator[pd.DataFrame]:
         raise NotImplementedError("Please implement this method in the subclass.")
 
+    @abc.abstractmethod
+    def batch_records(self, batch_size: int) -> Iterator[List[Dict[Any, Any]]]:
+        raise NotImplementedError("Please implement this method in the subclass.")
+
 
 class Parser(abc.ABC):
     """The abstract file parser."""
@@ -80,14 +89,23 @@ class Reader(BaseReader):
                 }
 
     def batch(self, batch_size: int) -> Iterator[pd.DataFrame]:
+        for records in self.batch_records(batch_size):
+            yield pd.DataFrame(records)
+
+    def batch_records(self, batch_size: int) -> Iterator[List[Dict[Any, Any]]]:
+        """Yields lists of at most `batch_size` records.
+
+        Only one batch is held in memory at a time, so the memory usage is bounded
+        by the batch size rather than the file size.
+        """
         batch = []
         for record in self:
             batch.append(record)
             if len(batch) == batch_size:
-                yield pd.DataFrame(batch)
+                yield batch
                 batch = []
         if batch:
-            yield pd.DataFrame(batch)
+            yield batch
 
     @property
     def errors(self) -> List[FileParseException]:
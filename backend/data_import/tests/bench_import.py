@@ -0,0 +1,113 @@
+"""Benchmarks for the import pipeline."""
+import json
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from api.tests.bench import BENCH_ROWS, measure, report
+from data_import.pipeline.bulk import bulk_insert
+from data_import.pipeline.data import TextData
+from data_import.pipeline.label import SpanLabel
+from data_import.pipeline.makers import ExampleMaker, LabelMaker
+from data_import.pipeline.parsers import JSONLParser, ParquetParser, pa, pq
+from data_import.pipeline.readers import FileName, Reader
+from examples.models import Example
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+
+BATCH_SIZE = 1000
+
+
+class BenchJSONLImport(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for i in range(BENCH_ROWS):
+                f.write(json.dumps({"text": f"example {i} " * 8, "source": "bench"}) + "\n")
+        self.filenames = [FileName(full_path=self.path, generated_name="bench.jsonl", upload_name="bench.jsonl")]
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def make_reader(self):
+        return Reader(self.filenames, JSONLParser(encoding="utf_8"))
+
+    def run_dataframe(self):
+        maker = ExampleMaker(self.project.item, TextData)
+        return sum(len(maker.make(df)) for df in self.make_reader().batch(BATCH_SIZE))
+
+    def run_records(self):
+        maker = ExampleMaker(self.project.item, TextData)
+        return sum(len(maker.make_records(records)) for records in self.make_reader().batch_records(BATCH_SIZE))
+
+    def test_dataframe_vs_records(self):
+        # The record path runs first so that the process max RSS reflects it before pandas grows the heap.
+        records = measure(self.run_records)
+        dataframe = measure(self.run_dataframe)
+        report("records", *records)
+        report("dataframe", *dataframe)
+        self.assertEqual(records[0], dataframe[0])
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class BenchParquetImport(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.SEQUENCE_LABELING)
+        self.dirpath = tempfile.mkdtemp()
+        rows = [
+            {"text": f"example {i} " * 8, "label": [{"start_offset": 0, "end_offset": 7, "label": "ORG"}]}
+            for i in range(BENCH_ROWS)
+        ]
+        self.paths = {
+            "jsonl": os.path.join(self.dirpath, "bench.jsonl"),
+            "parquet": os.path.join(self.dirpath, "bench.parquet"),
+        }
+        with open(self.paths["jsonl"], "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+        pq.write_table(pa.Table.from_pylist(rows), self.paths["parquet"])
+
+    def tearDown(self):
+        for path in self.paths.values():
+            os.remove(path)
+        os.rmdir(self.dirpath)
+
+    def run_parser(self, name, parser):
+        filenames = [FileName(full_path=self.paths[name], generated_name=name, upload_name=name)]
+        maker = LabelMaker(column="label", label_class=SpanLabel)
+        reader = Reader(filenames, parser)
+        return sum(len(maker.make(pd.DataFrame(records))) for records in reader.batch_records(BATCH_SIZE))
+
+    def test_jsonl_vs_parquet(self):
+        jsonl = measure(lambda: self.run_parser("jsonl", JSONLParser(encoding="utf_8")))
+        parquet = measure(lambda: self.run_parser("parquet", ParquetParser(batch_size=BATCH_SIZE)))
+        report("jsonl", *jsonl)
+        report("parquet", *parquet)
+        self.assertEqual(jsonl[0], parquet[0])
+
+
+class BenchBulkInsert(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+
+    def insert(self):
+        rows = 0
+        for start in range(0, BENCH_ROWS, BATCH_SIZE):
+            stop = min(start + BATCH_SIZE, BENCH_ROWS)
+            examples = [Example(project=self.project.item, text=f"example {i}") for i in range(start, stop)]
+            rows += len(bulk_insert(Example, examples))
+        return rows
+
+    def run_insert(self, name, enable_copy):
+        with override_settings(ENABLE_COPY_IMPORT=enable_copy):
+            report(name, *measure(self.insert))
+
+    def test_orm_vs_copy(self):
+        self.run_insert("orm", False)
+        if connection.vendor == "postgresql":
+            self.run_insert("copy", True)
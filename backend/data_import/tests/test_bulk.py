@@ -0,0 +1,80 @@
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+from django.db import connection, connections, models
+from django.test import TestCase, override_settings
+
+from data_import.pipeline.bulk import bulk_insert, can_copy, copy_insert, to_copy_value
+from examples.models import Example
+from examples.search import search_examples
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+
+
+class TestCopyValue(TestCase):
+    def test_escapes_special_characters(self):
+        value = to_copy_value(models.TextField(), "a\tb\nc\\d", connections["default"])
+        self.assertEqual(value, "a\\tb\\nc\\\\d")
+
+    def test_null(self):
+        self.assertEqual(to_copy_value(models.TextField(), None, connections["default"]), "\\N")
+
+    def test_json(self):
+        value = to_copy_value(models.JSONField(), {"a": "b\tc"}, connections["default"])
+        self.assertEqual(value, '{"a": "b\\\\tc"}')
+
+    def test_boolean(self):
+        self.assertEqual(to_copy_value(models.BooleanField(), True, connections["default"]), "t")
+
+
+class TestBulkInsert(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = [Example(project=self.project.item, text=text) for text in ["A", "B"]]
+
+    @override_settings(ENABLE_COPY_IMPORT=True)
+    def test_falls_back_to_orm_except_postgresql(self):
+        self.assertFalse(can_copy(Example, "default"))
+        examples = bulk_insert(Example, self.examples)
+        self.assertEqual([example.pk for example in examples], list(Example.objects.values_list("pk", flat=True)))
+
+    @patch("data_import.pipeline.bulk.copy_from")
+    def test_copy_insert_writes_reserved_ids(self, copy_from):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(10,), (11,)]
+        with patch.object(connections["default"], "cursor") as make_cursor:
+            make_cursor.return_value.__enter__.return_value = cursor
+            examples = copy_insert(Example, self.examples, "default")
+
+        self.assertEqual([example.pk for example in examples], [10, 11])
+        self.assertFalse(examples[0]._state.adding)
+        sql, buffer = copy_from.call_args[0][1:]
+        self.assertTrue(sql.startswith('COPY "examples_example" ("id", "uuid", "meta"'))
+        rows = [line.split("\t") for line in buffer.getvalue().splitlines()]
+        self.assertEqual([row[0] for row in rows], ["10", "11"])
+        self.assertEqual(len(rows[0]), len(Example._meta.concrete_fields))
+
+
+@skipUnless(connection.vendor == "postgresql", "COPY is only used on PostgreSQL.")
+class TestCopyInsertOnPostgreSQL(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+
+    def test_reads_back_copied_examples(self):
+        values = [
+            ("tab\there", {"line": "new\nline", "path": "C:\\dir", "nested": [1, None, {"quote": '"'}]}),
+            ("back\\slash \\N and\r\nnewlines", {}),
+            (None, {"empty": ""}),
+        ]
+        examples = [Example(project=self.project.item, text=text, meta=meta) for text, meta in values]
+        examples = copy_insert(Example, examples, "default")
+
+        saved = Example.objects.filter(pk__in=[example.pk for example in examples]).order_by("pk")
+        self.assertEqual([(example.text, example.meta) for example in saved], values)
+        self.assertEqual([example.uuid for example in saved], [example.uuid for example in examples])
+        self.assertEqual([example.pk for example in saved], sorted(example.pk for example in examples))
+        # The ids were taken from the sequence, so the next insert doesn't collide with them.
+        created = Example.objects.create(project=self.project.item, text="next")
+        self.assertGreater(created.pk, max(example.pk for example in examples))
+        # The search index of the table covers the copied rows.
+        self.assertEqual(list(search_examples(self.project.item.examples.all(), "tab")), [saved[0]])
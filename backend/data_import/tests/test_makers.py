@@ -49,6 +49,35 @@ class TestExamplesMaker(TestCase):
         self.assertEqual(len(examples), 0)
         self.assertEqual(len(self.maker.errors), 1)
 
+    def test_make_examples_from_records(self):
+        examples = self.maker.make_records([self.record])
+        self.assertEqual(len(examples), 1)
+        self.assertEqual(examples[0].text, "text1")
+        self.assertEqual(examples[0].uuid, self.record[UUID_COLUMN])
+        self.assertEqual(examples[0].meta, {})
+
+    def test_make_records_keeps_extra_columns_as_meta(self):
+        self.record["source"] = "wiki"
+        examples = self.maker.make_records([self.record])
+        self.assertEqual(examples[0].meta, {"source": "wiki"})
+
+    def test_make_records_skips_empty_text(self):
+        self.record[self.text_column] = "  "
+        examples = self.maker.make_records([self.record])
+        self.assertEqual(len(examples), 0)
+
+    def test_make_records_merges_multiple_columns(self):
+        maker = ExampleMaker(self.project.item, TextData, "title,body")
+        self.record.update({"title": "A", "body": None})
+        examples = maker.make_records([self.record])
+        self.assertEqual(examples[0].text, "A")
+
+    def test_make_records_reports_missing_value(self):
+        record = {**self.record, UUID_COLUMN: uuid.uuid4(), self.text_column: None, LINE_NUMBER_COLUMN: 2}
+        examples = self.maker.make_records([self.record, record])
+        self.assertEqual(len(examples), 1)
+        self.assertEqual(len(self.maker.errors), 1)
+
 
 class TestLabelFormatter(TestCase):
     def setUp(self):
@@ -126,3 +126,59 @@ Blackburn\tI-PER
             {"text": "Peter Blackburn", "label": [(0, 15, "PER")]},
         ]
         self.assert_record(content, parser, expected)
+
+
+@unittest.skipIf(parsers.pa is None, "pyarrow is not installed")
+class TestParquetParser(TestParser):
+    def setUp(self):
+        super().setUp()
+        self.rows = [
+            {"text": "exampleA", "label": [{"start_offset": 0, "end_offset": 1, "label": "LOC"}]},
+            {"text": "exampleB", "label": []},
+        ]
+
+    def test_read_batches(self):
+        parsers.pq.write_table(parsers.pa.Table.from_pylist(self.rows), self.test_file)
+        parser = parsers.ParquetParser(batch_size=1)
+        rows = list(parser.parse(self.test_file))
+        self.assertEqual([row.pop(LINE_NUMBER_COLUMN) for row in rows], [1, 2])
+        self.assertEqual(rows, self.rows)
+
+    def test_read_nulls_and_nested_values_as_to_pylist(self):
+        table = parsers.pa.Table.from_pylist(
+            [
+                {"text": "exampleA", "score": 0.5, "count": 1, "meta": {"tags": ["a", None], "weights": [1.5, None]}},
+                {"text": None, "score": None, "count": None, "meta": None},
+            ]
+        )
+        parsers.pq.write_table(table, self.test_file)
+        rows = list(parsers.ParquetParser().parse(self.test_file))
+        for row in rows:
+            row.pop(LINE_NUMBER_COLUMN)
+        self.assertEqual(rows, table.to_pylist())
+        self.assertEqual([type(row["count"]) for row in rows], [int, type(None)])
+
+    def test_invalid_file(self):
+        self.create_file("example")
+        parser = parsers.ParquetParser()
+        self.assertEqual(list(parser.parse(self.test_file)), [])
+        self.assertEqual(len(parser.errors), 1)
+
+
+@unittest.skipIf(parsers.pa is None, "pyarrow is not installed")
+class TestArrowParser(TestParser):
+    def setUp(self):
+        super().setUp()
+        self.table = parsers.pa.Table.from_pylist([{"text": "exampleA"}, {"text": "exampleB"}])
+
+    def test_read_file(self):
+        with parsers.pa.ipc.new_file(self.test_file, self.table.schema) as writer:
+            writer.write_table(self.table)
+        parser = parsers.ArrowParser()
+        self.assertEqual([row["text"] for row in parser.parse(self.test_file)], ["exampleA", "exampleB"])
+
+    def test_read_stream(self):
+        with parsers.pa.ipc.new_stream(self.test_file, self.table.schema) as writer:
+            writer.write_table(self.table)
+        parser = parsers.ArrowParser()
+        self.assertEqual([row["text"] for row in parser.parse(self.test_file)], ["exampleA", "exampleB"])
@@ -15,7 +15,7 @@ from data_import.pipeline.readers import (
 class TestReader(unittest.TestCase):
     def setUp(self):
         self.parser = MagicMock()
-        self.parser.parse.return_value = [{"a": 1}, {"a": 2}]
+        self.parser.parse_item.return_value = [{"a": 1}, {"a": 2}]
         filename = MagicMock()
         filename.generated_name = "filename"
         filename.upload_name = "upload_name"
@@ -49,3 +49,10 @@ class TestReader(unittest.TestCase):
         batch = next(reader.batch(2))
         expected_df = pd.DataFrame(self.rows)
         assert_frame_equal(batch, expected_df)
+
+    @patch("data_import.pipeline.readers.uuid.uuid4")
+    def test_batch_records(self, mock):
+        mock.return_value = "uuid"
+        reader = Reader(self.filenames, self.parser)
+        batches = list(reader.batch_records(1))
+        self.assertEqual(batches, [[self.rows[0]], [self.rows[1]]])
@@ -1,17 +1,28 @@
 import os
 import pathlib
 import shutil
+import unittest
+from unittest import mock
 
 from django.core.files import File
 from django.test import TestCase, override_settings
+from django.utils import timezone
 from django_drf_filepond.models import StoredUpload, TemporaryUpload
 from django_drf_filepond.utils import _get_file_id
 
-from data_import.celery_tasks import import_dataset
-from data_import.pipeline.catalog import RELATION_EXTRACTION
+from data_import.celery_tasks import (
+    dispatch_import,
+    import_dataset,
+    order_examples_by_file,
+)
+from data_import.datasets import load_dataset
+from data_import.pipeline.catalog import RELATION_EXTRACTION, TextLine
+from data_import.pipeline.parsers import pa
+from data_import.pipeline.readers import FileName
 from examples.models import Example
 from label_types.models import SpanType
 from labels.models import Category, Span
+from metrics.models import ProjectProgress
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
@@ -209,6 +220,14 @@ class TestImportSequenceLabelingData(TestImportData):
         response = self.import_dataset(filename, file_format, self.task)
         self.assert_parse_error(response)
 
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_parquet(self):
+        filename = "sequence_labeling/example.parquet"
+        file_format = "Parquet"
+        dataset = [("exampleA", [[0, 1, "LOC"]]), ("exampleB", [])]
+        self.import_dataset(filename, file_format, self.task)
+        self.assert_examples(dataset)
+
     def test_jsonl_with_overlapping(self):
         filename = "sequence_labeling/example_overlapping.jsonl"
         file_format = "JSONL"
@@ -329,3 +348,72 @@ class TestFileTypeChecking(TestImportData):
         response = self.import_dataset(filename, file_format, self.task)
         self.assertEqual(len(response["error"]), 1)
         self.assertIn("unexpected", response["error"][0]["message"])
+
+
+@override_settings(MEDIA_ROOT=os.path.join(os.path.dirname(__file__), "data"), ENABLE_PARALLEL_IMPORT=True)
+class TestParallelImport(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.SEQ2SEQ)
+        self.user = self.project.admin
+        self.data_path = pathlib.Path(__file__).parent / "data"
+        self.upload_ids = []
+        # Restored by a cleanup, which runs even if the test or the rest of setUp errors.
+        conf = import_dataset.app.conf
+        self.addCleanup(setattr, conf, "task_always_eager", conf.task_always_eager)
+        conf.task_always_eager = True
+
+    def tearDown(self):
+        for su in StoredUpload.objects.filter(upload_id__in=self.upload_ids):
+            shutil.rmtree(pathlib.Path(su.get_absolute_file_path()).parent)
+
+    def upload(self, filename):
+        upload_id = _get_file_id()
+        TemporaryUpload.objects.create(
+            upload_id=upload_id,
+            file_id=_get_file_id(),
+            file=File(open(self.data_path / filename, mode="rb"), filename.split("/")[-1]),
+            upload_name=filename,
+            upload_type="F",
+        )
+        self.upload_ids.append(upload_id)
+
+    def test_imports_each_file(self):
+        self.upload("seq2seq/example.jsonl")
+        self.upload("example.txt")
+        result = dispatch_import(self.user.id, self.project.item.id, "JSONL", self.upload_ids, ProjectType.SEQ2SEQ)
+        texts = list(Example.objects.values_list("text", flat=True))
+        self.assertEqual(texts[:2], ["exampleA", "exampleB"])
+        self.assertEqual(len(texts), 2)
+        self.assertGreaterEqual(len(result.get()["error"]), 1)
+
+    def test_adds_imported_examples_to_progress_once(self):
+        ProjectProgress.objects.measure(self.project.item.id)
+        self.upload("seq2seq/example.jsonl")
+        self.upload("seq2seq/example.csv")
+        with mock.patch.object(ProjectProgress.objects, "rebuild") as rebuild:
+            dispatch_import(self.user.id, self.project.item.id, "JSONL", self.upload_ids[:1], ProjectType.SEQ2SEQ)
+            dispatch_import(self.user.id, self.project.item.id, "JSONL", self.upload_ids, ProjectType.SEQ2SEQ)
+        rebuild.assert_not_called()
+        self.assertEqual(ProjectProgress.objects.measure(self.project.item.id)["total"], Example.objects.count())
+
+    def test_keeps_file_order(self):
+        self.upload("seq2seq/example.jsonl")
+        self.upload("seq2seq/example.csv")
+        filenames = [tu.file.name for tu in TemporaryUpload.objects.filter(upload_id__in=self.upload_ids)]
+        first = Example.objects.create(project=self.project.item, text="A", filename=filenames[0])
+        second = Example.objects.create(project=self.project.item, text="B", filename=filenames[1])
+        Example.objects.filter(pk=first.pk).update(created_at=timezone.now())
+        order_examples_by_file(self.project.item.id, filenames)
+        self.assertEqual(list(Example.objects.values_list("pk", flat=True)), [first.pk, second.pk])
+
+
+class TestQueriesPerBatch(TestCase):
+    def test_query_count_does_not_grow_with_batches(self):
+        project = prepare_project(ProjectType.SEQ2SEQ)
+        path = str(pathlib.Path(__file__).parent / "data" / "example.txt")
+        filenames = [FileName(full_path=path, generated_name="example.txt", upload_name="example.txt")]
+        dataset = load_dataset(ProjectType.SEQ2SEQ, TextLine(), filenames, project.item)
+        dataset.save(project.admin, batch_size=1)
+        # One INSERT per batch, without selecting the examples back.
+        self.assertEqual(len(dataset.query_counts), 4)
+        self.assertLessEqual(max(dataset.query_counts), 1)
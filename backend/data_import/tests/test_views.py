@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 
@@ -19,3 +21,10 @@ class TestImportCatalog(CRUDMixin):
     def test_denies_project_staff_to_list_catalog(self):
         for member in self.project.staffs:
             self.assert_fetch(member, status.HTTP_403_FORBIDDEN)
+
+    def test_fetches_project_once(self):
+        self.client.force_login(self.project.admin)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+        queries = [q["sql"] for q in context.captured_queries if 'FROM "projects_project"' in q["sql"]]
+        self.assertEqual(len(queries), 1)
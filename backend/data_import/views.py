@@ -1,25 +1,22 @@
 import pandas as pd
-from django.shortcuts import get_object_or_404
 from django_drf_filepond.models import TemporaryUpload
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .celery_tasks import import_dataset
+from .celery_tasks import dispatch_import
 from .pipeline.catalog import Options
-from projects.models import Project
+from projects.mixins import ProjectMixin
 from projects.permissions import IsProjectAdmin
 
 
-class DatasetCatalog(APIView):
+class DatasetCatalog(ProjectMixin, APIView):
     permission_classes = [IsAuthenticated & IsProjectAdmin]
 
     def get(self, request, *args, **kwargs):
-        project_id = kwargs["project_id"]
-        project = get_object_or_404(Project, pk=project_id)
-        use_relation = getattr(project, "use_relation", False)
-        options = Options.filter_by_task(project.project_type, use_relation)
+        use_relation = getattr(self.project, "use_relation", False)
+        options = Options.filter_by_task(self.project.project_type, use_relation)
         return Response(data=options, status=status.HTTP_200_OK)
 
 
@@ -30,7 +27,7 @@ class DatasetImportAPI(APIView):
         upload_ids = request.data.pop("uploadIds")
         file_format = request.data.pop("format")
         task = request.data.pop("task")
-        celery_task = import_dataset.delay(
+        celery_task = dispatch_import(
             user_id=request.user.id,
             project_id=self.kwargs["project_id"],
             file_format=file_format,
@@ -1,7 +1,34 @@
-from django.db.models import Count, Q, QuerySet
-from django_filters.rest_framework import BooleanFilter, CharFilter, FilterSet
+from functools import reduce
+from operator import or_
+from typing import Dict, Optional, Type
 
-from .models import Example
+from django.db.models import Exists, Model, OuterRef, Q, QuerySet
+from django_filters.rest_framework import (
+    BooleanFilter,
+    CharFilter,
+    DjangoFilterBackend,
+    FilterSet,
+)
+
+from .models import Example, ExampleState
+from labels.models import (
+    BoundingBox,
+    Category,
+    Relation,
+    Segmentation,
+    Span,
+    select_label_models,
+)
+from projects.models import Project
+
+# The label models which are searched by label name, with the name of their label type field.
+LABEL_TYPE_FIELDS: Dict[Type[Model], str] = {
+    Category: "label",
+    Span: "label",
+    Relation: "type",
+    BoundingBox: "label",
+    Segmentation: "label",
+}
 
 
 class ExampleFilter(FilterSet):
@@ -9,32 +36,38 @@ class ExampleFilter(FilterSet):
     label = CharFilter(method="filter_by_label")
     assignee = CharFilter(method="filter_by_assignee")
 
-    def filter_by_state(self, queryset, field_name, is_confirmed: bool):
-        queryset = queryset.annotate(
-            num_confirm=Count(
-                expression=field_name,
-                filter=Q(**{f"{field_name}__confirmed_by": self.request.user})
-                | Q(project__collaborative_annotation=True),
-            )
-        )
-        if is_confirmed:
-            queryset = queryset.filter(num_confirm__gte=1)
+    def __init__(self, data=None, queryset=None, *, request=None, prefix=None, project: Optional[Project] = None):
+        super().__init__(data=data, queryset=queryset, request=request, prefix=prefix)
+        self.project = project
+
+    def filter_by_state(self, queryset: QuerySet, field_name: str, is_confirmed: bool) -> QuerySet:
+        """Filter examples confirmed by the user, or by anyone in a collaborative project.
+
+        The states are looked up by `EXISTS` subqueries, which use the index of
+        the unique (example, confirmed_by) pair, instead of counting the states of every example.
+        """
+        states = ExampleState.objects.filter(example=OuterRef("pk"))
+        confirmed_by_user = Exists(states.filter(confirmed_by=self.request.user))
+        if self.project is None:
+            confirmed = Q(confirmed_by_user) | Q(Exists(states), project__collaborative_annotation=True)
+        elif self.project.collaborative_annotation:
+            confirmed = Q(Exists(states))
         else:
-            queryset = queryset.filter(num_confirm__lte=0)
-        return queryset
+            confirmed = Q(confirmed_by_user)
+        return queryset.filter(confirmed if is_confirmed else ~confirmed)
 
     def filter_by_label(self, queryset: QuerySet, field_name: str, label: str) -> QuerySet:
         """Filter examples by a given label name.
 
-        This performs filtering on all of the following labels at once:
+        Only the label tables used by the project's type are searched, each by an `EXISTS` subquery,
+        so that an example is neither repeated nor joined with all of its labels.
+        Without a project, every label table is searched:
         - categories
         - spans
         - relations
         - bboxes
         - segmentations
 
-        Todo: Consider project type to make filtering more efficient.
-
         Args:
             queryset (QuerySet): QuerySet to filter.
             field_name (str): This equals to `label`.
@@ -43,14 +76,15 @@ class ExampleFilter(FilterSet):
         Returns:
             QuerySet: Filtered examples.
         """
-        queryset = queryset.filter(
-            Q(categories__label__text=label)
-            | Q(spans__label__text=label)
-            | Q(relations__type__text=label)
-            | Q(bboxes__label__text=label)
-            | Q(segmentations__label__text=label)
-        )
-        return queryset
+        models = LABEL_TYPE_FIELDS if self.project is None else select_label_models(self.project)
+        conditions = [
+            Exists(model.objects.filter(example=OuterRef("pk"), **{f"{LABEL_TYPE_FIELDS[model]}__text": label}))
+            for model in models
+            if model in LABEL_TYPE_FIELDS
+        ]
+        if not conditions:
+            return queryset.none()
+        return queryset.filter(reduce(or_, conditions))
 
     def filter_by_assignee(self, queryset: QuerySet, field_name: str, assignee: str) -> QuerySet:
         return queryset.filter(assignments__assignee__username=assignee)
@@ -58,3 +92,10 @@ class ExampleFilter(FilterSet):
     class Meta:
         model = Example
         fields = ("project", "text", "created_at", "updated_at", "label", "assignee")
+
+
+class ExampleFilterBackend(DjangoFilterBackend):
+    """Gives `ExampleFilter` the project of the view."""
+
+    def get_filterset_kwargs(self, request, queryset, view):
+        return {**super().get_filterset_kwargs(request, queryset, view), "project": view.project}
@@ -1,13 +1,22 @@
+from django.db import connections
 from django.db.models import Count, Manager
+from django.utils import timezone
 
 
 class ExampleManager(Manager):
     def bulk_create(self, objs, batch_size=None, ignore_conflicts=False):
-        super().bulk_create(objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+        objs = super().bulk_create(objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+        # Backends that support RETURNING (PostgreSQL, SQLite 3.35+, MariaDB 10.5+) have already set the primary keys.
+        if connections[self.db].features.can_return_rows_from_bulk_insert and not ignore_conflicts:
+            return objs
         uuids = [data.uuid for data in objs]
         examples = self.in_bulk(uuids, field_name="uuid")
         return [examples[uid] for uid in uuids]
 
+    def touch(self, ids):
+        """Marks the examples as updated, e.g. when their labels are deleted."""
+        return self.filter(pk__in=ids).update(updated_at=timezone.now())
+
 
 class ExampleStateManager(Manager):
     def count_done(self, examples, user=None):
@@ -30,3 +39,20 @@ class ExampleStateManager(Manager):
             if member.username not in members_with_progress:
                 response["progress"].append({"user": member.username, "done": 0})
         return response
+
+
+class DeletedExampleManager(Manager):
+    def record(self, examples, batch_size=1000):
+        """Keeps the ids of the examples to be deleted, so that incremental exports can report them.
+
+        Only the projects exported incrementally before, which have a watermark, need them:
+        the first incremental export of a project contains all of its examples.
+        """
+        deleted = []
+        examples = examples.filter(project__export_watermark__isnull=False)
+        for example_id, project_id, uuid in examples.values_list("id", "project_id", "uuid").iterator():
+            deleted.append(self.model(example_id=example_id, project_id=project_id, uuid=uuid))
+            if len(deleted) == batch_size:
+                self.bulk_create(deleted)
+                deleted = []
+        self.bulk_create(deleted)
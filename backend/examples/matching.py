@@ -0,0 +1,211 @@
+"""Finds the matches of a literal or regex query in the text of examples.
+
+The offsets are counted like the spans of the project: in code points, or in grapheme clusters
+if the project's `grapheme_mode` is on, so that a match can be labeled as it is.
+Each text gets an `OffsetIndex`, which converts code point offsets to lines and clusters.
+The indexes and the matches are cached per example and version (`updated_at`),
+so moving back and forth between the matches of a long document doesn't scan it again.
+
+Python's `re` can't be interrupted, so user regexes are bounded by their length and by a deadline,
+which is checked after each match: a scan stops with the matches found before it.
+"""
+import math
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Pattern, Tuple
+
+MAX_MATCHES = 10000
+MAX_QUERY_LENGTH = 200
+# Seconds to find the matches of a request in, and total number of matches to keep cached
+MATCH_TIME_LIMIT = 1.0
+MAX_CACHED_MATCHES = 100000
+
+ZWJ = "\u200d"
+CANDIDATES = re.compile(r"[^\x00-\x7f]|\r\n")
+
+
+class LRUCache:
+    """A thread-safe mapping which forgets the least recently used entries beyond `maxsize`.
+
+    The size of an entry is 1, or `sizeof(value)` to bound the cache by the total size of its values.
+    """
+
+    def __init__(self, maxsize: int, sizeof: Optional[Callable[[Any], int]] = None):
+        self.maxsize = maxsize
+        self.sizeof = sizeof or (lambda value: 1)
+        self.size = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            if key in self._entries:
+                self.size -= self.sizeof(self._entries[key])
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self.size += self.sizeof(value)
+            while self.size > self.maxsize:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= self.sizeof(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+def is_regional_indicator(char: str) -> bool:
+    return "\U0001f1e6" <= char <= "\U0001f1ff"
+
+
+def extends_cluster(char: str, previous: str) -> bool:
+    """Whether `char` belongs to the grapheme cluster of the character before it.
+
+    This follows the main rules of Unicode's extended grapheme clusters (UAX #29):
+    CR LF, combining and spacing marks, Hangul jamo, emoji modifiers, tags and ZWJ sequences.
+    Regional indicators are paired by the caller.
+    """
+    if char == "\n":
+        return previous == "\r"
+    code = ord(char)
+    return (
+        unicodedata.category(char) in ("Mn", "Me", "Mc")
+        or char == ZWJ
+        or previous == ZWJ
+        or 0x1160 <= code <= 0x11FF
+        or 0xD7B0 <= code <= 0xD7FF
+        or 0x1F3FB <= code <= 0x1F3FF
+        or 0xE0020 <= code <= 0xE007F
+    )
+
+
+def find_extenders(text: str) -> List[int]:
+    """Returns the offsets of the code points which don't start a grapheme cluster."""
+    extenders = []
+    regional_indicators = 0
+    last = -1
+    for match in CANDIDATES.finditer(text):
+        i = match.end() - 1
+        char = text[i]
+        previous = text[i - 1] if i else ""
+        if is_regional_indicator(char):
+            # Flags are pairs of regional indicators, so every second one of a run extends the first.
+            regional_indicators = regional_indicators + 1 if last == i - 1 else 1
+            if regional_indicators % 2 == 0:
+                extenders.append(i)
+        elif i and extends_cluster(char, previous):
+            extenders.append(i)
+        last = i
+    return extenders
+
+
+class OffsetIndex:
+    """Converts the code point offsets of a text into the offsets of spans and lines.
+
+    Only the offsets of the line starts and of the code points which don't start a cluster are
+    kept, so that a conversion is a binary search. For most texts, the latter list is empty.
+
+    Examples:
+        >>> index = OffsetIndex("e\\u0301\\nx", graphemes=True)
+        >>> index.to_start(3), index.line(3), index.column(3)
+        (2, 1, 0)
+    """
+
+    def __init__(self, text: str, graphemes: bool = False):
+        self.line_starts = [0] + [match.end() for match in re.finditer("\n", text)]
+        self.extenders = find_extenders(text) if graphemes and not text.isascii() else []
+
+    def to_start(self, offset: int) -> int:
+        # A match starting inside a cluster starts with the cluster.
+        return offset - bisect_right(self.extenders, offset)
+
+    def to_end(self, offset: int) -> int:
+        return offset - bisect_left(self.extenders, offset)
+
+    def line(self, offset: int) -> int:
+        return bisect_right(self.line_starts, offset) - 1
+
+    def column(self, offset: int) -> int:
+        return self.to_start(offset) - self.to_start(self.line_starts[self.line(offset)])
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(query: str, regex: bool = False, case_sensitive: bool = False) -> Pattern:
+    """Compiles the query, raising `re.error` if it's an invalid regex."""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(query if regex else re.escape(query), flags | re.MULTILINE)
+
+
+offset_indexes = LRUCache(maxsize=32)
+# Empty results count as one match, so that texts without matches are bounded too.
+match_results = LRUCache(maxsize=MAX_CACHED_MATCHES, sizeof=lambda matches: max(len(matches), 1))
+
+
+def get_offset_index(key: Hashable, text: str, graphemes: bool) -> OffsetIndex:
+    index = offset_indexes.get((key, graphemes))
+    if index is None:
+        index = OffsetIndex(text, graphemes)
+        offset_indexes.set((key, graphemes), index)
+    return index
+
+
+def find_matches(
+    text: str, pattern: Pattern, index: OffsetIndex, deadline: float = math.inf
+) -> Tuple[List[Dict[str, int]], bool]:
+    """Returns the offsets of the first `MAX_MATCHES` non-empty matches of the pattern.
+
+    The second value is whether the scan was stopped by the deadline, a `time.monotonic()` value.
+    """
+    matches = []
+    for match in pattern.finditer(text):
+        if time.monotonic() > deadline:
+            return matches, True
+        start, end = match.span()
+        if start == end:
+            continue
+        matches.append(
+            {
+                "start_offset": index.to_start(start),
+                "end_offset": index.to_end(end),
+                "line": index.line(start),
+                "column": index.column(start),
+            }
+        )
+        if len(matches) == MAX_MATCHES:
+            break
+    return matches, False
+
+
+def get_cached_matches(key: Hashable, pattern: Pattern, graphemes: bool) -> Optional[List[Dict[str, int]]]:
+    """Returns the matches of a text version, identified by `key`, if they are cached."""
+    return match_results.get((key, pattern.pattern, pattern.flags, graphemes))
+
+
+def get_matches(
+    key: Hashable, text: str, pattern: Pattern, graphemes: bool, deadline: float = math.inf
+) -> Tuple[List[Dict[str, int]], bool]:
+    """Returns the matches of the text, whose version is `key`, and whether the deadline stopped the scan.
+
+    The text must be the one of the version. The matches found before the deadline aren't cached.
+    """
+    matches = get_cached_matches(key, pattern, graphemes)
+    if matches is not None:
+        return matches, False
+    if time.monotonic() > deadline:
+        return [], True
+    matches, timed_out = find_matches(text, pattern, get_offset_index(key, text, graphemes), deadline)
+    if not timed_out:
+        match_results.set((key, pattern.pattern, pattern.flags, graphemes), matches)
+    return matches, timed_out
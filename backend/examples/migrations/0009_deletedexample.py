@@ -0,0 +1,32 @@
+# Generated by Django 4.1.13 on 2026-10-18 14:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0010_attachment"),
+        ("examples", "0008_assignment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeletedExample",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("example_id", models.BigIntegerField()),
+                ("uuid", models.UUIDField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deleted_examples",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.1.13 on 2026-10-18 15:01
+
+import random
+
+from django.db import migrations, models
+
+import examples.models
+
+
+# Uniform numbers in [0, 1) for every row in one statement. SQLite's random() is a 64-bit integer,
+# which is scaled and shifted rather than passed to abs(), which overflows on the smallest one.
+RANDOM_KEY_SQL = {
+    "postgresql": "random()",
+    "sqlite": "random() / 18446744073709551616.0 + 0.5",
+    "mysql": "RAND()",
+}
+
+
+def fill_random_key(apps, schema_editor):
+    # The default is evaluated once for the existing rows, so each of them is given its own key.
+    vendor = schema_editor.connection.vendor
+    if vendor in RANDOM_KEY_SQL:
+        schema_editor.execute(f"UPDATE examples_example SET random_key = {RANDOM_KEY_SQL[vendor]}")
+        return
+    Example = apps.get_model("examples", "Example")
+    examples = []
+    for example in Example.objects.only("pk").iterator(chunk_size=1000):
+        example.random_key = random.random()
+        examples.append(example)
+        if len(examples) == 1000:
+            Example.objects.bulk_update(examples, ["random_key"])
+            examples = []
+    Example.objects.bulk_update(examples, ["random_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("examples", "0009_deletedexample"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="example",
+            name="random_key",
+            field=models.FloatField(default=examples.models.generate_random_key),
+        ),
+        migrations.RunPython(code=fill_random_key, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="example",
+            index=models.Index(fields=["project", "random_key"], name="examples_ex_project_a20d04_idx"),
+        ),
+    ]
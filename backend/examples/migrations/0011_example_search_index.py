@@ -0,0 +1,48 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+FTS_TRIGGERS = """
+CREATE TRIGGER examples_example_fts_insert AFTER INSERT ON examples_example BEGIN
+    INSERT INTO examples_example_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER examples_example_fts_delete AFTER DELETE ON examples_example BEGIN
+    INSERT INTO examples_example_fts(examples_example_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER examples_example_fts_update AFTER UPDATE OF text ON examples_example BEGIN
+    INSERT INTO examples_example_fts(examples_example_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO examples_example_fts(rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+
+def create_search_index(apps, schema_editor):
+    # PostgreSQL indexes the text in 0013_example_search_index_postgresql, without locking the table.
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    try:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE examples_example_fts USING fts5(text, content='examples_example', content_rowid='id')"
+        )
+    except OperationalError:  # SQLite built without FTS5; the search falls back to substring matching.
+        return
+    for statement in FTS_TRIGGERS.split("END;")[:-1]:
+        schema_editor.execute(statement + "END;")
+    schema_editor.execute("INSERT INTO examples_example_fts(examples_example_fts) VALUES ('rebuild')")
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for operation in ["insert", "delete", "update"]:
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS examples_example_fts_{operation}")
+    schema_editor.execute("DROP TABLE IF EXISTS examples_example_fts")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("examples", "0010_example_random_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(code=create_search_index, reverse_code=drop_search_index),
+    ]
@@ -0,0 +1,36 @@
+import logging
+
+from django.db import DatabaseError, migrations, transaction
+
+logger = logging.getLogger(__name__)
+
+
+def create_extension(apps, schema_editor):
+    """Installs pg_trgm, which the trigram index of the example text needs.
+
+    Before PostgreSQL 13, only a superuser can create it. Without it, the index is skipped
+    and the substring search of the example list scans the examples instead.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as e:
+        logger.warning(
+            "Couldn't create the pg_trgm extension, so the example text gets no trigram index: %s. "
+            "Create it as a superuser with `CREATE EXTENSION pg_trgm`, then run "
+            "`manage.py migrate examples 0012_pg_trgm` and `manage.py migrate` to add the index.",
+            e,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("examples", "0011_example_search_index"),
+    ]
+
+    operations = [
+        # The extension may be used by other tables, so it is kept when migrating backwards.
+        migrations.RunPython(code=create_extension, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+from django.db import migrations
+
+# The expression must be the same as the one of `examples.search`, for the index to be used.
+TSVECTOR = "to_tsvector('simple', COALESCE(text, ''))"
+
+
+def create_search_index(apps, schema_editor):
+    """Indexes the words of the example text, and its trigrams if pg_trgm is installed.
+
+    The indexes are built concurrently, which doesn't block writes to the examples meanwhile,
+    so this migration isn't atomic. If it is interrupted, an invalid index may be left behind:
+    drop it and migrate again.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS examples_example_text_search "
+        f"ON examples_example USING GIN ({TSVECTOR})"
+    )
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        has_trgm = cursor.fetchone() is not None
+    if has_trgm:
+        schema_editor.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS examples_example_text_trgm "
+            "ON examples_example USING GIN (UPPER(text) gin_trgm_ops)"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX CONCURRENTLY IF EXISTS examples_example_text_search")
+    schema_editor.execute("DROP INDEX CONCURRENTLY IF EXISTS examples_example_text_trgm")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("examples", "0012_pg_trgm"),
+    ]
+
+    operations = [
+        migrations.RunPython(code=create_search_index, reverse_code=drop_search_index),
+    ]
@@ -1,3 +1,4 @@
+import random
 import uuid
 
 from django.contrib.auth.models import User
@@ -5,10 +6,14 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django_drf_filepond.models import DrfFilePondStoredStorage
 
-from .managers import ExampleManager, ExampleStateManager
+from .managers import DeletedExampleManager, ExampleManager, ExampleStateManager
 from projects.models import Project
 
 
+def generate_random_key():
+    return random.random()
+
+
 class Example(models.Model):
     objects = ExampleManager()
 
@@ -20,6 +25,8 @@ class Example(models.Model):
     annotations_approved_by = models.ForeignKey(to=User, on_delete=models.SET_NULL, null=True, blank=True)
     text = models.TextField(null=True, blank=True)
     score = models.FloatField(default=100)
+    # A fixed random number used to browse the examples in random order without sorting them on every request.
+    random_key = models.FloatField(default=generate_random_key)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -36,6 +43,7 @@ class Example(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [models.Index(fields=["project", "random_key"])]
 
 
 class Assignment(models.Model):
@@ -84,3 +92,11 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+
+
+class DeletedExample(models.Model):
+    objects = DeletedExampleManager()
+    project = models.ForeignKey(to=Project, on_delete=models.CASCADE, related_name="deleted_examples")
+    example_id = models.BigIntegerField()
+    uuid = models.UUIDField()
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
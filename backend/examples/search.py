@@ -0,0 +1,134 @@
+"""Full-text search over the text of examples.
+
+Each database uses its own index, created by the search index migrations:
+
+- PostgreSQL: a GIN index on `to_tsvector('simple', text)`, which the queries below repeat
+  so that it is used, and a trigram index on `UPPER(text)` which speeds up the substring search
+  of the example list. The trigram index needs the pg_trgm extension (see `0012_pg_trgm`).
+- SQLite: the FTS5 table `examples_example_fts`, kept in sync with the examples by triggers.
+
+Both are maintained by the database itself, so imports and edits need nothing more.
+On SQLite, a migration which remakes the examples table drops the triggers with it.
+The search then falls back to substring matching, and `restore_fts_triggers`, which runs
+after every migration, creates them again.
+Other databases, or SQLite without FTS5, fall back to a substring match of every word.
+The `simple` configuration and FTS5's default tokenizer don't stem, so a word matches
+itself case-insensitively, which is what `find_highlights` marks in the text.
+"""
+import re
+from typing import List, Optional, Pattern
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "examples_example_fts"
+FTS_TRIGGERS = {
+    "examples_example_fts_insert": f"""
+        CREATE TRIGGER examples_example_fts_insert AFTER INSERT ON examples_example BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, text) VALUES (new.id, new.text);
+        END
+    """,
+    "examples_example_fts_delete": f"""
+        CREATE TRIGGER examples_example_fts_delete AFTER DELETE ON examples_example BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, text) VALUES ('delete', old.id, old.text);
+        END
+    """,
+    "examples_example_fts_update": f"""
+        CREATE TRIGGER examples_example_fts_update AFTER UPDATE OF text ON examples_example BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, text) VALUES ('delete', old.id, old.text);
+            INSERT INTO {FTS_TABLE}(rowid, text) VALUES (new.id, new.text);
+        END
+    """,
+}
+TSVECTOR = """to_tsvector('simple', COALESCE("examples_example"."text", ''))"""
+
+
+def tokenize(query: str) -> List[str]:
+    return re.findall(r"\w+", query)
+
+
+def compile_highlighter(terms: List[str]) -> Optional[Pattern]:
+    if not terms:
+        return None
+    words = sorted({re.escape(term) for term in terms}, key=len, reverse=True)
+    return re.compile(rf"\b(?:{'|'.join(words)})\b", re.IGNORECASE)
+
+
+def find_highlights(text: Optional[str], pattern: Optional[Pattern]) -> List[List[int]]:
+    """Returns the `[start, end]` offsets of the query's words in the text."""
+    if not text or pattern is None:
+        return []
+    return [[match.start(), match.end()] for match in pattern.finditer(text)]
+
+
+def has_fts_table(alias: str) -> bool:
+    """Whether the FTS5 table exists, along with the triggers which keep it in sync."""
+    names = [FTS_TABLE, *FTS_TRIGGERS]
+    with connections[alias].cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({', '.join(['%s'] * len(names))})", names)
+        return cursor.fetchone()[0] == len(names)
+
+
+def restore_fts_triggers(alias: str):
+    """Creates the missing triggers of the FTS5 table again, and rebuilds the index from the examples,
+    since it missed the changes made without them.
+    """
+    connection = connections[alias]
+    if connection.vendor != "sqlite" or FTS_TABLE not in connection.introspection.table_names():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        missing = FTS_TRIGGERS.keys() - {name for name, in cursor.fetchall()}
+        if not missing:
+            return
+        for name in sorted(missing):
+            cursor.execute(FTS_TRIGGERS[name])
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def search_examples(queryset: QuerySet, query: str) -> QuerySet:
+    """Filters the examples containing every word of the query and orders them by relevance.
+
+    The relevance is annotated as `rank`; higher is better.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return queryset.none()
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        return search_postgresql(queryset, terms)
+    if vendor == "sqlite" and has_fts_table(queryset.db):
+        return search_sqlite(queryset, terms)
+    return search_substring(queryset, terms)
+
+
+def search_postgresql(queryset: QuerySet, terms: List[str]) -> QuerySet:
+    text = " ".join(terms)
+    match = RawSQL(f"{TSVECTOR} @@ plainto_tsquery('simple', %s)", [text], output_field=BooleanField())
+    rank = RawSQL(f"ts_rank({TSVECTOR}, plainto_tsquery('simple', %s))", [text], output_field=FloatField())
+    return queryset.filter(match).annotate(rank=rank).order_by("-rank", "pk")
+
+
+def search_sqlite(queryset: QuerySet, terms: List[str]) -> QuerySet:
+    # Quoting makes FTS5 read each word as a string rather than its query syntax.
+    text = " ".join(f'"{term}"' for term in terms)
+    match = RawSQL(
+        f'"examples_example"."id" IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)',
+        [text],
+        output_field=BooleanField(),
+    )
+    # bm25() is lower for better matches.
+    rank = RawSQL(
+        f'SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = "examples_example"."id"',
+        [text],
+        output_field=FloatField(),
+    )
+    return queryset.filter(match).annotate(rank=rank).order_by("-rank", "pk")
+
+
+def search_substring(queryset: QuerySet, terms: List[str]) -> QuerySet:
+    condition = Q()
+    for term in terms:
+        condition &= Q(text__icontains=term)
+    return queryset.filter(condition).annotate(rank=Value(0.0, output_field=FloatField())).order_by("pk")
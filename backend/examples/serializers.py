@@ -1,6 +1,12 @@
+import re
+
+from django.db.models import Count, Exists, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 
+from .matching import MAX_QUERY_LENGTH, compile_pattern
 from .models import Assignment, Comment, Example, ExampleState
+from .search import find_highlights
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -26,15 +32,50 @@ class AssignmentSerializer(serializers.ModelSerializer):
 
 class ExampleSerializer(serializers.ModelSerializer):
     annotation_approver = serializers.SerializerMethodField()
+    comment_count = serializers.SerializerMethodField()
     is_confirmed = serializers.SerializerMethodField()
     assignments = serializers.SerializerMethodField()
 
+    @classmethod
+    def prefetch_queryset(cls, queryset, user, collaborative: bool):
+        """Loads what the serializer reads up front, so that a page costs the same number of queries for any size.
+
+        The state of confirmation and the number of comments are annotated with subqueries,
+        the approver is joined, and the assignments are fetched with their assignees in one query.
+        """
+        states = ExampleState.objects.filter(example=OuterRef("pk"))
+        if not collaborative:
+            states = states.filter(confirmed_by=user)
+        comments = (
+            Comment.objects.filter(example=OuterRef("pk"))
+            .order_by()
+            .values("example")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return (
+            queryset.select_related("annotations_approved_by")
+            .prefetch_related(Prefetch("assignments", queryset=Assignment.objects.select_related("assignee")))
+            .annotate(
+                confirmed=Exists(states),
+                num_comments=Coalesce(Subquery(comments, output_field=IntegerField()), 0),
+            )
+        )
+
     @classmethod
     def get_annotation_approver(cls, instance):
         approver = instance.annotations_approved_by
         return approver.username if approver else None
 
+    @classmethod
+    def get_comment_count(cls, instance):
+        if hasattr(instance, "num_comments"):
+            return instance.num_comments
+        return instance.comment_count
+
     def get_is_confirmed(self, instance):
+        if hasattr(instance, "confirmed"):
+            return instance.confirmed
         user = self.context.get("request").user
         if instance.project.collaborative_annotation:
             states = instance.states.all()
@@ -87,6 +128,32 @@ class ExampleSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class ExampleSearchSerializer(ExampleSerializer):
+    rank = serializers.FloatField(read_only=True)
+    highlights = serializers.SerializerMethodField()
+
+    def get_highlights(self, instance):
+        return find_highlights(instance.text, self.context.get("highlighter"))
+
+    class Meta(ExampleSerializer.Meta):
+        fields = ExampleSerializer.Meta.fields + ["rank", "highlights"]
+
+
+class ExampleMatchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(trim_whitespace=False, max_length=MAX_QUERY_LENGTH)
+    regex = serializers.BooleanField(default=False)
+    case_sensitive = serializers.BooleanField(default=False)
+    from_id = serializers.IntegerField(required=False)
+    to_id = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        try:
+            attrs["pattern"] = compile_pattern(attrs["q"], attrs["regex"], attrs["case_sensitive"])
+        except re.error as e:
+            raise serializers.ValidationError({"q": f"Invalid regular expression: {e}"})
+        return attrs
+
+
 class ExampleStateSerializer(serializers.ModelSerializer):
     class Meta:
         model = ExampleState
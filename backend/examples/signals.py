@@ -0,0 +1,11 @@
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+from .search import restore_fts_triggers
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    # A migration which remakes the examples table on SQLite drops the triggers of the search index.
+    if sender.label == "examples":
+        restore_fts_triggers(using)
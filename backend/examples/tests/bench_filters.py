@@ -0,0 +1,87 @@
+"""Benchmarks for filtering examples by label."""
+import random
+import time
+from unittest.mock import MagicMock
+
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from model_mommy import mommy
+
+from api.tests.bench import bench_size
+from examples.filters import ExampleFilter
+from examples.models import Example
+from labels.models import Span
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+
+BENCH_SPANS = bench_size("BENCH_SPANS", 2000000)
+SPANS_PER_EXAMPLE = 10
+LABELS = 20
+PAGE_SIZE = 10
+
+
+def bulk_create(model, objects, batch_size=5000):
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) == batch_size:
+            model.objects.bulk_create(batch)
+            batch = []
+    model.objects.bulk_create(batch)
+
+
+class BenchLabelFilter(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.SEQUENCE_LABELING)
+        project, user = self.project.item, self.project.admin
+        self.labels = [mommy.make("SpanType", project=project, text=f"label{i}") for i in range(LABELS)]
+        bulk_create(Example, (Example(project=project, text="text") for _ in range(BENCH_SPANS // SPANS_PER_EXAMPLE)))
+        # Label frequencies follow a Zipf-like distribution, from a label on most examples to rare ones.
+        rng = random.Random(0)
+        weights = [1 / (i + 1) for i in range(LABELS)]
+        spans = (
+            Span(
+                example_id=example_id,
+                user=user,
+                label=label,
+                start_offset=i,
+                end_offset=i + 1,
+            )
+            for example_id in project.examples.values_list("pk", flat=True).iterator()
+            for i, label in enumerate(rng.choices(self.labels, weights, k=SPANS_PER_EXAMPLE))
+        )
+        bulk_create(Span, spans)
+        self.request = MagicMock(user=user)
+
+    def run_queries(self, name, filter_by_label):
+        examples = self.project.item.examples.all()
+        for label in (self.labels[0], self.labels[-1]):
+            start = time.perf_counter()
+            queryset = filter_by_label(examples, label.text).order_by("pk")
+            count = queryset.count()
+            list(queryset[:PAGE_SIZE])
+            elapsed = time.perf_counter() - start
+            print(
+                f"\n{name:>8}: {label.text:>7} on {count} of {examples.count()} examples, {BENCH_SPANS} spans, "
+                f"count and first page in {elapsed * 1000:.1f} ms on {connection.vendor}"
+            )
+
+    def test_joins_vs_exists(self):
+        def joins(examples, label):
+            # The former implementation, with the DISTINCT its joins require.
+            return examples.filter(
+                Q(categories__label__text=label)
+                | Q(spans__label__text=label)
+                | Q(relations__type__text=label)
+                | Q(bboxes__label__text=label)
+                | Q(segmentations__label__text=label)
+            ).distinct()
+
+        def exists(examples, label):
+            return ExampleFilter(
+                data={"label": label}, queryset=examples, request=self.request, project=self.project.item
+            ).qs
+
+        self.run_queries("joins", joins)
+        self.run_queries("exists", exists)
@@ -0,0 +1,61 @@
+"""Benchmarks for searching examples."""
+import random
+import time
+
+from django.db import connection
+from django.test import TestCase
+
+from api.tests.bench import bench_size
+from examples.models import Example
+from examples.search import search_examples
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+
+BENCH_ROWS = bench_size("BENCH_ROWS", 100000)
+BENCH_QUERIES = 20
+PAGE_SIZE = 10
+
+
+def make_vocabulary(rng, size=5000):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(size)]
+
+
+class BenchSearch(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+        rng = random.Random(0)
+        self.vocabulary = make_vocabulary(rng)
+        examples = (
+            Example(project=self.project.item, text=" ".join(rng.choices(self.vocabulary, k=50)))
+            for _ in range(BENCH_ROWS)
+        )
+        batch = []
+        for example in examples:
+            batch.append(example)
+            if len(batch) == 1000:
+                Example.objects.bulk_create(batch)
+                batch = []
+        Example.objects.bulk_create(batch)
+        self.words = rng.sample(self.vocabulary, BENCH_QUERIES)
+
+    def run_queries(self, name, search):
+        examples = self.project.item.examples.all()
+        start = time.perf_counter()
+        for word in self.words:
+            queryset = search(examples, word)
+            queryset.count()
+            list(queryset[:PAGE_SIZE])
+        elapsed = time.perf_counter() - start
+        print(
+            f"\n{name:>10}: {BENCH_QUERIES} searches (count and first page) over {BENCH_ROWS} examples "
+            f"in {elapsed:.2f}s ({elapsed / BENCH_QUERIES * 1000:.1f} ms/search) on {connection.vendor}"
+        )
+
+    def test_substring_vs_full_text(self):
+        def substring(examples, word):
+            # What the `q` parameter of the example list does.
+            return examples.filter(text__icontains=word).order_by("pk")
+
+        self.run_queries("substring", substring)
+        self.run_queries("full-text", search_examples)
@@ -55,6 +55,15 @@ class TestCommentListProjectAPI(CRUDMixin):
             response = self.assert_fetch(member, status.HTTP_200_OK)
             self.assertEqual(response.data["count"], 1)
 
+    def test_allows_keyset_pagination(self):
+        make_comment(self.doc, self.project.admin)
+        self.client.force_login(self.project.admin)
+        response = self.client.get(f"{self.url}?cursor=&limit=1")
+        self.assertEqual(len(response.data["results"]), 1)
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next"])
+
     def test_denies_non_project_member_to_list_comments(self):
         self.assert_fetch(self.non_member, status.HTTP_403_FORBIDDEN)
 
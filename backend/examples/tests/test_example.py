@@ -1,9 +1,17 @@
+import base64
+import json
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.http import urlencode
+from model_mommy import mommy
 from rest_framework import status
 from rest_framework.reverse import reverse
 
-from .utils import make_assignment, make_doc, make_example_state
+from .utils import make_assignment, make_comment, make_doc, make_example_state
 from api.tests.utils import CRUDMixin
+from examples.models import DeletedExample
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 from users.tests.utils import make_user
@@ -50,6 +58,121 @@ class TestExampleListAPI(CRUDMixin):
         self.assertFalse(response.data["results"][0]["is_confirmed"])
 
 
+class TestExampleListQueries(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        for _ in range(10):
+            example = make_doc(self.project.item)
+            make_comment(example, self.project.admin)
+            example.annotations_approved_by = self.project.approver
+            example.save()
+            for member in self.project.members:
+                make_assignment(self.project.item, example, member)
+                make_example_state(example, member)
+        self.url = reverse(viewname="example_list", args=[self.project.item.id])
+
+    def count_queries(self, user, limit):
+        self.client.force_login(user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(f"{self.url}?limit={limit}")
+        self.assertEqual(len(response.data["results"]), limit)
+        return len(context.captured_queries)
+
+    # The first request caches the roles, which would leave out their queries from the next ones.
+    @override_settings(ROLE_CACHE_TIMEOUT=0)
+    def test_number_of_queries_does_not_depend_on_page_size(self):
+        for member in self.project.members:
+            self.assertEqual(self.count_queries(member, 1), self.count_queries(member, 10))
+
+    def test_fetches_project_once(self):
+        self.client.force_login(self.project.annotator)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+        queries = [q["sql"] for q in context.captured_queries if 'FROM "projects_project"' in q["sql"]]
+        self.assertEqual(len(queries), 1)
+
+    def test_filters_by_label_of_project_type_only(self):
+        self.client.force_login(self.project.admin)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(f"{self.url}?label=positive")
+        sql = " ".join(q["sql"] for q in context.captured_queries)
+        self.assertIn('"labels_category"', sql)
+        self.assertNotIn('"labels_span"', sql)
+
+    def test_serializes_prefetched_fields(self):
+        self.client.force_login(self.project.annotator)
+        response = self.client.get(self.url)
+        item = response.data["results"][0]
+        self.assertEqual(item["comment_count"], 1)
+        self.assertTrue(item["is_confirmed"])
+        self.assertEqual(item["annotation_approver"], self.project.approver.username)
+        self.assertEqual(len(item["assignments"]), len(self.project.members))
+
+
+class TestExampleListKeysetPagination(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = [make_doc(self.project.item) for _ in range(5)]
+        for i, example in enumerate(self.examples):
+            example.score = i % 2
+            example.save()
+        self.url = reverse(viewname="example_list", args=[self.project.item.id])
+        self.client.force_login(self.project.admin)
+
+    def walk(self, url, link="next"):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data[link]
+        return ids, response
+
+    def test_walks_through_all_pages(self):
+        ids, _ = self.walk(f"{self.url}?cursor=&limit=2")
+        self.assertEqual(ids, [example.id for example in self.examples])
+
+    def test_walks_back_with_previous_links(self):
+        _, last = self.walk(f"{self.url}?cursor=&limit=2")
+        ids, _ = self.walk(last.data["previous"], link="previous")
+        self.assertEqual(sorted(ids), [example.id for example in self.examples[:4]])
+
+    def test_breaks_ties_of_non_unique_ordering(self):
+        ids, _ = self.walk(f"{self.url}?cursor=&limit=2&ordering=-score")
+        expected = sorted(self.examples, key=lambda example: (-example.score, example.id))
+        self.assertEqual(ids, [example.id for example in expected])
+
+    def test_omits_count_unless_requested(self):
+        response = self.client.get(f"{self.url}?cursor=")
+        self.assertNotIn("count", response.data)
+        response = self.client.get(f"{self.url}?cursor=&count=exact")
+        self.assertEqual(response.data["count"], 5)
+        response = self.client.get(f"{self.url}?cursor=&count=estimate")
+        self.assertIn("count", response.data)
+
+    def test_rejects_invalid_cursor(self):
+        response = self.client.get(f"{self.url}?cursor=invalid")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_rejects_cursor_with_values_of_wrong_type(self):
+        positions = [
+            ("created_at", ["not a date", 1]),
+            ("created_at", [self.examples[0].created_at.isoformat(), "a"]),
+            ("-score", [{"score": 1}, 1]),
+        ]
+        for ordering, position in positions:
+            with self.subTest(position=position):
+                cursor = base64.urlsafe_b64encode(json.dumps({"p": position, "r": False}).encode()).decode()
+                response = self.client.get(f"{self.url}?{urlencode({'cursor': cursor, 'ordering': ordering})}")
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+                self.assertEqual(response.data["detail"], "Invalid cursor.")
+
+    def test_uses_limit_offset_without_cursor(self):
+        response = self.client.get(f"{self.url}?limit=2&offset=4")
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual([item["id"] for item in response.data["results"]], [self.examples[4].id])
+
+
 class TestExampleListCollaborative(CRUDMixin):
     def setUp(self):
         self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION, collaborative_annotation=True)
@@ -69,6 +192,32 @@ class TestExampleListCollaborative(CRUDMixin):
         self.assertTrue(response.data["results"][0]["is_confirmed"])
 
 
+class TestExampleListRandomOrder(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(
+            task=ProjectType.DOCUMENT_CLASSIFICATION, collaborative_annotation=True, random_order=True
+        )
+        self.examples = [make_doc(self.project.item) for _ in range(5)]
+        self.url = reverse(viewname="example_list", args=[self.project.item.id])
+        self.client.force_login(self.project.annotator)
+
+    def test_orders_examples_by_random_key(self):
+        response = self.client.get(f"{self.url}?limit=5")
+        expected = sorted(self.examples, key=lambda example: (example.random_key, example.pk))
+        self.assertEqual([item["id"] for item in response.data["results"]], [example.id for example in expected])
+
+    def test_pages_do_not_overlap(self):
+        ids = []
+        for offset in range(0, 5, 2):
+            response = self.client.get(f"{self.url}?limit=2&offset={offset}")
+            ids.extend(item["id"] for item in response.data["results"])
+        self.assertCountEqual(ids, [example.id for example in self.examples])
+
+    def test_allows_keyset_pagination(self):
+        response = self.client.get(f"{self.url}?cursor=&limit=5")
+        self.assertEqual(len(response.data["results"]), 5)
+
+
 class TestExampleListFilter(CRUDMixin):
     def setUp(self):
         self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
@@ -106,14 +255,23 @@ class TestExampleListFilter(CRUDMixin):
         user = self.project.approver
         self.assert_filter(data={"confirmed": "True"}, user=user, expected=0)
 
+    def test_searches_only_labels_of_project_type(self):
+        example = make_doc(self.project.item)
+        category_type = mommy.make("CategoryType", project=self.project.item, text="POS")
+        mommy.make("Category", example=example, label=category_type)
+        span_type = mommy.make("SpanType", project=self.project.item, text="PER")
+        mommy.make("Span", example=example, label=span_type, start_offset=0, end_offset=1)
+        self.assert_filter(data={"label": "POS"}, user=self.project.admin, expected=1)
+        self.assert_filter(data={"label": "PER"}, user=self.project.admin, expected=0)
+
 
 class TestExampleDetail(CRUDMixin):
     def setUp(self):
         self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
         self.non_member = make_user()
-        example = make_doc(self.project.item)
+        self.example = make_doc(self.project.item)
         self.data = {"text": "example"}
-        self.url = reverse(viewname="example_detail", args=[self.project.item.id, example.id])
+        self.url = reverse(viewname="example_detail", args=[self.project.item.id, self.example.id])
 
     def test_allows_project_member_to_get_example(self):
         for member in self.project.members:
@@ -140,6 +298,16 @@ class TestExampleDetail(CRUDMixin):
     def test_allows_project_admin_to_delete_example(self):
         self.assert_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
 
+    def test_records_deleted_example(self):
+        mommy.make("ExportWatermark", project=self.project.item)
+        self.assert_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
+        deleted = DeletedExample.objects.get(project=self.project.item)
+        self.assertEqual((deleted.example_id, deleted.uuid), (self.example.id, self.example.uuid))
+
+    def test_does_not_record_deleted_example_without_incremental_export(self):
+        self.assert_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(DeletedExample.objects.exists())
+
     def test_denies_non_admin_to_delete_example(self):
         for member in self.project.staffs:
             self.assert_delete(member, status.HTTP_403_FORBIDDEN)
@@ -1,5 +1,7 @@
+from unittest import skipUnless
 from unittest.mock import MagicMock
 
+from django.db import connection
 from django.test import TestCase
 from model_mommy import mommy
 
@@ -8,6 +10,7 @@ from examples.filters import ExampleFilter
 from examples.models import Example
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
+from users.tests.utils import make_user
 
 
 class TestFilterMixin(TestCase):
@@ -17,9 +20,10 @@ class TestFilterMixin(TestCase):
         self.queryset = Example.objects.all()
         make_example_state(self.example, project.admin)
         self.request.user = project.admin
+        self.filtered_project = project.item
 
     def assert_filter(self, data, expected):
-        f = ExampleFilter(data=data, queryset=self.queryset, request=self.request)
+        f = ExampleFilter(data=data, queryset=self.queryset, request=self.request, project=self.filtered_project)
         self.assertEqual(f.qs.count(), expected)
 
 
@@ -61,6 +65,45 @@ class TestLabelFilter(TestFilterMixin):
         self.assert_filter(data={"label": self.label_type.text}, expected=1)
 
 
+class TestLabelFilterBySpan(TestFilterMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.SEQUENCE_LABELING, use_relation=True)
+        self.prepare(project=self.project)
+        self.span_type = mommy.make("SpanType", project=self.project.item, text="PER")
+        self.relation_type = mommy.make("RelationType", project=self.project.item, text="knows")
+
+    def make_span(self, example, start_offset):
+        return mommy.make(
+            "Span", example=example, label=self.span_type, start_offset=start_offset, end_offset=start_offset + 1
+        )
+
+    def test_returns_example_once_for_many_labels(self):
+        self.make_span(self.example, 0)
+        self.make_span(self.example, 1)
+        self.assert_filter(data={"label": "PER"}, expected=1)
+
+    def test_returns_example_with_relation(self):
+        span = self.make_span(self.example, 0)
+        mommy.make("Relation", example=self.example, from_id=span, to_id=span, type=self.relation_type)
+        self.assert_filter(data={"label": "knows"}, expected=1)
+
+    def test_ignores_labels_of_other_project_types(self):
+        category_type = mommy.make("CategoryType", project=self.project.item, text="positive")
+        mommy.make("Category", example=self.example, label=category_type)
+        self.assert_filter(data={"label": "positive"}, expected=0)
+
+    def test_searches_every_label_without_project(self):
+        category_type = mommy.make("CategoryType", project=self.project.item, text="positive")
+        mommy.make("Category", example=self.example, label=category_type)
+        self.filtered_project = None
+        self.assert_filter(data={"label": "positive"}, expected=1)
+
+    def test_returns_nothing_for_project_without_label_types(self):
+        self.project = prepare_project(task=ProjectType.SEQ2SEQ)
+        self.prepare(project=self.project)
+        self.assert_filter(data={"label": "PER"}, expected=0)
+
+
 class TestExampleFilterOnCollaborative(TestFilterMixin):
     def setUp(self):
         self.project = prepare_project(task="DocumentClassification", collaborative_annotation=True)
@@ -80,3 +123,40 @@ class TestExampleFilterOnCollaborative(TestFilterMixin):
         for member in self.project.members:
             self.request.user = member
             self.assert_filter(data={"confirmed": ""}, expected=1)
+
+
+class TestExampleFilterWithoutProject(TestFilterMixin):
+    def test_returns_example_confirmed_by_user(self):
+        self.prepare(project=prepare_project(task="DocumentClassification"))
+        self.filtered_project = None
+        self.assert_filter(data={"confirmed": "True"}, expected=1)
+        self.request.user = make_user()
+        self.assert_filter(data={"confirmed": "True"}, expected=0)
+        self.assert_filter(data={"confirmed": "False"}, expected=1)
+
+    def test_returns_example_confirmed_by_anyone_on_collaborative(self):
+        self.prepare(project=prepare_project(task="DocumentClassification", collaborative_annotation=True))
+        self.filtered_project = None
+        self.request.user = make_user()
+        self.assert_filter(data={"confirmed": "True"}, expected=1)
+        self.assert_filter(data={"confirmed": "False"}, expected=0)
+
+
+@skipUnless(connection.vendor == "sqlite", "The query plan is checked on SQLite.")
+class TestStateFilterQueryPlan(TestFilterMixin):
+    def setUp(self):
+        self.prepare(project=prepare_project(task="DocumentClassification"))
+
+    def explain(self, data):
+        f = ExampleFilter(data=data, queryset=self.queryset, request=self.request, project=self.filtered_project)
+        return f.qs.order_by("pk")[:5].explain()
+
+    def test_looks_up_states_by_index_without_grouping(self):
+        for confirmed in ("True", "False"):
+            plan = self.explain({"confirmed": confirmed})
+            # Grouping the examples by their states used to join and sort all of them to return a page.
+            self.assertNotIn("JOIN", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+            self.assertRegex(
+                plan, r"examplestate_example_id_confirmed_by_id\w* \(example_id=\? AND confirmed_by_id=\?\)"
+            )
@@ -0,0 +1,209 @@
+import re
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from model_mommy import mommy
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from .utils import make_assignment
+from api.tests.utils import CRUDMixin
+from examples.matching import (
+    MAX_QUERY_LENGTH,
+    LRUCache,
+    OffsetIndex,
+    compile_pattern,
+    find_extenders,
+    find_matches,
+    match_results,
+    offset_indexes,
+)
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+from users.tests.utils import make_user
+
+
+class TestFindExtenders(TestCase):
+    def test_ascii_text_has_none(self):
+        self.assertEqual(find_extenders("plain text\n"), [])
+
+    def test_combining_marks_extend_cluster(self):
+        self.assertEqual(find_extenders("e\u0301te\u0301"), [1, 4])
+
+    def test_crlf_is_one_cluster(self):
+        self.assertEqual(find_extenders("a\r\nb"), [2])
+
+    def test_emoji_sequences_are_one_cluster(self):
+        family = "\U0001f468\u200d\U0001f469\u200d\U0001f467"
+        self.assertEqual(find_extenders(family), [1, 2, 3, 4])
+        self.assertEqual(find_extenders("\U0001f44d\U0001f3fd"), [1])
+
+    def test_pairs_regional_indicators(self):
+        flags = "\U0001f1ef\U0001f1f5\U0001f1fa\U0001f1f8"
+        self.assertEqual(find_extenders(flags), [1, 3])
+
+
+class TestOffsetIndex(TestCase):
+    def test_counts_code_points_by_default(self):
+        index = OffsetIndex("e\u0301\nx")
+        self.assertEqual((index.to_start(3), index.to_end(4)), (3, 4))
+
+    def test_counts_graphemes(self):
+        index = OffsetIndex("e\u0301x", graphemes=True)
+        self.assertEqual((index.to_start(2), index.to_end(3)), (1, 2))
+
+    def test_widens_offsets_inside_cluster(self):
+        index = OffsetIndex("e\u0301x", graphemes=True)
+        self.assertEqual((index.to_start(1), index.to_end(1)), (0, 1))
+
+    def test_finds_line_and_column(self):
+        index = OffsetIndex("ab\ncd\n\nef")
+        self.assertEqual([(index.line(i), index.column(i)) for i in (0, 4, 7)], [(0, 0), (1, 1), (3, 0)])
+
+
+class TestFindMatches(TestCase):
+    def match(self, text, query, **kwargs):
+        matches, _ = find_matches(text, compile_pattern(query, **kwargs), OffsetIndex(text))
+        return [(m["start_offset"], m["end_offset"]) for m in matches]
+
+    def test_escapes_literal_query(self):
+        self.assertEqual(self.match("a.b axb", "a.b"), [(0, 3)])
+
+    def test_matches_regex(self):
+        self.assertEqual(self.match("a.b axb", "a.b", regex=True), [(0, 3), (4, 7)])
+
+    def test_ignores_case_unless_asked(self):
+        self.assertEqual(self.match("Fox fox", "fox"), [(0, 3), (4, 7)])
+        self.assertEqual(self.match("Fox fox", "fox", case_sensitive=True), [(4, 7)])
+
+    def test_skips_empty_matches(self):
+        self.assertEqual(self.match("abc", "x*", regex=True), [])
+
+    def test_caches_compiled_patterns(self):
+        self.assertIs(compile_pattern("fo+", True), compile_pattern("fo+", True))
+
+    def test_raises_error_on_invalid_regex(self):
+        with self.assertRaises(re.error):
+            compile_pattern("(", regex=True)
+
+    def test_stops_at_deadline(self):
+        text = "fox " * 10
+        matches, timed_out = find_matches(text, compile_pattern("fox"), OffsetIndex(text), deadline=0)
+        self.assertEqual((matches, timed_out), ([], True))
+
+
+class TestLRUCache(TestCase):
+    def test_forgets_least_recently_used_entries(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual([cache.get(key) for key in "abc"], [1, None, 3])
+
+    def test_bounds_total_size(self):
+        cache = LRUCache(maxsize=5, sizeof=len)
+        cache.set("a", [1, 2])
+        cache.set("b", [1, 2, 3])
+        cache.set("a", [1])
+        self.assertEqual(cache.size, 4)
+        cache.set("c", [1, 2])
+        self.assertEqual((cache.get("b"), cache.size), (None, 3))
+
+
+class TestExampleMatchList(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.SEQUENCE_LABELING)
+        self.non_member = make_user()
+        self.example = mommy.make("Example", project=self.project.item, text="The fox.\nAnother Fox")
+        self.other = mommy.make("Example", project=self.project.item, text="no match")
+        for member in self.project.members:
+            make_assignment(self.project.item, self.example, member)
+        self.url = reverse(viewname="example_matches", args=[self.project.item.id, self.example.id]) + "?q=fox"
+        self.range_url = reverse(viewname="example_match_list", args=[self.project.item.id])
+        offset_indexes.clear()
+        match_results.clear()
+
+    def test_allows_project_member_to_find_matches(self):
+        for member in self.project.members:
+            response = self.assert_fetch(member, status.HTTP_200_OK)
+            result = response.data["results"][0]
+            self.assertEqual(result["example"], self.example.id)
+            self.assertEqual(
+                result["matches"],
+                [
+                    {"start_offset": 4, "end_offset": 7, "line": 0, "column": 4},
+                    {"start_offset": 17, "end_offset": 20, "line": 1, "column": 8},
+                ],
+            )
+            self.assertFalse(result["truncated"])
+
+    def test_denies_non_project_member(self):
+        self.assert_fetch(self.non_member, status.HTTP_403_FORBIDDEN)
+
+    def test_finds_matches_in_range(self):
+        self.url = self.range_url + f"?q=o&from_id={self.example.id}&to_id={self.other.id}"
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        counts = {result["example"]: len(result["matches"]) for result in response.data["results"]}
+        self.assertEqual(counts, {self.example.id: 3, self.other.id: 1})
+
+    def test_hides_unassigned_examples_from_annotator(self):
+        self.url = self.range_url + f"?q=o&from_id={self.example.id}&to_id={self.other.id}"
+        response = self.assert_fetch(self.project.annotator, status.HTTP_200_OK)
+        self.assertEqual([result["example"] for result in response.data["results"]], [self.example.id])
+
+    def test_requires_example_or_range(self):
+        self.url = self.range_url + "?q=fox"
+        self.assert_fetch(self.project.admin, status.HTTP_400_BAD_REQUEST)
+
+    def test_rejects_too_long_query(self):
+        self.url = self.url.replace("?q=fox", "?q=" + "x" * (MAX_QUERY_LENGTH + 1))
+        self.assert_fetch(self.project.admin, status.HTTP_400_BAD_REQUEST)
+
+    def test_truncates_matches_after_time_limit(self):
+        with mock.patch("examples.views.example.MATCH_TIME_LIMIT", -1):
+            response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["matches"], [])
+        self.assertTrue(response.data["results"][0]["truncated"])
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"][0]["matches"]), 2)
+
+    def test_uses_checked_matches_if_evicted(self):
+        cached = [{"start_offset": 4, "end_offset": 7, "line": 0, "column": 4}]
+
+        def get_and_evict(*args):
+            match_results.clear()
+            return cached
+
+        with mock.patch("examples.views.example.get_cached_matches", side_effect=get_and_evict):
+            response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["matches"], cached)
+        self.assertEqual(match_results.size, 0)
+
+    def test_rejects_invalid_regex(self):
+        self.url += "&regex=true&q=("
+        self.url = self.url.replace("?q=fox", "?")
+        self.assert_fetch(self.project.admin, status.HTTP_400_BAD_REQUEST)
+
+    def test_counts_graphemes_in_grapheme_mode(self):
+        self.project.item.grapheme_mode = True
+        self.project.item.save()
+        self.example.text = "e\u0301 fox"
+        self.example.save()
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["matches"][0]["start_offset"], 2)
+
+    def test_reads_text_only_once(self):
+        self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as context:
+            self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertFalse(any('"examples_example"."text"' in query["sql"] for query in context.captured_queries))
+
+    def test_finds_matches_of_updated_text(self):
+        self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.example.text = "fox"
+        self.example.save()
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"][0]["matches"]), 1)
@@ -1,11 +1,32 @@
+from unittest.mock import patch
+
+from django.db import connection
 from django.test import TestCase
 from model_mommy import mommy
 
-from examples.models import ExampleState
+from examples.models import Example, ExampleState
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
 
+class TestExampleManager(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.SEQUENCE_LABELING)
+        self.examples = [Example(project=self.project.item, text=text) for text in ["A", "B"]]
+
+    def test_bulk_create_without_requery(self):
+        if not connection.features.can_return_rows_from_bulk_insert:
+            self.skipTest("The database doesn't return rows from bulk insert.")
+        with self.assertNumQueries(1):
+            examples = Example.objects.bulk_create(self.examples)
+        self.assertEqual([example.pk for example in examples], list(Example.objects.values_list("pk", flat=True)))
+
+    def test_bulk_create_requeries_without_returning(self):
+        with patch.object(type(connection.features), "can_return_rows_from_bulk_insert", False):
+            examples = Example.objects.bulk_create(self.examples)
+        self.assertEqual([example.pk for example in examples], list(Example.objects.values_list("pk", flat=True)))
+
+
 class TestExampleState(TestCase):
     def setUp(self):
         self.project = prepare_project(ProjectType.SEQUENCE_LABELING)
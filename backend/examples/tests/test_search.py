@@ -0,0 +1,149 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from model_mommy import mommy
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from .utils import make_assignment
+from api.tests.utils import CRUDMixin
+from examples.models import Example
+from examples.search import (
+    compile_highlighter,
+    find_highlights,
+    has_fts_table,
+    restore_fts_triggers,
+    search_examples,
+    search_substring,
+    tokenize,
+)
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+from users.tests.utils import make_user
+
+
+class TestSearchExamples(TestCase):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = self.project.item.examples.all()
+
+    def make_example(self, text):
+        return mommy.make("Example", project=self.project.item, text=text)
+
+    def search(self, query):
+        return list(search_examples(self.examples, query))
+
+    def test_finds_examples_with_every_word(self):
+        example = self.make_example("The quick brown fox")
+        self.make_example("The quick dog")
+        self.assertEqual(self.search("QUICK fox"), [example])
+
+    def test_does_not_match_part_of_word(self):
+        self.make_example("foxes")
+        self.assertEqual(self.search("fox"), [])
+
+    def test_ranks_more_relevant_examples_first(self):
+        rare = self.make_example("a fox and many other words in a long sentence about nothing")
+        frequent = self.make_example("fox fox fox")
+        self.assertEqual(self.search("fox"), [frequent, rare])
+
+    def test_returns_nothing_without_words(self):
+        self.make_example("fox")
+        self.assertEqual(self.search(" ?! "), [])
+
+    def test_keeps_index_up_to_date(self):
+        example = self.make_example("fox")
+        example.text = "dog"
+        example.save()
+        self.assertEqual(self.search("fox"), [])
+        self.assertEqual(self.search("dog"), [example])
+        example.delete()
+        self.assertEqual(self.search("dog"), [])
+
+    def test_finds_bulk_created_examples(self):
+        Example.objects.bulk_create([Example(project=self.project.item, text=f"imported {i}") for i in range(3)])
+        self.assertEqual(len(self.search("imported")), 3)
+
+    def test_does_not_find_examples_of_other_projects(self):
+        mommy.make("Example", project=prepare_project().item, text="fox")
+        self.assertEqual(self.search("fox"), [])
+
+    def test_substring_fallback(self):
+        example = self.make_example("The quick brown fox")
+        self.assertEqual(list(search_substring(self.examples, ["quick", "fox"])), [example])
+
+
+@skipUnless(connection.vendor == "sqlite", "The FTS5 triggers are only used on SQLite.")
+class TestSearchTriggers(TestCase):
+    def setUp(self):
+        if not has_fts_table(connection.alias):
+            self.skipTest("SQLite is built without FTS5.")
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.example = mommy.make("Example", project=self.project.item, text="fox")
+
+    def drop_update_trigger(self):
+        # As a migration which remakes the examples table does.
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER examples_example_fts_update")
+        self.example.text = "dog"
+        self.example.save()
+
+    def search(self, query):
+        return list(search_examples(self.project.item.examples.all(), query))
+
+    def test_falls_back_to_substring_without_triggers(self):
+        self.drop_update_trigger()
+        self.assertFalse(has_fts_table(connection.alias))
+        self.assertEqual(self.search("dog"), [self.example])
+
+    def test_restores_triggers_and_index(self):
+        self.drop_update_trigger()
+        restore_fts_triggers(connection.alias)
+        self.assertTrue(has_fts_table(connection.alias))
+        self.assertEqual(self.search("dog"), [self.example])
+        self.assertEqual(self.search("fox"), [])
+
+
+class TestFindHighlights(TestCase):
+    def test_finds_offsets_of_words(self):
+        pattern = compile_highlighter(tokenize("fox, DOG"))
+        self.assertEqual(find_highlights("A fox and a dog. Foxes!", pattern), [[2, 5], [12, 15]])
+
+    def test_returns_nothing_without_text_or_words(self):
+        self.assertEqual(find_highlights(None, compile_highlighter(["fox"])), [])
+        self.assertEqual(find_highlights("fox", compile_highlighter([])), [])
+
+
+class TestExampleSearch(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.non_member = make_user()
+        self.example = mommy.make("Example", project=self.project.item, text="The quick brown fox")
+        mommy.make("Example", project=self.project.item, text="The lazy dog")
+        for member in self.project.members:
+            make_assignment(self.project.item, self.example, member)
+        self.url = reverse(viewname="example_search", args=[self.project.item.id]) + "?q=fox"
+
+    def test_allows_project_member_to_search(self):
+        for member in self.project.members:
+            response = self.assert_fetch(member, status.HTTP_200_OK)
+            self.assertEqual(response.data["count"], 1)
+            result = response.data["results"][0]
+            self.assertEqual(result["id"], self.example.id)
+            self.assertEqual(result["highlights"], [[16, 19]])
+            self.assertIn("rank", result)
+
+    def test_denies_non_project_member_to_search(self):
+        self.assert_fetch(self.non_member, status.HTTP_403_FORBIDDEN)
+
+    def test_hides_unassigned_examples_from_annotator(self):
+        mommy.make("Example", project=self.project.item, text="another fox")
+        response = self.assert_fetch(self.project.annotator, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_denies_creating_examples(self):
+        self.data = {"text": "fox"}
+        self.assert_create(self.project.admin, status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -1,30 +1,27 @@
-from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from pydantic import ValidationError
 from rest_framework import filters, generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView, Response
 
+from api.pagination import KeysetPagination
 from examples.assignment.strategies import StrategyName
 from examples.assignment.usecase import bulk_assign
 from examples.assignment.workload import WorkloadAllocation
 from examples.models import Assignment
 from examples.serializers import AssignmentSerializer
-from projects.models import Project
+from projects.mixins import ProjectMixin
 from projects.permissions import IsProjectAdmin, IsProjectStaffAndReadOnly
 
 
-class AssignmentList(generics.ListCreateAPIView):
+class AssignmentList(ProjectMixin, generics.ListCreateAPIView):
     serializer_class = AssignmentSerializer
     permission_classes = [IsAuthenticated & (IsProjectAdmin | IsProjectStaffAndReadOnly)]
+    pagination_class = KeysetPagination
     filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
     ordering_fields = ("created_at", "updated_at")
     model = Assignment
 
-    @property
-    def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_id"])
-
     def get_queryset(self):
         queryset = self.model.objects.filter(project=self.project, assignee=self.request.user)
         return queryset
@@ -40,13 +37,9 @@ class AssignmentDetail(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated & (IsProjectAdmin | IsProjectStaffAndReadOnly)]
 
 
-class ResetAssignment(APIView):
+class ResetAssignment(ProjectMixin, APIView):
     permission_classes = [IsAuthenticated & IsProjectAdmin]
 
-    @property
-    def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_id"])
-
     def delete(self, *args, **kwargs):
         Assignment.objects.filter(project=self.project).delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
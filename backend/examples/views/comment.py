@@ -3,7 +3,8 @@ from rest_framework import filters, generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from examples.models import Comment
+from api.pagination import KeysetPagination
+from examples.models import Comment, Example
 from examples.permissions import IsOwnComment
 from examples.serializers import CommentSerializer
 from projects.permissions import IsProjectMember
@@ -12,6 +13,7 @@ from projects.permissions import IsProjectMember
 class CommentList(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated & IsProjectMember]
     serializer_class = CommentSerializer
+    pagination_class = KeysetPagination
     filter_backends = (DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter)
     filterset_fields = ["example"]
     search_fields = ("text",)
@@ -26,7 +28,9 @@ class CommentList(generics.ListCreateAPIView):
 
     def delete(self, request, *args, **kwargs):
         delete_ids = request.data["ids"]
-        Comment.objects.filter(user=request.user, pk__in=delete_ids).delete()
+        comments = Comment.objects.filter(user=request.user, pk__in=delete_ids)
+        Example.objects.touch(list(comments.values_list("example_id", flat=True)))
+        comments.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -35,3 +39,7 @@ class CommentDetail(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = CommentSerializer
     lookup_url_kwarg = "comment_id"
     permission_classes = [IsAuthenticated & IsProjectMember & IsOwnComment]
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        Example.objects.touch([instance.example_id])
@@ -1,36 +1,57 @@
-from django.shortcuts import get_object_or_404
-from django_filters.rest_framework import DjangoFilterBackend
+import time
+
+from django.http import Http404
+from django.utils.functional import cached_property
 from rest_framework import filters, generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from examples.filters import ExampleFilter
-from examples.models import Example
-from examples.serializers import ExampleSerializer
-from projects.models import Member, Project
+from api.pagination import KeysetPagination
+from examples.filters import ExampleFilter, ExampleFilterBackend
+from examples.matching import (
+    MATCH_TIME_LIMIT,
+    MAX_MATCHES,
+    get_cached_matches,
+    get_matches,
+)
+from examples.models import DeletedExample, Example
+from examples.search import compile_highlighter, search_examples, tokenize
+from examples.serializers import (
+    ExampleMatchQuerySerializer,
+    ExampleSearchSerializer,
+    ExampleSerializer,
+)
+from projects.mixins import ProjectMixin
 from projects.permissions import (
     IsProjectAdmin,
     IsProjectAdminOrApprover,
     IsProjectStaffAndReadOnly,
+    RolePermission,
 )
 
 
-class ExampleList(generics.ListCreateAPIView):
+class ExampleList(ProjectMixin, generics.ListCreateAPIView):
     serializer_class = ExampleSerializer
     permission_classes = [IsAuthenticated & (IsProjectAdmin | IsProjectStaffAndReadOnly)]
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter)
+    pagination_class = KeysetPagination
+    filter_backends = (ExampleFilterBackend, filters.SearchFilter, filters.OrderingFilter)
     ordering_fields = ("created_at", "updated_at", "score")
     search_fields = ("text", "filename")
     model = Example
     filterset_class = ExampleFilter
 
-    @property
-    def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_id"])
-
     def get_queryset(self):
-        member = get_object_or_404(Member, project=self.project, user=self.request.user)
-        if member.is_admin():
+        queryset = self.get_examples()
+        return self.serializer_class.prefetch_queryset(
+            queryset, self.request.user, self.project.collaborative_annotation
+        )
+
+    def get_examples(self):
+        features = RolePermission.get_features(self.request, self.project.id)
+        if not features:
+            raise Http404
+        if "is_project_admin" in features:
             return self.model.objects.filter(project=self.project)
 
         # [MODIFIED] Allow access if collaborative annotation is enabled
@@ -41,7 +62,7 @@ class ExampleList(generics.ListCreateAPIView):
 
         if self.project.random_order:
             if self.project.collaborative_annotation:
-                queryset = queryset.order_by("?")
+                queryset = queryset.order_by("random_key", "pk")
             else:
                 queryset = queryset.order_by("assignments__id")
         return queryset
@@ -53,14 +74,102 @@ class ExampleList(generics.ListCreateAPIView):
         queryset = self.project.examples
         delete_ids = request.data["ids"]
         if delete_ids:
-            queryset.filter(pk__in=delete_ids).delete()
+            queryset = queryset.filter(pk__in=delete_ids)
         else:
-            queryset.all().delete()
+            queryset = queryset.all()
+        DeletedExample.objects.record(queryset)
+        queryset.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class ExampleSearch(ExampleList):
+    """Lists the examples containing every word of `q`, the most relevant first.
+
+    Each example has its `rank` and the `highlights`, the offsets of the query's words in its text.
+    """
+
+    serializer_class = ExampleSearchSerializer
+    filter_backends = (ExampleFilterBackend,)
+    http_method_names = ["get", "head", "options"]
+
+    @property
+    def query(self):
+        return self.request.query_params.get("q", "")
+
+    def get_queryset(self):
+        examples = search_examples(self.get_examples(), self.query)
+        return self.serializer_class.prefetch_queryset(
+            examples, self.request.user, self.project.collaborative_annotation
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["highlighter"] = compile_highlighter(tokenize(self.query))
+        return context
+
+
+class ExampleMatchList(ExampleList):
+    """Lists the matches of the literal or regex `q` in the text of an example.
+
+    The examples are the one of the URL, or those whose ids are between `from_id` and `to_id`.
+    The offsets are those of spans, counting grapheme clusters in the grapheme mode.
+    Only the texts whose matches aren't cached are read from the database.
+    An example's matches are `truncated` if there are more than `MAX_MATCHES`,
+    or if finding them took longer than `MATCH_TIME_LIMIT` seconds for the whole request.
+    """
+
+    filter_backends = ()
+    pagination_class = None
+    http_method_names = ["get", "head", "options"]
+    max_examples = 100
+
+    def get_queryset(self):
+        examples = self.get_examples()
+        if "example_id" in self.kwargs:
+            return examples.filter(pk=self.kwargs["example_id"])
+        params = self.params
+        if "from_id" not in params or "to_id" not in params:
+            raise ValidationError("Either an example or the range from_id and to_id is required.")
+        return examples.filter(pk__gte=params["from_id"], pk__lte=params["to_id"])
+
+    @cached_property
+    def params(self):
+        serializer = ExampleMatchQuerySerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def list(self, request, *args, **kwargs):
+        pattern = self.params["pattern"]
+        graphemes = getattr(self.project, "grapheme_mode", False)
+        versions = list(self.get_queryset().order_by("pk").values_list("pk", "updated_at")[: self.max_examples + 1])
+        if not versions and "example_id" in self.kwargs:
+            raise Http404
+        if len(versions) > self.max_examples:
+            raise ValidationError(f"The range must not contain more than {self.max_examples} examples.")
+        deadline = time.monotonic() + MATCH_TIME_LIMIT
+        found = {pk: (get_cached_matches((pk, updated_at), pattern, graphemes), False) for pk, updated_at in versions}
+        missing = [pk for pk, (matches, _) in found.items() if matches is None]
+        if missing:
+            # The matches are found in the text as it's read, with its own version,
+            # since the text or the cache may have changed since the versions were read.
+            texts = Example.objects.filter(pk__in=missing).order_by("pk").values_list("pk", "updated_at", "text")
+            for pk, updated_at, text in texts:
+                found[pk] = get_matches((pk, updated_at), text, pattern, graphemes, deadline)
+        # Examples deleted since their versions were read have no matches and are left out.
+        results = [
+            {"example": pk, "matches": matches, "truncated": timed_out or len(matches) == MAX_MATCHES}
+            for pk, (matches, timed_out) in found.items()
+            if matches is not None
+        ]
+        return Response({"results": results})
+
+
 class ExampleDetail(generics.RetrieveUpdateDestroyAPIView):
     queryset = Example.objects.all()
     serializer_class = ExampleSerializer
     lookup_url_kwarg = "example_id"
     permission_classes = [IsAuthenticated & (IsProjectAdminOrApprover | IsProjectStaffAndReadOnly)]
+
+    def perform_destroy(self, instance):
+        DeletedExample.objects.record(Example.objects.filter(pk=instance.pk))
+        super().perform_destroy(instance)
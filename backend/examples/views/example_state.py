@@ -4,18 +4,17 @@ from rest_framework.permissions import IsAuthenticated
 
 from examples.models import Example, ExampleState
 from examples.serializers import ExampleStateSerializer
-from projects.models import Project
+from projects.mixins import ProjectMixin
 from projects.permissions import IsProjectMember
 
 
-class ExampleStateList(generics.ListCreateAPIView):
+class ExampleStateList(ProjectMixin, generics.ListCreateAPIView):
     serializer_class = ExampleStateSerializer
     permission_classes = [IsAuthenticated & IsProjectMember]
 
     @property
     def can_confirm_per_user(self):
-        project = get_object_or_404(Project, pk=self.kwargs["project_id"])
-        return not project.collaborative_annotation
+        return not self.project.collaborative_annotation
 
     def get_queryset(self):
         queryset = ExampleState.objects.filter(example=self.kwargs["example_id"])
@@ -27,6 +26,7 @@ class ExampleStateList(generics.ListCreateAPIView):
         queryset = self.get_queryset()
         if queryset.exists():
             queryset.delete()
+            Example.objects.touch([self.kwargs["example_id"]])
         else:
             example = get_object_or_404(Example, pk=self.kwargs["example_id"])
             serializer.save(example=example, confirmed_by=self.request.user)
@@ -2,7 +2,6 @@ import json
 import re
 
 from django.db import IntegrityError, transaction
-from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, status
 from rest_framework.exceptions import ParseError
@@ -19,7 +18,7 @@ from .serializers import (
     RelationTypeSerializer,
     SpanTypeSerializer,
 )
-from projects.models import Project
+from projects.mixins import ProjectMixin
 from projects.permissions import (
     IsProjectAdmin,
     IsProjectMember,
@@ -36,15 +35,14 @@ def camel_to_snake_dict(d):
     return {camel_to_snake(k): v for k, v in d.items()}
 
 
-class LabelList(generics.ListCreateAPIView):
+class LabelList(ProjectMixin, generics.ListCreateAPIView):
     model = LabelType
     filter_backends = [DjangoFilterBackend]
     serializer_class = LabelSerializer
     pagination_class = None
 
     def get_permissions(self):
-        project = get_object_or_404(Project, pk=self.kwargs["project_id"])
-        if project.allow_member_to_create_label_type and self.request.method == "POST":
+        if self.project.allow_member_to_create_label_type and self.request.method == "POST":
             self.permission_classes = [IsAuthenticated & IsProjectMember]
         else:
             self.permission_classes = [IsAuthenticated & (IsProjectAdmin | IsProjectStaffAndReadOnly)]
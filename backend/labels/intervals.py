@@ -0,0 +1,47 @@
+from bisect import bisect_left, insort
+from itertools import accumulate
+from typing import Iterable, List, Tuple
+
+Interval = Tuple[int, int]
+
+
+def is_overlapping(a: Interval, b: Interval) -> bool:
+    """Whether two half-open intervals `[start, end)` share an offset."""
+    return a[0] < b[1] and b[0] < a[1]
+
+
+class IntervalIndex:
+    """Answers whether an interval overlaps any interval of a set in O(log n).
+
+    The intervals given at construction may overlap each other: they are sorted by start,
+    and the running maximum of their ends tells how far the ones starting before an offset reach.
+    Intervals added later must not overlap the indexed ones, which is how callers use it
+    (check with `overlaps`, then `add`), so they are kept in a plain sorted list.
+
+    Examples:
+        >>> index = IntervalIndex([(0, 5), (10, 15)])
+        >>> index.overlaps(4, 6)
+        True
+        >>> index.overlaps(5, 10)
+        False
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        intervals = sorted(intervals)
+        self.starts: List[int] = [start for start, _ in intervals]
+        self.reaches: List[int] = list(accumulate((end for _, end in intervals), max))
+        self.added: List[Interval] = []
+
+    def __len__(self) -> int:
+        return len(self.starts) + len(self.added)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        i = bisect_left(self.starts, end)
+        if i and self.reaches[i - 1] > start:
+            return True
+        # The added intervals are disjoint, so only the last one starting before `end` can reach `start`.
+        i = bisect_left(self.added, (end,))
+        return bool(i) and self.added[i - 1][1] > start
+
+    def add(self, start: int, end: int):
+        insort(self.added, (start, end))
@@ -1,5 +1,11 @@
+from typing import Dict, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Count, Manager
 
+from .intervals import IntervalIndex
+
 
 class LabelManager(Manager):
     label_type_field = "label"
@@ -29,25 +35,38 @@ class LabelManager(Manager):
             >>> self.calc_label_distribution(examples, members, labels)
             {'admin': {'positive': 10, 'negative': 5}}
         """
-        # 初始化字典：为每个用户、每个标签的计数预设为 0
-        distribution = {member.username: {label.text: 0 for label in labels} for member in members}
-        
+        return self.distribute(self.count_labels(examples), members, labels)
+
+    def count_labels(self, examples):
+        """Count the labels of the examples per user and label type.
+
+        Args:
+            examples: example queryset.
+
+        Returns:
+            a list of (username, label type id, count).
+        """
         # 核心 SQL 聚合查询
-        # SELECT user.username, label.text, COUNT(label.text)
+        # SELECT user.username, label_id, COUNT(id)
         # FROM labels
         # WHERE example_id IN (...)
-        # GROUP BY user.username, label.text
+        # GROUP BY user.username, label_id
         items = (
             self.filter(example_id__in=examples)
-            .values("user__username", f"{self.label_type_field}__text")
-            .annotate(count=Count(f"{self.label_type_field}__text"))
+            .values_list("user__username", f"{self.label_type_field}_id")
+            .annotate(count=Count("id"))
+            .order_by()
         )
-        
-        # 将数据库查询结果填充回字典
-        for item in items:
-            username = item["user__username"]
-            label = item[f"{self.label_type_field}__text"]
-            count = item["count"]
+        return list(items)
+
+    @staticmethod
+    def distribute(counts, members, labels):
+        """Arrange the counts of `count_labels` into the label distribution per user."""
+        # 初始化字典：为每个用户、每个标签的计数预设为 0
+        distribution = {member.username: {label.text: 0 for label in labels} for member in members}
+        label_texts = {label.id: label.text for label in labels}
+        for username, label_id, count in counts:
+            label = label_texts.get(label_id)
             if username in distribution and label in distribution[username]:
                 distribution[username][label] = count
         return distribution
@@ -64,6 +83,23 @@ class LabelManager(Manager):
     def filter_annotatable_labels(self, labels, project):
         return [label for label in labels if self.can_annotate(label, project)]
 
+    def bulk_annotate(self, labels, project):
+        """Validate the labels of one example and user as a batch, then save them in a single transaction.
+
+        Raises:
+            ValidationError: if any of the labels can't be added. Nothing is saved then.
+        """
+        with transaction.atomic():
+            self.validate_batch(labels, project)
+            return self.bulk_create(labels)
+
+    def validate_batch(self, labels, project):
+        type_field = self.label_type_field
+        type_ids = {getattr(label, f"{type_field}_id") for label in labels}
+        label_types = self.model._meta.get_field(type_field).related_model.objects
+        if label_types.filter(project=project, pk__in=type_ids).count() != len(type_ids):
+            raise ValidationError("The label types must belong to this project.")
+
 
 class CategoryManager(LabelManager):
     def can_annotate(self, label, project) -> bool:
@@ -74,17 +110,52 @@ class CategoryManager(LabelManager):
         else:
             return not categories.filter(label=label.label).exists()
 
+    def validate_batch(self, labels, project):
+        super().validate_batch(labels, project)
+        if not labels:
+            return
+        categories = self.get_labels(labels[0], project)
+        if project.single_class_classification:
+            if len(labels) > 1 or categories.exists():
+                raise ValidationError("Only one category is allowed in this project.")
+            return
+        type_ids = [label.label_id for label in labels]
+        if len(set(type_ids)) != len(type_ids) or categories.filter(label__in=type_ids).exists():
+            raise ValidationError("The category is already annotated.")
+
 
 class SpanManager(LabelManager):
     def can_annotate(self, label, project) -> bool:
-        overlapping = getattr(project, "allow_overlapping", False)
-        spans = self.get_labels(label, project)
-        if overlapping:
+        if getattr(project, "allow_overlapping", False):
             return True
-        for span in spans:
-            if span.is_overlapping(label):
-                return False
-        return True
+        spans = self.get_labels(label, project)
+        return not spans.filter(start_offset__lt=label.end_offset, end_offset__gt=label.start_offset).exists()
+
+    def build_index(self, label, project) -> IntervalIndex:
+        """Index the offsets of the spans the label must not overlap."""
+        return IntervalIndex(self.get_labels(label, project).values_list("start_offset", "end_offset"))
+
+    def filter_annotatable_labels(self, labels, project):
+        """Keep the labels overlapping neither the saved spans nor the labels kept before them."""
+        if getattr(project, "allow_overlapping", False):
+            return list(labels)
+        indexes: Dict[Tuple, IntervalIndex] = {}
+        annotatable = []
+        for label in labels:
+            key = (label.example_id, None if project.collaborative_annotation else label.user_id)
+            if key not in indexes:
+                indexes[key] = self.build_index(label, project)
+            if not indexes[key].overlaps(label.start_offset, label.end_offset):
+                indexes[key].add(label.start_offset, label.end_offset)
+                annotatable.append(label)
+        return annotatable
+
+    def validate_batch(self, labels, project):
+        super().validate_batch(labels, project)
+        if any(not 0 <= label.start_offset < label.end_offset for label in labels):
+            raise ValidationError("The start offset must be less than the end offset.")
+        if len(self.filter_annotatable_labels(labels, project)) != len(labels):
+            raise ValidationError("This overlapping is not allowed in this project.")
 
 
 class TextLabelManager(LabelManager):
@@ -102,6 +173,15 @@ class RelationManager(LabelManager):
     def can_annotate(self, label, project) -> bool:
         return True
 
+    def validate_batch(self, labels, project):
+        super().validate_batch(labels, project)
+        if not labels:
+            return
+        span_ids = {label.from_id_id for label in labels} | {label.to_id_id for label in labels}
+        spans = self.model._meta.get_field("from_id").related_model.objects
+        if spans.filter(example=labels[0].example_id, pk__in=span_ids).count() != len(span_ids):
+            raise ValidationError("You need to label the same example.")
+
 
 class BoundingBoxManager(LabelManager):
     def can_annotate(self, label, project) -> bool:
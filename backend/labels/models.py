@@ -1,9 +1,11 @@
 import uuid
+from typing import Dict, List, Type
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from .intervals import is_overlapping
 from .managers import (
     BoundingBoxManager,
     CategoryManager,
@@ -15,6 +17,7 @@ from .managers import (
 )
 from examples.models import Example
 from label_types.models import CategoryType, RelationType, SpanType
+from projects.models import Project, ProjectType
 
 
 class Label(models.Model):
@@ -58,14 +61,8 @@ class Span(Label):
             super().validate_unique(exclude=exclude)
             return
 
-        overlapping_span = (
-            Span.objects.exclude(id=self.id)
-            .filter(example=self.example)
-            .filter(
-                models.Q(start_offset__gte=self.start_offset, start_offset__lt=self.end_offset)
-                | models.Q(end_offset__gt=self.start_offset, end_offset__lte=self.end_offset)
-                | models.Q(start_offset__lte=self.start_offset, end_offset__gte=self.end_offset)
-            )
+        overlapping_span = Span.objects.exclude(id=self.id).filter(
+            example=self.example, start_offset__lt=self.end_offset, end_offset__gt=self.start_offset
         )
         if is_collaborative:
             if overlapping_span.exists():
@@ -79,11 +76,7 @@ class Span(Label):
         super().save(force_insert, force_update, using, update_fields)
 
     def is_overlapping(self, other: "Span"):
-        return (
-            (other.start_offset <= self.start_offset < other.end_offset)
-            or (other.start_offset < self.end_offset <= other.end_offset)
-            or (self.start_offset < other.start_offset and other.end_offset < self.end_offset)
-        )
+        return is_overlapping((self.start_offset, self.end_offset), (other.start_offset, other.end_offset))
 
     class Meta:
         constraints = [
@@ -153,3 +146,24 @@ class Segmentation(Label):
     points = models.JSONField(default=list)
     label = models.ForeignKey(to=CategoryType, on_delete=models.CASCADE)
     example = models.ForeignKey(to=Example, on_delete=models.CASCADE, related_name="segmentations")
+
+
+def select_label_models(project: Project) -> List[Type[Label]]:
+    """Returns the label models used by the project's type."""
+    use_relation = getattr(project, "use_relation", False)
+    spans: List[Type[Label]] = [Span, Relation] if use_relation else [Span]
+    mapping: Dict[str, List[Type[Label]]] = {
+        ProjectType.DOCUMENT_CLASSIFICATION: [Category],
+        ProjectType.SEQUENCE_LABELING: spans,
+        ProjectType.SEQ2SEQ: [TextLabel],
+        ProjectType.IMAGE_CLASSIFICATION: [Category],
+        ProjectType.SPEECH2TEXT: [TextLabel],
+        ProjectType.INTENT_DETECTION_AND_SLOT_FILLING: [Category, Span],
+        ProjectType.BOUNDING_BOX: [BoundingBox],
+        ProjectType.SEGMENTATION: [Segmentation],
+        ProjectType.IMAGE_CAPTIONING: [TextLabel],
+        # [EXPERIMENTAL-FEATURE-START]
+        ProjectType.KNOWLEDGE_CORRECTION: spans,
+        # [EXPERIMENTAL-FEATURE-END]
+    }
+    return mapping[project.project_type]
@@ -111,3 +111,22 @@ class SegmentationSerializer(serializers.ModelSerializer):
             "points",
         )
         read_only_fields = ("user",)
+
+
+class CategoryBulkSerializer(CategorySerializer):
+    """Reads the related ids as plain integers, as the batch is validated as a whole in one query."""
+
+    label = serializers.IntegerField(source="label_id")
+    example = serializers.IntegerField(source="example_id", read_only=True)
+
+
+class SpanBulkSerializer(SpanSerializer):
+    label = serializers.IntegerField(source="label_id")
+    example = serializers.IntegerField(source="example_id", read_only=True)
+
+
+class RelationBulkSerializer(RelationSerializer):
+    example = serializers.IntegerField(source="example_id", read_only=True)
+    type = serializers.IntegerField(source="type_id")
+    from_id = serializers.IntegerField(source="from_id_id")
+    to_id = serializers.IntegerField(source="to_id_id")
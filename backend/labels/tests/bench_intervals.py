@@ -0,0 +1,52 @@
+"""Micro-benchmarks for the span overlap checks."""
+import random
+import time
+import unittest
+
+from api.tests.bench import bench_size
+from labels.intervals import IntervalIndex, is_overlapping
+
+BENCH_SPANS = bench_size("BENCH_SPANS", 5000)
+
+
+def make_spans(n, seed):
+    rng = random.Random(seed)
+    starts = sorted(rng.sample(range(n * 20), n))
+    return [(start, start + rng.randint(1, 20)) for start in starts]
+
+
+def filter_linear(saved, candidates):
+    # What SpanManager.can_annotate did per candidate: compare against every saved span.
+    annotatable = []
+    for candidate in candidates:
+        if not any(is_overlapping(candidate, span) for span in saved + annotatable):
+            annotatable.append(candidate)
+    return annotatable
+
+
+def filter_indexed(saved, candidates):
+    index = IntervalIndex(saved)
+    annotatable = []
+    for candidate in candidates:
+        if not index.overlaps(*candidate):
+            index.add(*candidate)
+            annotatable.append(candidate)
+    return annotatable
+
+
+def report(name, func, saved, candidates):
+    start = time.perf_counter()
+    result = func(saved, candidates)
+    elapsed = time.perf_counter() - start
+    print(f"\n{name:>8}: {len(saved)} saved x {len(candidates)} candidate spans in {elapsed:.3f}s")
+    return result
+
+
+class BenchOverlapCheck(unittest.TestCase):
+    def test_linear_vs_indexed(self):
+        # Non-overlapping saved spans, as in a project which doesn't allow overlapping.
+        saved = filter_indexed([], make_spans(BENCH_SPANS, 0))
+        candidates = make_spans(BENCH_SPANS, 1)
+        linear = report("linear", filter_linear, saved, candidates)
+        indexed = report("indexed", filter_indexed, saved, candidates)
+        self.assertEqual(linear, indexed)
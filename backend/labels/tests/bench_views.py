@@ -0,0 +1,41 @@
+"""Benchmarks for the label endpoints."""
+import time
+
+from django.core.cache import cache
+from django.test import override_settings
+from model_mommy import mommy
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from api.tests.bench import bench_size
+from examples.tests.utils import make_doc
+from projects.models import ProjectType
+from projects.tests.utils import prepare_project
+
+BENCH_REQUESTS = bench_size("BENCH_REQUESTS", 1000)
+
+
+class BenchSpanList(APITestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.SEQUENCE_LABELING)
+        example = make_doc(self.project.item)
+        label = mommy.make("SpanType", project=self.project.item)
+        for i in range(10):
+            mommy.make("Span", example=example, label=label, user=self.project.admin, start_offset=i, end_offset=i + 1)
+        self.url = reverse(viewname="span_list", args=[self.project.item.id, example.id])
+        self.client.force_login(self.project.admin)
+
+    def run_requests(self, name, timeout):
+        cache.clear()
+        with override_settings(ROLE_CACHE_TIMEOUT=timeout):
+            start = time.perf_counter()
+            for _ in range(BENCH_REQUESTS):
+                self.client.get(self.url)
+            elapsed = time.perf_counter() - start
+        print(
+            f"\n{name:>10}: {BENCH_REQUESTS} requests in {elapsed:.2f}s ({BENCH_REQUESTS / elapsed:,.0f} requests/sec)"
+        )
+
+    def test_without_vs_with_role_cache(self):
+        self.run_requests("per-request", 0)
+        self.run_requests("cached", 60)
@@ -0,0 +1,44 @@
+import random
+import unittest
+
+from labels.intervals import IntervalIndex, is_overlapping
+
+
+class TestIsOverlapping(unittest.TestCase):
+    def test_overlapping(self):
+        for other in [(5, 10), (5, 11), (4, 10), (6, 9), (9, 15), (0, 6)]:
+            self.assertTrue(is_overlapping((5, 10), other))
+
+    def test_adjacent_intervals_do_not_overlap(self):
+        self.assertFalse(is_overlapping((5, 10), (0, 5)))
+        self.assertFalse(is_overlapping((5, 10), (10, 15)))
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def test_overlaps(self):
+        index = IntervalIndex([(0, 5), (10, 15)])
+        self.assertTrue(index.overlaps(4, 6))
+        self.assertTrue(index.overlaps(11, 12))
+        self.assertFalse(index.overlaps(5, 10))
+        self.assertFalse(index.overlaps(15, 20))
+
+    def test_overlaps_interval_contained_in_an_earlier_one(self):
+        index = IntervalIndex([(0, 100), (10, 20)])
+        self.assertTrue(index.overlaps(50, 60))
+
+    def test_add(self):
+        index = IntervalIndex([(0, 5)])
+        index.add(10, 15)
+        self.assertEqual(len(index), 2)
+        self.assertTrue(index.overlaps(14, 20))
+        self.assertFalse(index.overlaps(5, 10))
+
+    def test_agrees_with_pairwise_check(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            intervals = [(start, start + rng.randint(1, 10)) for start in rng.sample(range(100), 10)]
+            index = IntervalIndex(intervals)
+            start = rng.randrange(100)
+            query = (start, start + rng.randint(1, 10))
+            expected = any(is_overlapping(query, interval) for interval in intervals)
+            self.assertEqual(index.overlaps(*query), expected)
@@ -181,6 +181,40 @@ class TestSpan(TestCase):
         span.save()
 
 
+class TestFilterAnnotatableSpans(TestCase):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.SEQUENCE_LABELING, allow_overlapping=False)
+        self.example = mommy.make("Example", project=self.project.item)
+        self.user = self.project.admin
+        mommy.make("Span", example=self.example, start_offset=5, end_offset=10, user=self.user)
+
+    def make_spans(self, offsets, user=None):
+        return [
+            Span(example=self.example, user=user or self.user, start_offset=start_offset, end_offset=end_offset)
+            for start_offset, end_offset in offsets
+        ]
+
+    def test_filters_spans_overlapping_saved_ones(self):
+        spans = self.make_spans([(0, 5), (4, 6), (9, 12), (10, 15)])
+        annotatable = Span.objects.filter_annotatable_labels(spans, self.project.item)
+        self.assertEqual(annotatable, [spans[0], spans[3]])
+
+    def test_filters_spans_overlapping_earlier_candidates(self):
+        spans = self.make_spans([(0, 3), (2, 4), (12, 20), (15, 16)])
+        annotatable = Span.objects.filter_annotatable_labels(spans, self.project.item)
+        self.assertEqual(annotatable, [spans[0], spans[2]])
+
+    def test_keeps_spans_of_other_users(self):
+        spans = self.make_spans([(5, 10)], user=self.project.approver)
+        annotatable = Span.objects.filter_annotatable_labels(spans, self.project.item)
+        self.assertEqual(annotatable, spans)
+
+    def test_loads_saved_spans_once(self):
+        spans = self.make_spans([(i, i + 1) for i in range(10, 60)])
+        with self.assertNumQueries(1):
+            Span.objects.filter_annotatable_labels(spans, self.project.item)
+
+
 class TestSpanWithoutCollaborativeMode(TestCase):
     def setUp(self):
         self.project = prepare_project(ProjectType.SEQUENCE_LABELING, False, allow_overlapping=False)
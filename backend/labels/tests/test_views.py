@@ -1,5 +1,8 @@
 import uuid
 
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from model_mommy import mommy
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -8,7 +11,7 @@ from .utils import make_annotation
 from api.tests.utils import CRUDMixin
 from examples.tests.utils import make_doc
 from label_types.tests.utils import make_label
-from labels.models import BoundingBox, Category, Segmentation, Span, TextLabel
+from labels.models import BoundingBox, Category, Relation, Segmentation, Span, TextLabel
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 from users.tests.utils import make_user
@@ -229,6 +232,110 @@ class TestSegmentationCreation(TestDataLabeling, CRUDMixin):
             self.assert_create(member, status.HTTP_201_CREATED)
 
 
+class TestSpanBulkCreation(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.SEQUENCE_LABELING, allow_overlapping=False)
+        self.non_member = make_user()
+        self.doc = make_doc(self.project.item)
+        self.label = make_label(self.project.item)
+        self.data = [self.make_span(i, i + 1) for i in range(0, 10, 2)]
+        self.url = reverse(viewname="span_bulk_create", args=[self.project.item.id, self.doc.id])
+
+    def make_span(self, start_offset, end_offset):
+        return {"label": self.label.id, "start_offset": start_offset, "end_offset": end_offset}
+
+    def test_allows_project_member_to_annotate(self):
+        for member in self.project.members:
+            response = self.assert_create(member, status.HTTP_201_CREATED)
+            self.assertEqual(len(response.data), len(self.data))
+            self.assertEqual(Span.objects.filter(user=member).count(), len(self.data))
+
+    def test_denies_non_project_member_to_annotate(self):
+        self.assert_create(self.non_member, status.HTTP_403_FORBIDDEN)
+
+    def test_denies_overlapping_spans_in_batch(self):
+        self.data.append(self.make_span(0, 2))
+        self.assert_create(self.project.admin, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Span.objects.exists())
+
+    def test_denies_spans_overlapping_existing_ones(self):
+        mommy.make("Span", example=self.doc, user=self.project.admin, start_offset=3, end_offset=5)
+        self.assert_create(self.project.admin, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Span.objects.count(), 1)
+
+    def test_allows_overlapping_spans_of_other_users(self):
+        mommy.make("Span", example=self.doc, user=self.project.approver, start_offset=0, end_offset=10)
+        self.assert_create(self.project.admin, status.HTTP_201_CREATED)
+
+    def test_denies_invalid_offsets(self):
+        self.data.append(self.make_span(12, 11))
+        self.assert_create(self.project.admin, status.HTTP_400_BAD_REQUEST)
+
+    def test_denies_label_type_of_other_project(self):
+        self.data.append({**self.make_span(20, 21), "label": make_label(prepare_project().item).id})
+        self.assert_create(self.project.admin, status.HTTP_400_BAD_REQUEST)
+
+    # The first request caches the roles, which would leave out their queries from the next ones.
+    @override_settings(ROLE_CACHE_TIMEOUT=0)
+    def test_number_of_queries_does_not_depend_on_batch_size(self):
+        self.client.force_login(self.project.admin)
+        counts = []
+        for size in [1, 50]:
+            Span.objects.all().delete()
+            data = [self.make_span(i, i + 1) for i in range(size)]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.url, data=data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            counts.append(len(context.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+
+class TestCategoryBulkCreation(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.doc = make_doc(self.project.item)
+        self.labels = [make_label(self.project.item) for _ in range(3)]
+        self.data = [{"label": label.id} for label in self.labels]
+        self.url = reverse(viewname="category_bulk_create", args=[self.project.item.id, self.doc.id])
+
+    def test_allows_project_member_to_annotate(self):
+        self.assert_create(self.project.annotator, status.HTTP_201_CREATED)
+        self.assertEqual(Category.objects.count(), len(self.labels))
+
+    def test_denies_duplicated_category(self):
+        self.data.append(self.data[0])
+        self.assert_create(self.project.annotator, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Category.objects.exists())
+
+    def test_denies_multiple_categories_in_single_class_project(self):
+        self.project.item.single_class_classification = True
+        self.project.item.save()
+        self.assert_create(self.project.annotator, status.HTTP_400_BAD_REQUEST)
+
+
+class TestRelationBulkCreation(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(task=ProjectType.SEQUENCE_LABELING)
+        self.doc = make_doc(self.project.item)
+        self.relation_type = mommy.make("RelationType", project=self.project.item)
+        self.spans = [mommy.make("Span", example=self.doc, start_offset=i, end_offset=i + 1) for i in range(3)]
+        self.data = [
+            {"type": self.relation_type.id, "from_id": from_id.id, "to_id": to_id.id}
+            for from_id, to_id in zip(self.spans, self.spans[1:])
+        ]
+        self.url = reverse(viewname="relation_bulk_create", args=[self.project.item.id, self.doc.id])
+
+    def test_allows_project_member_to_annotate(self):
+        self.assert_create(self.project.annotator, status.HTTP_201_CREATED)
+        self.assertEqual(Relation.objects.count(), len(self.data))
+
+    def test_denies_span_of_other_example(self):
+        span = mommy.make("Span", example=make_doc(self.project.item), start_offset=0, end_offset=1)
+        self.data.append({"type": self.relation_type.id, "from_id": self.spans[0].id, "to_id": span.id})
+        self.assert_create(self.project.annotator, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Relation.objects.exists())
+
+
 class TestLabelDetail:
     task = ProjectType.SEQUENCE_LABELING
     view_name = "annotation_detail"
@@ -236,11 +343,11 @@ class TestLabelDetail:
     def setUp(self):
         self.project = prepare_project(task=self.task)
         self.non_member = make_user()
-        doc = make_doc(self.project.item)
+        self.doc = make_doc(self.project.item)
         label = make_label(self.project.item)
-        annotation = self.create_annotation_data(doc=doc)
+        annotation = self.create_annotation_data(doc=self.doc)
         self.data = {"label": label.id}
-        self.url = reverse(viewname=self.view_name, args=[self.project.item.id, doc.id, annotation.id])
+        self.url = reverse(viewname=self.view_name, args=[self.project.item.id, self.doc.id, annotation.id])
 
     def create_annotation_data(self, doc):
         return make_annotation(task=self.task, doc=doc, user=self.project.admin, start_offset=0, end_offset=1)
@@ -248,6 +355,13 @@ class TestLabelDetail:
     def test_allows_owner_to_get_annotation(self):
         self.assert_fetch(self.project.admin, status.HTTP_200_OK)
 
+    def test_fetches_project_once(self):
+        self.client.force_login(self.project.admin)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+        queries = [q["sql"] for q in context.captured_queries if 'FROM "projects_project"' in q["sql"]]
+        self.assertEqual(len(queries), 1)
+
     def test_denies_non_owner_to_get_annotation(self):
         for member in self.project.staffs:
             self.assert_fetch(member, status.HTTP_403_FORBIDDEN)
@@ -271,6 +385,12 @@ class TestLabelDetail:
     def test_allows_owner_to_delete_annotation(self):
         self.assert_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
 
+    def test_deleting_annotation_updates_example(self):
+        updated_at = self.doc.updated_at
+        self.assert_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
+        self.doc.refresh_from_db()
+        self.assertGreater(self.doc.updated_at, updated_at)
+
     def test_denies_non_owner_to_delete_annotation(self):
         for member in self.project.staffs:
             self.assert_delete(member, status.HTTP_403_FORBIDDEN)
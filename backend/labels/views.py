@@ -10,12 +10,16 @@ from rest_framework.response import Response
 from .permissions import CanEditLabel
 from .serializers import (
     BoundingBoxSerializer,
+    CategoryBulkSerializer,
     CategorySerializer,
+    RelationBulkSerializer,
     RelationSerializer,
     SegmentationSerializer,
+    SpanBulkSerializer,
     SpanSerializer,
     TextLabelSerializer,
 )
+from examples.models import Example
 from labels.models import (
     BoundingBox,
     Category,
@@ -25,20 +29,17 @@ from labels.models import (
     Span,
     TextLabel,
 )
-from projects.models import Project
+from metrics.statistics import invalidate_label_distribution
+from projects.mixins import ProjectMixin
 from projects.permissions import IsProjectMember
 
 
-class BaseListAPI(generics.ListCreateAPIView):
+class BaseListAPI(ProjectMixin, generics.ListCreateAPIView):
     label_class: Type[Label]
     pagination_class = None
     permission_classes = [IsAuthenticated & IsProjectMember]
     swagger_schema = None
 
-    @property
-    def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_id"])
-
     def get_queryset(self):
         queryset = self.label_class.objects.filter(example=self.kwargs["example_id"])
         if not self.project.collaborative_annotation:
@@ -59,17 +60,14 @@ class BaseListAPI(generics.ListCreateAPIView):
     def delete(self, request, *args, **kwargs):
         queryset = self.get_queryset()
         queryset.all().delete()
+        Example.objects.touch([self.kwargs["example_id"]])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class BaseDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class BaseDetailAPI(ProjectMixin, generics.RetrieveUpdateDestroyAPIView):
     lookup_url_kwarg = "annotation_id"
     swagger_schema = None
 
-    @property
-    def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_id"])
-
     def get_permissions(self):
         if self.project.collaborative_annotation:
             self.permission_classes = [IsAuthenticated & IsProjectMember]
@@ -77,6 +75,34 @@ class BaseDetailAPI(generics.RetrieveUpdateDestroyAPIView):
             self.permission_classes = [IsAuthenticated & IsProjectMember & partial(CanEditLabel, self.queryset)]
         return super().get_permissions()
 
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        Example.objects.touch([instance.example_id])
+
+
+class BaseBulkCreateAPI(ProjectMixin, generics.GenericAPIView):
+    """Creates many labels of an example at once.
+
+    The batch is validated as a whole against the example's labels and written with one
+    bulk insert, so either all of the labels are saved or none.
+    """
+
+    label_class: Type[Label]
+    permission_classes = [IsAuthenticated & IsProjectMember]
+    swagger_schema = None
+
+    def post(self, request, *args, **kwargs):
+        example = get_object_or_404(Example, pk=self.kwargs["example_id"], project=self.project)
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        labels = [self.label_class(**data, example=example, user=request.user) for data in serializer.validated_data]
+        try:
+            labels = self.label_class.objects.bulk_annotate(labels, self.project)
+        except ValidationError as err:
+            return Response({"detail": err.messages}, status=status.HTTP_400_BAD_REQUEST)
+        invalidate_label_distribution(self.project.id)
+        return Response(self.get_serializer(labels, many=True).data, status=status.HTTP_201_CREATED)
+
 
 class CategoryListAPI(BaseListAPI):
     label_class = Category
@@ -88,6 +114,11 @@ class CategoryListAPI(BaseListAPI):
         return super().create(request, args, kwargs)
 
 
+class CategoryBulkCreateAPI(BaseBulkCreateAPI):
+    label_class = Category
+    serializer_class = CategoryBulkSerializer
+
+
 class CategoryDetailAPI(BaseDetailAPI):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
@@ -98,6 +129,11 @@ class SpanListAPI(BaseListAPI):
     serializer_class = SpanSerializer
 
 
+class SpanBulkCreateAPI(BaseBulkCreateAPI):
+    label_class = Span
+    serializer_class = SpanBulkSerializer
+
+
 class SpanDetailAPI(BaseDetailAPI):
     queryset = Span.objects.all()
     serializer_class = SpanSerializer
@@ -118,6 +154,11 @@ class RelationList(BaseListAPI):
     serializer_class = RelationSerializer
 
 
+class RelationBulkCreate(BaseBulkCreateAPI):
+    label_class = Relation
+    serializer_class = RelationBulkSerializer
+
+
 class RelationDetail(BaseDetailAPI):
     queryset = Relation.objects.all()
     serializer_class = RelationSerializer
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from ...models import ProjectProgress
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Rebuild the progress counters of projects from their examples"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_ids", nargs="*", type=int, help="The ids of the projects. Defaults to all.")
+
+    def handle(self, *args, **options):
+        project_ids = options.get("project_ids") or Project.objects.values_list("id", flat=True)
+        for project_id in project_ids:
+            progress = ProjectProgress.objects.rebuild(project_id)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Progress rebuilt for project "{project_id}": {progress.complete}/{progress.total} complete'
+                )
+            )
@@ -0,0 +1,118 @@
+import uuid
+from collections import Counter
+from typing import Dict
+
+from django.db import transaction
+from django.db.models import Count, F, Manager
+
+from examples.models import Example, ExampleState
+
+
+class ProjectProgressManager(Manager):
+    """Keeps the progress counters of projects up to date.
+
+    The counters of a project are built from scratch the first time its progress is read.
+    Until then, there is no row to update, so changes before that are simply not counted.
+    Saving and deleting examples and states update the counters through the signals in `metrics.signals`.
+    Bulk inserts send no signals, so the import adds the examples it inserted itself.
+    """
+
+    def measure(self, project_id: int, user=None) -> Dict[str, int]:
+        progress = self.load(project_id)
+        if user is None:
+            complete = progress.complete
+        else:
+            member = progress.members.filter(user=user).first()
+            complete = member.done if member else 0
+        return {"total": progress.total, "remaining": progress.total - complete, "complete": complete}
+
+    def measure_members(self, project_id: int, members) -> Dict:
+        progress = self.load(project_id)
+        done = progress.members.filter(done__gt=0).values_list("user__username", "done")
+        response = {"total": progress.total, "progress": [{"user": username, "done": n} for username, n in done]}
+        members_with_progress = {o["user"] for o in response["progress"]}
+        for member in members:
+            if member.username not in members_with_progress:
+                response["progress"].append({"user": member.username, "done": 0})
+        return response
+
+    def load(self, project_id: int):
+        return self.filter(project_id=project_id).first() or self.rebuild(project_id)
+
+    def rebuild(self, project_id: int):
+        with transaction.atomic():
+            examples = Example.objects.filter(project_id=project_id).values("id")
+            progress, _ = self.update_or_create(
+                project_id=project_id,
+                defaults={"total": examples.count(), "complete": ExampleState.objects.count_done(examples)},
+            )
+            done = (
+                ExampleState.objects.filter(example__project_id=project_id)
+                .values("confirmed_by")
+                .annotate(done=Count("id"))
+            )
+            progress.members.all().delete()
+            progress.members.bulk_create(
+                [progress.members.model(progress=progress, user_id=o["confirmed_by"], done=o["done"]) for o in done]
+            )
+        return progress
+
+    def add_examples(self, project_id: int, total: int = 1):
+        self.filter(project_id=project_id).update(total=F("total") + total)
+
+    def remove_examples(self, examples):
+        """Subtracts the examples and their confirmations. This must be called before deleting them."""
+        states = ExampleState.objects.filter(example__in=examples)
+        complete = dict(
+            states.values("example__project_id")
+            .annotate(complete=Count("example", distinct=True))
+            .values_list("example__project_id", "complete")
+        )
+        for project_id, total in examples.values_list("project_id").annotate(total=Count("id")).order_by():
+            self.filter(project_id=project_id).update(
+                total=F("total") - total, complete=F("complete") - complete.get(project_id, 0)
+            )
+        self.subtract_done(states)
+
+    def add_state(self, state: ExampleState):
+        # Locking the progress row counts the confirmations of a project one at a time,
+        # including the member's row, which two confirmations would otherwise both create.
+        with transaction.atomic():
+            progress = self.select_for_update().filter(project_id=state.example.project_id).first()
+            if progress is None:
+                return
+            # The first state of the example completes it, even if another one was saved at the same time.
+            if not ExampleState.objects.filter(example=state.example_id, pk__lt=state.pk).exists():
+                self.filter(pk=progress.pk).update(complete=F("complete") + 1)
+            member, _ = progress.members.get_or_create(user_id=state.confirmed_by_id)
+            progress.members.filter(pk=member.pk).update(done=F("done") + 1)
+
+    def remove_states(self, states):
+        """Subtracts the confirmations. This must be called before deleting them."""
+        rows = list(states.values_list("pk", "example_id", "example__project_id"))
+        remaining = set(
+            ExampleState.objects.filter(example_id__in={example_id for _, example_id, _ in rows})
+            .exclude(pk__in=[pk for pk, _, _ in rows])
+            .values_list("example_id", flat=True)
+        )
+        examples = {(example_id, project_id) for _, example_id, project_id in rows if example_id not in remaining}
+        for project_id, complete in Counter(project_id for _, project_id in examples).items():
+            self.filter(project_id=project_id).update(complete=F("complete") - complete)
+        self.subtract_done(states)
+
+    def subtract_done(self, states):
+        done = states.values("example__project_id", "confirmed_by").annotate(done=Count("id")).order_by()
+        for o in done:
+            progress = self.filter(project_id=o["example__project_id"]).first()
+            if progress is not None:
+                progress.members.filter(user_id=o["confirmed_by"]).update(done=F("done") - o["done"])
+
+
+class LabelDistributionVersionManager(Manager):
+    def current(self, project_id: int) -> str:
+        version, _ = self.get_or_create(project_id=project_id)
+        return version.version.hex
+
+    def renew(self, **lookups):
+        """Replaces the versions of the projects selected by the lookups, such as `project_id`."""
+        self.filter(**lookups).update(version=uuid.uuid4())
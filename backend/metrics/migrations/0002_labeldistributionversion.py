@@ -0,0 +1,31 @@
+# Generated by Django 4.1.13 on 2026-10-18 16:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0010_attachment"),
+        ("metrics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LabelDistributionVersion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("version", models.UUIDField(default=uuid.uuid4)),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="label_distribution_version",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,39 @@
+import uuid
+
+from django.contrib.auth.models import User
+from django.db import models
+
+from .managers import LabelDistributionVersionManager, ProjectProgressManager
+from projects.models import Project
+
+
+class ProjectProgress(models.Model):
+    """The number of examples in a project and of those confirmed, so that progress is read from one row."""
+
+    objects = ProjectProgressManager()
+    project = models.OneToOneField(to=Project, on_delete=models.CASCADE, related_name="progress")
+    total = models.IntegerField(default=0)
+    complete = models.IntegerField(default=0)
+
+
+class MemberProgress(models.Model):
+    """The number of examples a user has confirmed in a project."""
+
+    progress = models.ForeignKey(to=ProjectProgress, on_delete=models.CASCADE, related_name="members")
+    user = models.ForeignKey(to=User, on_delete=models.CASCADE)
+    done = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = (("progress", "user"),)
+
+
+class LabelDistributionVersion(models.Model):
+    """The version of the cached label distributions of a project.
+
+    It is kept in the database rather than in the cache, so that the changes made by any process,
+    including the Celery workers, reach the processes which each keep their own cache.
+    """
+
+    objects = LabelDistributionVersionManager()
+    project = models.OneToOneField(to=Project, on_delete=models.CASCADE, related_name="label_distribution_version")
+    version = models.UUIDField(default=uuid.uuid4)
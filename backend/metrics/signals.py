@@ -0,0 +1,108 @@
+from typing import Iterable
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import ProjectProgress
+from .statistics import (
+    invalidate_example_label_distribution,
+    invalidate_label_distribution,
+)
+from examples.models import Example, ExampleState
+from labels.models import Label
+
+
+def deletes(origin, model) -> bool:
+    """Whether a deletion started from an object or a queryset of the model."""
+    return isinstance(origin, model) or (isinstance(origin, QuerySet) and issubclass(origin.model, model))
+
+
+def as_queryset(origin) -> QuerySet:
+    return origin if isinstance(origin, QuerySet) else type(origin).objects.filter(pk=origin.pk)
+
+
+def is_first_signal(origin, receiver_name: str) -> bool:
+    """Whether this is the receiver's first `pre_delete` of a deletion, which sends one per deleted object.
+
+    The receivers handle the whole deletion at once, from the object or queryset it started from.
+    The objects one by one can't tell which of the states of an example is its last one,
+    and would each look up the project of their example.
+    """
+    handled = origin.__dict__.setdefault("_handled_by", set())
+    if receiver_name in handled:
+        return False
+    handled.add(receiver_name)
+    return True
+
+
+@receiver(post_delete)
+def forget_handled_deletion(sender, origin=None, **kwargs):
+    # Every pre_delete is sent before the first post_delete, so the origin can be deleted again later.
+    if origin is not None:
+        origin.__dict__.pop("_handled_by", None)
+
+
+def invalidate_on_commit(project_ids: Iterable[int]):
+    """Invalidates the label distributions once the change is committed, so that they aren't counted before it."""
+
+    def invalidate():
+        for project_id in project_ids:
+            invalidate_label_distribution(project_id)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=Example)
+def add_example(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        ProjectProgress.objects.add_examples(instance.project_id)
+
+
+@receiver(pre_delete, sender=Example)
+def subtract_examples(sender, instance, origin, **kwargs):
+    # Deleting a project deletes its counters and its label distributions are never read again.
+    if deletes(origin, Example) and is_first_signal(origin, "subtract_examples"):
+        examples = as_queryset(origin)
+        invalidate_on_commit(set(examples.values_list("project_id", flat=True)))
+        ProjectProgress.objects.remove_examples(examples)
+
+
+@receiver(post_save, sender=ExampleState)
+def add_state(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        ProjectProgress.objects.add_state(instance)
+
+
+@receiver(pre_delete, sender=ExampleState)
+def subtract_states(sender, instance, origin, **kwargs):
+    # The states of deleted examples are subtracted with their examples.
+    if deletes(origin, ExampleState) and is_first_signal(origin, "subtract_states"):
+        ProjectProgress.objects.remove_states(as_queryset(origin))
+    elif deletes(origin, User) and is_first_signal(origin, "subtract_states"):
+        ProjectProgress.objects.remove_states(ExampleState.objects.filter(confirmed_by__in=as_queryset(origin)))
+
+
+@receiver(post_save)
+def invalidate_saved_label(sender, instance, raw, **kwargs):
+    # Bulk inserts send no signals, so the views and tasks which make them invalidate the distributions themselves.
+    if isinstance(instance, Label) and not raw:
+        # The project is looked up in the update, rather than by loading the example.
+        transaction.on_commit(lambda: invalidate_example_label_distribution(instance.example_id))
+
+
+@receiver(pre_delete)
+def invalidate_deleted_labels(sender, instance, origin, **kwargs):
+    # The labels of deleted examples are invalidated with their examples.
+    if not isinstance(instance, Label):
+        return
+    if deletes(origin, Label):
+        labels = as_queryset(origin)
+    elif deletes(origin, User):
+        labels = sender.objects.filter(user__in=as_queryset(origin))
+    else:
+        return
+    if is_first_signal(origin, f"invalidate_deleted_labels:{sender._meta.label}"):
+        invalidate_on_commit(set(labels.values_list("example__project_id", flat=True)))
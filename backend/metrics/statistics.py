@@ -0,0 +1,73 @@
+import logging
+import time
+from typing import List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import LabelDistributionVersion
+
+logger = logging.getLogger(__name__)
+
+Counts = List[Tuple[int, int, int]]
+
+
+def invalidate_label_distribution(project_id: int):
+    """Discards the cached label distributions of the project. Call it whenever labels are changed."""
+    LabelDistributionVersion.objects.renew(project_id=project_id)
+
+
+def invalidate_example_label_distribution(example_id: int):
+    """Discards the cached label distributions of the example's project, without reading the project."""
+    LabelDistributionVersion.objects.renew(project__examples=example_id)
+
+
+class LabelDistributionCache:
+    """Caches the number of labels per user and label type of a project.
+
+    The counts are keyed by ids, so renaming a label type or changing the members
+    doesn't make them stale. Each project has a version in the database which is replaced
+    when its labels change; entries of older versions are never read again and expire.
+    Reading the version from the database lets each process keep its own cache.
+    The timeout bounds how stale the counts can get if a change isn't reported.
+    """
+
+    hits_key = "label-distribution:hits"
+    misses_key = "label-distribution:misses"
+
+    def __init__(self, model, timeout: int = None):
+        self.model = model
+        self.timeout = settings.STATS_CACHE_TIMEOUT if timeout is None else timeout
+        self.hit = False
+        self.elapsed = 0.0
+
+    def key(self, project_id: int) -> str:
+        version = LabelDistributionVersion.objects.current(project_id)
+        return f"label-distribution:{self.model._meta.label_lower}:{project_id}:{version}"
+
+    def get(self, project_id: int, examples) -> Counts:
+        key = self.key(project_id)
+        start = time.perf_counter()
+        counts = cache.get(key)
+        self.hit = counts is not None
+        if not self.hit:
+            counts = self.model.objects.count_labels(examples)
+            cache.set(key, counts, timeout=self.timeout)
+        self.elapsed = time.perf_counter() - start
+        self.count(self.hits_key if self.hit else self.misses_key)
+        logger.debug("Label distribution of project %s: hit=%s, %.3fs", project_id, self.hit, self.elapsed)
+        return counts
+
+    @staticmethod
+    def count(key: str):
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:  # evicted in between
+            cache.set(key, 1, timeout=None)
+
+    @classmethod
+    def hit_rate(cls) -> float:
+        hits = cache.get(cls.hits_key, 0)
+        misses = cache.get(cls.misses_key, 0)
+        return hits / (hits + misses) if hits + misses else 0.0
@@ -1,10 +1,23 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from model_mommy import mommy
 from rest_framework import status
 from rest_framework.reverse import reverse
 
 from api.tests.utils import CRUDMixin
+from examples.models import Example, ExampleState
 from examples.tests.utils import make_doc
 from label_types.tests.utils import make_label
+from labels.models import Category
+from metrics.models import ProjectProgress
+from metrics.statistics import invalidate_label_distribution
 from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
@@ -54,6 +67,13 @@ class TestProgress(TestProgressHelper):
             expected = {"total": 1, "remaining": 1, "complete": 0}
             self.assertEqual(response.data, expected)
 
+    def test_fetches_project_once(self):
+        self.client.force_login(self.project.admin)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+        queries = [q["sql"] for q in context.captured_queries if 'FROM "projects_project"' in q["sql"]]
+        self.assertEqual(len(queries), 1)
+
 
 class TestProgressOnCollaborativeAnnotation(TestProgressHelper):
     collaborative_annotation = True
@@ -65,8 +85,112 @@ class TestProgressOnCollaborativeAnnotation(TestProgressHelper):
             self.assertEqual(response.data, expected)
 
 
+class TestProjectProgressCounters(CRUDMixin):
+    def setUp(self):
+        self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+        self.examples = [make_doc(self.project.item) for _ in range(3)]
+        mommy.make("ExampleState", example=self.examples[0], confirmed_by=self.project.admin)
+        self.project_id = self.project.item.id
+        ProjectProgress.objects.measure(self.project_id)
+        self.client.force_login(self.project.admin)
+
+    def assert_counters_match_rebuild(self):
+        counted = ProjectProgress.objects.measure_members(self.project_id, [])
+        ProjectProgress.objects.rebuild(self.project_id)
+        self.assertEqual(counted, ProjectProgress.objects.measure_members(self.project_id, []))
+        return counted
+
+    def toggle_state(self, example, user):
+        self.client.force_login(user)
+        self.client.post(reverse(viewname="example_state_list", args=[self.project_id, example.id]))
+
+    def test_builds_counters_on_first_read(self):
+        progress = ProjectProgress.objects.get(project_id=self.project_id)
+        self.assertEqual((progress.total, progress.complete), (3, 1))
+
+    def test_counts_confirmation(self):
+        self.toggle_state(self.examples[0], self.project.approver)
+        self.toggle_state(self.examples[1], self.project.approver)
+        counted = self.assert_counters_match_rebuild()
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id)["complete"], 2)
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id, self.project.approver)["complete"], 2)
+        self.assertEqual(counted["total"], 3)
+
+    def test_counts_cancellation(self):
+        self.toggle_state(self.examples[0], self.project.admin)
+        self.assert_counters_match_rebuild()
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id)["complete"], 0)
+
+    def test_counts_example_creation_and_deletion(self):
+        self.client.post(reverse(viewname="example_list", args=[self.project_id]), data={"text": "example"})
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id)["total"], 4)
+        url = reverse(viewname="example_list", args=[self.project_id])
+        self.client.delete(url, data={"ids": [self.examples[0].id]}, format="json")
+        self.assert_counters_match_rebuild()
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id), {"total": 3, "remaining": 3, "complete": 0})
+
+    # The first request caches the roles, which would leave out their queries from the next ones.
+    @override_settings(ROLE_CACHE_TIMEOUT=0)
+    def test_reads_progress_from_counters(self):
+        url = reverse(viewname="progress", args=[self.project_id])
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(url)
+        for example in [make_doc(self.project.item) for _ in range(10)]:
+            mommy.make("ExampleState", example=example, confirmed_by=self.project.admin)
+        with self.assertNumQueries(len(before.captured_queries)):
+            response = self.client.get(url)
+        self.assertEqual(response.data["total"], 13)
+
+    def test_counts_changes_through_orm(self):
+        example = Example.objects.create(project=self.project.item, text="example")
+        mommy.make("ExampleState", example=example, confirmed_by=self.project.approver)
+        self.examples[1].delete()
+        ExampleState.objects.filter(example=self.examples[0]).delete()
+        counted = self.assert_counters_match_rebuild()
+        self.assertEqual((counted["total"], ProjectProgress.objects.measure(self.project_id)["complete"]), (3, 1))
+
+    def test_counts_example_confirmed_by_several_users_once(self):
+        mommy.make("ExampleState", example=self.examples[0], confirmed_by=self.project.approver)
+        ExampleState.objects.filter(example=self.examples[0]).delete()
+        self.assert_counters_match_rebuild()
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id)["complete"], 0)
+
+    def test_counts_simultaneous_confirmations_once(self):
+        # Both states are saved before either one is counted, as by two concurrent requests.
+        states = ExampleState.objects.bulk_create(
+            [ExampleState(example=self.examples[1], confirmed_by=member) for member in self.project.staffs]
+        )
+        for state in states:
+            ProjectProgress.objects.add_state(state)
+        self.assert_counters_match_rebuild()
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id)["complete"], 2)
+
+    def test_counts_deletion_of_example_confirmed_by_several_users(self):
+        mommy.make("ExampleState", example=self.examples[0], confirmed_by=self.project.approver)
+        Example.objects.filter(pk__in=[self.examples[0].pk, self.examples[1].pk]).delete()
+        counted = self.assert_counters_match_rebuild()
+        self.assertEqual((counted["total"], ProjectProgress.objects.measure(self.project_id)["complete"]), (1, 0))
+
+    def test_counts_deletion_of_user(self):
+        self.project.admin.delete()
+        self.assert_counters_match_rebuild()
+        self.assertEqual(ProjectProgress.objects.measure(self.project_id)["complete"], 0)
+
+
+class TestRebuildProgressCommand(TestCase):
+    def test_rebuilds_counters(self):
+        project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
+        make_doc(project.item)
+        out = StringIO()
+        call_command("rebuild_progress", project.item.id, stdout=out)
+        progress = ProjectProgress.objects.get(project=project.item)
+        self.assertEqual((progress.total, progress.complete), (1, 0))
+        self.assertIn("0/1", out.getvalue())
+
+
 class TestCategoryDistribution(CRUDMixin):
     def setUp(self):
+        cache.clear()
         self.project = prepare_project(ProjectType.DOCUMENT_CLASSIFICATION)
         self.example = make_doc(self.project.item)
         self.label = make_label(self.project.item, text="label")
@@ -78,3 +202,75 @@ class TestCategoryDistribution(CRUDMixin):
         expected = {member.username: {self.label.text: 0} for member in self.project.members}
         expected[self.project.admin.username][self.label.text] = 1
         self.assertEqual(response.data, expected)
+
+    # The first request caches the roles, which would leave out their queries from the next ones.
+    @override_settings(ROLE_CACHE_TIMEOUT=0)
+    def test_caches_distribution(self):
+        self.client.force_login(self.project.admin)
+        # The first request also creates the version of the project.
+        self.client.get(self.url)
+        invalidate_label_distribution(self.project.item.id)
+        with CaptureQueriesContext(connection) as miss:
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn("Server-Timing", response)
+        with self.assertNumQueries(len(miss.captured_queries) - 1):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response["X-Cache-Hit-Rate"], "0.333")
+
+    def test_keeps_counts_when_label_type_is_renamed(self):
+        self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.label.text = "renamed"
+        self.label.save()
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.data[self.project.admin.username], {"renamed": 1})
+
+    def test_invalidates_distribution_when_labels_change(self):
+        self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.client.force_login(self.project.approver)
+        url = reverse(viewname="category_list", args=[self.project.item.id, self.example.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, data={"label": self.label.id}, format="json")
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data[self.project.approver.username][self.label.text], 1)
+
+    def test_invalidates_distribution_from_process_with_own_cache(self):
+        self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        # A Celery worker, for example, writes to its own local-memory cache.
+        with patch("django.core.cache.cache", LocMemCache("worker", {})):
+            invalidate_label_distribution(self.project.item.id)
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    def test_saving_label_does_not_load_example(self):
+        label = Category(example_id=self.example.id, label=self.label, user=self.project.approver)
+        with CaptureQueriesContext(connection) as context, self.captureOnCommitCallbacks(execute=True):
+            label.save()
+        selects = [q["sql"] for q in context.captured_queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(selects, [])
+
+    def test_invalidates_distribution_when_labels_are_deleted(self):
+        self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.filter(example=self.example).delete()
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data[self.project.admin.username][self.label.text], 0)
+
+    def assert_invalidated_by_deletion(self, url):
+        self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(url, data={"ids": [self.example.id]}, format="json")
+        response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data[self.project.admin.username][self.label.text], 0)
+
+    def test_invalidates_distribution_when_examples_are_deleted(self):
+        self.assert_invalidated_by_deletion(reverse(viewname="example_list", args=[self.project.item.id]))
+
+    def test_invalidates_distribution_when_example_is_deleted(self):
+        url = reverse(viewname="example_detail", args=[self.project.item.id, self.example.id])
+        self.assert_invalidated_by_deletion(url)
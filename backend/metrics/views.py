@@ -1,30 +1,28 @@
 import abc
 
-from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from examples.models import Example, ExampleState
+from .models import ProjectProgress
+from .statistics import LabelDistributionCache
+from examples.models import Example
 from label_types.models import CategoryType, LabelType, RelationType, SpanType
 from labels.models import Category, Label, Relation, Span
-from projects.models import Member, Project
+from projects.mixins import ProjectMixin
+from projects.models import Member
 from projects.permissions import IsProjectAdmin, IsProjectStaffAndReadOnly
 
 
-class ProgressAPI(APIView):
+class ProgressAPI(ProjectMixin, APIView):
     permission_classes = [IsAuthenticated & (IsProjectAdmin | IsProjectStaffAndReadOnly)]
 
     def get(self, request, *args, **kwargs):
-        examples = Example.objects.filter(project=self.kwargs["project_id"]).values("id")
-        total = examples.count()
-        project = get_object_or_404(Project, pk=self.kwargs["project_id"])
-        if project.collaborative_annotation:
-            complete = ExampleState.objects.count_done(examples)
+        if self.project.collaborative_annotation:
+            data = ProjectProgress.objects.measure(self.project.id)
         else:
-            complete = ExampleState.objects.count_done(examples, user=self.request.user)
-        data = {"total": total, "remaining": total - complete, "complete": complete}
+            data = ProjectProgress.objects.measure(self.project.id, user=self.request.user)
         return Response(data=data, status=status.HTTP_200_OK)
 
 
@@ -32,9 +30,8 @@ class MemberProgressAPI(APIView):
     permission_classes = [IsAuthenticated & (IsProjectAdmin | IsProjectStaffAndReadOnly)]
 
     def get(self, request, *args, **kwargs):
-        examples = Example.objects.filter(project=self.kwargs["project_id"]).values("id")
-        members = Member.objects.filter(project=self.kwargs["project_id"])
-        data = ExampleState.objects.measure_member_progress(examples, members)
+        members = Member.objects.filter(project=self.kwargs["project_id"]).select_related("user")
+        data = ProjectProgress.objects.measure_members(self.kwargs["project_id"], members)
         return Response(data=data, status=status.HTTP_200_OK)
 
 
@@ -46,9 +43,15 @@ class LabelDistribution(abc.ABC, APIView):
     def get(self, request, *args, **kwargs):
         labels = self.label_type.objects.filter(project=self.kwargs["project_id"])
         examples = Example.objects.filter(project=self.kwargs["project_id"]).values("id")
-        members = Member.objects.filter(project=self.kwargs["project_id"])
-        data = self.model.objects.calc_label_distribution(examples, members, labels)
-        return Response(data=data, status=status.HTTP_200_OK)
+        members = Member.objects.filter(project=self.kwargs["project_id"]).select_related("user")
+        stats = LabelDistributionCache(self.model)
+        counts = stats.get(self.kwargs["project_id"], examples)
+        data = self.model.objects.distribute(counts, members, labels)
+        response = Response(data=data, status=status.HTTP_200_OK)
+        response["X-Cache"] = "HIT" if stats.hit else "MISS"
+        response["X-Cache-Hit-Rate"] = f"{stats.hit_rate():.3f}"
+        response["Server-Timing"] = f"label-distribution;dur={stats.elapsed * 1000:.1f}"
+        return response
 
 
 class CategoryTypeDistribution(LabelDistribution):
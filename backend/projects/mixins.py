@@ -0,0 +1,18 @@
+from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
+
+from .models import Project
+
+
+class ProjectMixin:
+    """Resolves the project of the `project_id` URL keyword argument.
+
+    A view is instantiated per request, so the project is fetched at most once per request,
+    however many times `self.project` is read.
+    """
+
+    project_url_kwarg = "project_id"
+
+    @cached_property
+    def project(self) -> Project:
+        return get_object_or_404(Project, pk=self.kwargs[self.project_url_kwarg])
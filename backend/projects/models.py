@@ -1,9 +1,10 @@
 import abc
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Manager
@@ -224,6 +225,29 @@ class MemberManager(Manager):
     def has_feature(self, project_id: int, user: User, feature_name: str):
         return self.filter(project=project_id, user=user, role__features__name=feature_name).exists()
 
+    @staticmethod
+    def role_cache_key(project_id: int, user_id: int) -> str:
+        return f"member-role:{project_id}:{user_id}"
+
+    def get_features(self, project_id: int, user: User) -> FrozenSet[str]:
+        """Returns the names of the features the user has in the project.
+
+        The user's role in the project is cached for `ROLE_CACHE_TIMEOUT` seconds, as are the
+        features of the role. Both are dropped when the member or the role is changed. The timeout
+        is 0 unless the cache is shared by all processes, since the others wouldn't see the changes.
+        """
+        key = self.role_cache_key(project_id, user.id)
+        role_id = cache.get(key)
+        if role_id is None:
+            role_id = self.filter(project=project_id, user=user).values_list("role_id", flat=True).first() or 0
+            cache.set(key, role_id, settings.ROLE_CACHE_TIMEOUT)
+        if not role_id:
+            return frozenset()
+        return Role.objects.get_features(role_id)
+
+    def forget_role(self, project_id: int, user_id: int):
+        cache.delete(self.role_cache_key(project_id, user_id))
+
 
 class Member(models.Model):
     user = models.ForeignKey(to=User, on_delete=models.CASCADE, related_name="role_mappings")
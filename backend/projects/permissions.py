@@ -1,4 +1,3 @@
-from django.conf import settings
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 from .models import Member
@@ -24,7 +23,17 @@ class RolePermission(BasePermission):
         if not project_id and request.method in SAFE_METHODS:
             return True
 
-        return Member.objects.has_feature(project_id, request.user, self.feature_name)
+        return self.feature_name in self.get_features(request, project_id)
+
+    @staticmethod
+    def get_features(request, project_id):
+        # Composite permissions check several features, so they are kept on the request after the first lookup.
+        if not hasattr(request, "project_features"):
+            request.project_features = {}
+        key = str(project_id)
+        if key not in request.project_features:
+            request.project_features[key] = Member.objects.get_features(project_id, request.user)
+        return request.project_features[key]
 
 
 class IsProjectAdmin(RolePermission):
@@ -0,0 +1,30 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Member
+from roles.models import Feature, Role
+
+
+@receiver([post_save, post_delete], sender=Member)
+def forget_member_role(sender, instance, **kwargs):
+    Member.objects.forget_role(instance.project_id, instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Role)
+def forget_role_features(sender, instance, **kwargs):
+    Role.objects.forget_features([instance.pk])
+
+
+@receiver(m2m_changed, sender=Role.features.through)
+def forget_changed_role_features(sender, instance, reverse, pk_set, **kwargs):
+    if reverse:
+        # A feature was added to or removed from roles. A clear doesn't report which ones.
+        role_ids = pk_set or Role.objects.values_list("pk", flat=True)
+    else:
+        role_ids = [instance.pk]
+    Role.objects.forget_features(role_ids)
+
+
+@receiver([post_save, post_delete], sender=Feature)
+def forget_feature(sender, instance, **kwargs):
+    Role.objects.forget_features(Role.objects.values_list("pk", flat=True))
@@ -1,14 +1,18 @@
+from types import SimpleNamespace
+
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from model_mommy import mommy
 from rest_framework import status
 from rest_framework.reverse import reverse
 
 from api.tests.utils import CRUDMixin
 from projects.models import Member
+from projects.permissions import IsProjectMember
 from projects.tests.utils import prepare_project
-from roles.models import Role
+from roles.models import Feature, Role
 from users.tests.utils import make_user
 
 
@@ -153,3 +157,50 @@ class TestMember(TestCase):
         same_user = Member(project=member.project, user=member.user, role=member.role)
         with self.assertRaises(ValidationError):
             same_user.clean()
+
+
+@override_settings(ROLE_CACHE_TIMEOUT=60)
+class TestMemberFeatureCache(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = prepare_project()
+        self.project_id = self.project.item.id
+        self.admin = self.project.admin
+        self.member = Member.objects.get(project=self.project_id, user=self.admin)
+
+    def test_caches_features(self):
+        features = Member.objects.get_features(self.project_id, self.admin)
+        self.assertIn("is_project_admin", features)
+        with self.assertNumQueries(0):
+            self.assertEqual(Member.objects.get_features(self.project_id, self.admin), features)
+
+    def test_forgets_role_when_member_is_updated(self):
+        Member.objects.get_features(self.project_id, self.admin)
+        self.member.role = Role.objects.get(name=settings.ROLE_ANNOTATOR)
+        self.member.save()
+        self.assertNotIn("is_project_admin", Member.objects.get_features(self.project_id, self.admin))
+
+    def test_forgets_role_when_member_is_deleted(self):
+        Member.objects.get_features(self.project_id, self.admin)
+        Member.objects.filter(pk=self.member.pk).delete()
+        self.assertEqual(Member.objects.get_features(self.project_id, self.admin), frozenset())
+
+    def test_forgets_features_when_role_is_changed(self):
+        Member.objects.get_features(self.project_id, self.admin)
+        self.member.role.features.remove(Feature.objects.get(name="is_project_admin"))
+        self.assertNotIn("is_project_admin", Member.objects.get_features(self.project_id, self.admin))
+
+    @override_settings(ROLE_CACHE_TIMEOUT=0)
+    def test_looks_up_features_once_per_request(self):
+        request = SimpleNamespace(user=self.admin, method="GET", query_params={})
+        view = SimpleNamespace(kwargs={"project_id": self.project_id})
+        # The role of the member and the features of the role, for all of the permissions.
+        with self.assertNumQueries(2):
+            self.assertTrue(IsProjectMember().has_permission(request, view))
+
+    @override_settings(ROLE_CACHE_TIMEOUT=0)
+    def test_reads_role_changed_elsewhere_without_cross_request_cache(self):
+        Member.objects.get_features(self.project_id, self.admin)
+        # An update without signals, like one made by another process with its own cache.
+        Member.objects.filter(pk=self.member.pk).update(role=Role.objects.get(name=settings.ROLE_ANNOTATOR))
+        self.assertNotIn("is_project_admin", Member.objects.get_features(self.project_id, self.admin))
@@ -1,5 +1,7 @@
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 
@@ -167,3 +169,15 @@ class TestCloneProject(CRUDMixin):
         example = self.project.examples.first()
         cloned_example = project.examples.first()
         self.assertEqual(example.text, cloned_example.text)
+
+    def test_fetches_project_once(self):
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(self.url)
+        queries = [
+            q["sql"]
+            for q in context.captured_queries
+            if q["sql"].startswith("SELECT") and 'FROM "projects_project"' in q["sql"]
+        ]
+        # One for the view, and one for the copy that `Project.clone` makes of its subclass.
+        self.assertEqual(len(queries), 2)
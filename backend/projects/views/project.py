@@ -1,11 +1,11 @@
 from django.conf import settings
 from django.db import transaction
-from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, status, views
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from projects.mixins import ProjectMixin
 from projects.models import Project
 from projects.permissions import IsProjectAdmin, IsProjectStaffAndReadOnly
 from projects.serializers import ProjectPolymorphicSerializer
@@ -56,12 +56,11 @@ class ProjectDetail(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated & (IsProjectAdmin | IsProjectStaffAndReadOnly)]
 
 
-class CloneProject(views.APIView):
+class CloneProject(ProjectMixin, views.APIView):
     permission_classes = [IsAuthenticated & IsProjectAdmin]
 
     @transaction.atomic
     def post(self, request, *args, **kwargs):
-        project = get_object_or_404(Project, pk=self.kwargs["project_id"])
-        cloned_project = project.clone()
+        cloned_project = self.project.clone()
         serializer = ProjectPolymorphicSerializer(cloned_project)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,25 @@
+from typing import FrozenSet
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Manager
+
+
+class RoleManager(Manager):
+    @staticmethod
+    def features_cache_key(role_id: int) -> str:
+        return f"role-features:{role_id}"
+
+    def get_features(self, role_id: int) -> FrozenSet[str]:
+        """Returns the names of the role's features, cached for `ROLE_CACHE_TIMEOUT` seconds."""
+        key = self.features_cache_key(role_id)
+        features = cache.get(key)
+        if features is None:
+            features = frozenset(
+                self.filter(pk=role_id, features__isnull=False).values_list("features__name", flat=True)
+            )
+            cache.set(key, features, settings.ROLE_CACHE_TIMEOUT)
+        return features
+
+    def forget_features(self, role_ids):
+        cache.delete_many([self.features_cache_key(role_id) for role_id in role_ids])
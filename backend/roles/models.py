@@ -1,5 +1,7 @@
 from django.db import models
 
+from .managers import RoleManager
+
 
 class Feature(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -12,6 +14,7 @@ class Feature(models.Model):
 
 
 class Role(models.Model):
+    objects = RoleManager()
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(default="")
     features = models.ManyToManyField(Feature, blank=True)
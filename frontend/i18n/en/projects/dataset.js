@@ -16,6 +16,7 @@ export default {
   exportDataTitle: 'Export Dataset',
   exportDataMessage: 'Select a file format',
   exportDataMessage2: 'Select a file name',
+  exportIncrementally: 'Export only the changes since the last incremental export',
   deleteDocumentsTitle: 'Delete Document',
   deleteDocumentsMessage: 'Are you sure you want to delete {number} items from this project?',
   deleteBulkDocumentsTitle: 'Delete All Documents',
@@ -12,6 +12,7 @@ export default {
   message: '信息',
   fieldRequired: '此项必填',
   exportOnlyApproved: '仅导出已审核通过的文档',
+  exportIncrementally: '仅导出上次增量导出之后的更改',
   assignToMember: '分配成员',
   resetAssignment: '重置分配',
   text: '文本',
@@ -3,11 +3,17 @@ import ApiService from '@/services/api.service'
 export class APIDownloadRepository {
   constructor(private readonly request = ApiService) {}
 
-  async prepare(projectId: string, format: string, exportApproved: boolean): Promise<string> {
+  async prepare(
+    projectId: string,
+    format: string,
+    exportApproved: boolean,
+    incremental = false
+  ): Promise<string> {
     const url = `/projects/${projectId}/download`
     const data = {
       format,
-      exportApproved
+      exportApproved,
+      incremental
     }
     const response = await this.request.post(url, data)
     return response.data.task_id